@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from numpy import (
+    ndarray, float64,
+    asarray, atleast_1d, linspace, sqrt, exp, vdot,
+    square, argmax, unravel_index,
+    pi
+)
+
+class AMZICalibration(NamedTuple):
+    """
+    AMZICalibration class\n
+    A compact class for {'phase', 'splitting_ratio_ti', 'splitting_ratio_tf', 'visibility',
+    'phases', 'splitting_ratios_ti', 'splitting_ratios_tf', 'visibilities'}.
+    """
+    phase: float
+    splitting_ratio_ti: float
+    splitting_ratio_tf: float
+    visibility: float
+    phases: ndarray
+    splitting_ratios_ti: ndarray
+    splitting_ratios_tf: ndarray
+    visibilities: ndarray
+
+def delay_correlations(electric_field: ndarray, delay_samples: int):
+    """field energies A, B and delayed correlation C of one trace as seen by the AMZI arms"""
+    electric_field = asarray(electric_field)
+    delay_samples = max(1, int(delay_samples))
+    if(len(electric_field) <= delay_samples):
+        print(f"field trace of {len(electric_field)} samples is shorter than the delay of {delay_samples} samples")
+        return 0.0, 0.0, 0j
+
+    # Samples where both arms carry field
+    E_short = electric_field[delay_samples:]
+    E_long = electric_field[:-delay_samples]
+    A = vdot(E_short, E_short).real
+    B = vdot(E_long, E_long).real
+    C = vdot(E_long, E_short)
+    return A, B, C
+
+def amzi_port_energies(A: float, B: float, C: complex, phases: ndarray,
+                    splitting_ratios_ti: ndarray|float = 0.5, splitting_ratios_tf: ndarray|float = 0.5):
+    """SPD0 and SPD1 energies of the AMZI on a (phases, splitting_ratios_ti, splitting_ratios_tf) grid"""
+    phases = atleast_1d(asarray(phases, dtype=float64))[:, None, None]
+    ti = atleast_1d(asarray(splitting_ratios_ti, dtype=float64))[None, :, None]
+    tf = atleast_1d(asarray(splitting_ratios_tf, dtype=float64))[None, None, :]
+
+    # BeamSplitter amplitudes, reflection carries the i phase
+    t1, r1 = sqrt(ti), sqrt(1 - ti)
+    t2, r2 = sqrt(tf), sqrt(1 - tf)
+
+    # short minus long arm phase acting on the delayed correlation
+    interference = 2 * t1 * r1 * t2 * r2 * (exp(1j * phases) * C).real
+
+    # SPD0 on port2 and SPD1 on port1 of the output joiner
+    energy_SPD0 = square(r2 * t1) * A + square(t2 * r1) * B + interference
+    energy_SPD1 = square(t2 * t1) * A + square(r2 * r1) * B - interference
+    return energy_SPD0, energy_SPD1
+
+def calibrate_amzi(electric_field: ndarray, dt: float, time_delay: float,
+                phases: ndarray|None = None, splitting_ratios_ti: ndarray|float = 0.5, splitting_ratios_tf: ndarray|float = 0.5,
+                carrier_frequency: float|None = None):
+    """AMZI arm phase and splitting ratios maximizing SPD0 visibility of one recorded field trace"""
+    if(phases is None):
+        phases = linspace(0, 2 * pi, 361)
+    phases = atleast_1d(asarray(phases, dtype=float64))
+    splitting_ratios_ti = atleast_1d(asarray(splitting_ratios_ti, dtype=float64))
+    splitting_ratios_tf = atleast_1d(asarray(splitting_ratios_tf, dtype=float64))
+
+    # One pass over the trace, every grid point is closed form
+    A, B, C = delay_correlations(electric_field, max(1, int(time_delay / dt)))
+    if(carrier_frequency):
+        # Optical carrier rotation over the delay
+        C = C * exp(2j * pi * carrier_frequency * time_delay)
+
+    energy_SPD0, energy_SPD1 = amzi_port_energies(A, B, C, phases, splitting_ratios_ti, splitting_ratios_tf)
+    total_energy = energy_SPD0 + energy_SPD1
+    visibilities = (energy_SPD0 - energy_SPD1) / (total_energy + (total_energy == 0))
+
+    idx_phase, idx_ti, idx_tf = unravel_index(argmax(visibilities), visibilities.shape)
+    return AMZICalibration(float(phases[idx_phase]), float(splitting_ratios_ti[idx_ti]), float(splitting_ratios_tf[idx_tf]),
+                           float(visibilities[idx_phase, idx_ti, idx_tf]),
+                           phases, splitting_ratios_ti, splitting_ratios_tf, visibilities)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+from numpy import (
+    ndarray, float64,
+    asarray, empty, concatenate, iscomplexobj,
+    hanning, hamming, blackman, ones,
+    fft, square, abs, diff, mean, median,
+    pi
+)
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Segments transformed together in one batched FFT call
+SEGMENT_BLOCK = 64
+
+@lru_cache(maxsize=32)
+def _welch_plan(nperseg: int, window: str, dt: float, onesided: bool):
+    """cached window, scaling and frequency plan for Welch estimates"""
+    if(window == "hann"):
+        window_data = hanning(nperseg + 1)[:-1]
+    elif(window == "hamming"):
+        window_data = hamming(nperseg + 1)[:-1]
+    elif(window == "blackman"):
+        window_data = blackman(nperseg + 1)[:-1]
+    else:
+        window_data = ones(nperseg)
+    window_data.setflags(write=False)
+
+    # Power spectral density scaling
+    scale = 1.0 / (square(window_data).sum() / dt)
+
+    if(onesided):
+        freqs = fft.rfftfreq(nperseg, dt)
+    else:
+        freqs = fft.fftshift(fft.fftfreq(nperseg, dt))
+    freqs.setflags(write=False)
+    return window_data, scale, freqs
+
+def _iter_chunks(data: ndarray|Iterable[ndarray], chunk_size: int):
+    """yield chunks along the last axis of an array, memmap or chunk iterable"""
+    if(isinstance(data, ndarray)):
+        for start in range(0, data.shape[-1], chunk_size):
+            yield data[..., start:start + chunk_size]
+    else:
+        for chunk in data:
+            yield asarray(chunk)
+
+class SpectrumEstimator:
+    """
+    SpectrumEstimator class\n
+    Welch estimator streaming over chunked or memory-mapped traces.
+    """
+    def __init__(self, dt: float, nperseg: int = 4096, overlap: float = 0.5,
+                window: str = "hann", detrend: bool = True):
+        self.dt = dt
+        """sample interval for SpectrumEstimator"""
+
+        self.nperseg = nperseg
+        """samples per segment for SpectrumEstimator"""
+
+        self._step = max(1, int(nperseg * (1 - overlap)))
+        """segment step for SpectrumEstimator"""
+
+        self._window = window
+        """window name for SpectrumEstimator"""
+
+        self._detrend = detrend
+        """mean removal per segment for SpectrumEstimator"""
+
+    def _segments(self, data: ndarray|Iterable[ndarray]):
+        """SpectrumEstimator _segments method yielding blocks of segments"""
+        carry: ndarray|None = None
+        for chunk in _iter_chunks(data, self._step * SEGMENT_BLOCK + self.nperseg):
+            buffer = chunk if(carry is None) else concatenate((carry, chunk), axis=-1)
+            n_segments = (buffer.shape[-1] - self.nperseg) // self._step + 1
+            if(n_segments <= 0):
+                carry = buffer
+                continue
+
+            # Overlapping segments as strided views
+            yield sliding_window_view(buffer, self.nperseg, axis=-1)[..., ::self._step, :][..., :n_segments, :]
+            carry = buffer[..., n_segments * self._step:]
+
+    def psd(self, data: ndarray|Iterable[ndarray], onesided: bool|None = None):
+        """SpectrumEstimator psd method returning (freqs, psd, segment mean)"""
+        psd_sum = None
+        data_sum = 0.0
+        n_segments = 0
+        for segments in self._segments(data):
+            if(onesided is None):
+                onesided = not iscomplexobj(segments)
+            window_data, scale, freqs = _welch_plan(self.nperseg, self._window, self.dt, onesided)
+
+            segment_mean = mean(segments, axis=-1, keepdims=True)
+            data_sum = data_sum + segment_mean.sum(axis=-2)[..., 0]
+            if(self._detrend):
+                segments = segments - segment_mean
+
+            # Batched transform of the whole block
+            if(onesided):
+                spectrum = fft.rfft(segments * window_data, axis=-1)
+            else:
+                spectrum = fft.fftshift(fft.fft(segments * window_data, axis=-1), axes=-1)
+            block_psd = square(abs(spectrum)).sum(axis=-2)
+            psd_sum = block_psd if(psd_sum is None) else psd_sum + block_psd
+            n_segments += segments.shape[-2]
+
+        if(psd_sum is None):
+            print(f"SpectrumEstimator needs at least {self.nperseg} samples")
+            return empty(0), empty(0), 0.0
+
+        psd_data = psd_sum * (scale / n_segments)
+        if(onesided):
+            # Fold negative frequencies except DC and Nyquist
+            psd_data[..., 1:(self.nperseg + 1) // 2] *= 2
+        return freqs, psd_data, data_sum / n_segments
+
+def optical_spectrum(electric_field: ndarray|Iterable[ndarray], dt: float, nperseg: int = 4096,
+                    overlap: float = 0.5, window: str = "hann"):
+    """calculate two-sided optical spectrum around the carrier of complex field traces"""
+    estimator = SpectrumEstimator(dt, nperseg, overlap, window, detrend=False)
+    freqs, psd_data, _ = estimator.psd(electric_field, onesided=False)
+    return freqs, psd_data
+
+def relative_intensity_noise(power: ndarray|Iterable[ndarray], dt: float, nperseg: int = 4096,
+                            overlap: float = 0.5, window: str = "hann"):
+    """calculate one-sided RIN (1/Hz) of power or photon traces"""
+    estimator = SpectrumEstimator(dt, nperseg, overlap, window)
+    freqs, psd_data, power_mean = estimator.psd(power, onesided=True)
+    return freqs, psd_data / square(asarray(power_mean, dtype=float64))[..., None]
+
+def _instantaneous_frequency(phase: ndarray|Iterable[ndarray], dt: float, chunk_size: int):
+    """yield instantaneous frequency chunks of phase traces"""
+    last_phase: ndarray|None = None
+    for chunk in _iter_chunks(phase, chunk_size):
+        if(last_phase is not None):
+            chunk = concatenate((last_phase, chunk), axis=-1)
+        if(chunk.shape[-1] > 1):
+            yield diff(chunk, axis=-1) / (2 * pi * dt)
+        last_phase = chunk[..., -1:]
+
+def frequency_noise(phase: ndarray|Iterable[ndarray], dt: float, nperseg: int = 4096,
+                    overlap: float = 0.5, window: str = "hann"):
+    """calculate one-sided FM noise PSD (Hz^2/Hz) of phase traces"""
+    estimator = SpectrumEstimator(dt, nperseg, overlap, window)
+    chunk_size = estimator._step * SEGMENT_BLOCK + nperseg
+    freqs, psd_data, _ = estimator.psd(_instantaneous_frequency(phase, dt, chunk_size), onesided=True)
+    return freqs, psd_data
+
+def linewidth(phase: ndarray|Iterable[ndarray], dt: float, frequency_band: tuple[float, float]|None = None,
+            nperseg: int = 4096, overlap: float = 0.5, window: str = "hann"):
+    """estimate Lorentzian linewidth (Hz) from white FM noise level of phase traces"""
+    freqs, psd_data = frequency_noise(phase, dt, nperseg, overlap, window)
+    if(len(freqs) == 0):
+        return float64(0.0)
+
+    # White FM noise plateau, default excludes DC and upper half band
+    if(frequency_band is None):
+        frequency_band = (freqs[1], 0.25 / dt)
+    band = (freqs >= frequency_band[0]) & (freqs <= frequency_band[1])
+
+    # Delta_nu = pi * S_nu for one-sided white frequency noise
+    return pi * median(psd_data[..., band], axis=-1)
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from math import sqrt as sqrt_scalar
+from typing import Any, NamedTuple
+
+from numpy import (
+    ndarray, complex128,
+    array, asarray, concatenate, interp, iscomplexobj, polyval, linalg,
+    abs, sqrt, square, nanmean, cos, sin,
+    pi
+)
+
+from ..Components.Signal import ArbitaryWave
+from ..Components.Signal import StaticWave
+
+from ..Constants import LaserPyConstants
+from ..Constants import UniversalConstants
+
+# Stability polynomial coefficients R(z), highest power first, of explicit integrators
+STABILITY_POLYNOMIALS = {
+    'euler': (1.0, 1.0),
+    'heun': (0.5, 1.0, 1.0),
+    'rk4': (1 / 24, 1 / 6, 0.5, 1.0, 1.0),
+}
+
+class TimeStepEstimate(NamedTuple):
+    """
+    TimeStepEstimate class\n
+    A compact class for {'dt', 'dt_stable', 'dt_accurate', 'limited_by', 'eigenvalues',
+    'relaxation_frequency', 'bandwidth'}.
+    """
+    dt: float
+    dt_stable: float
+    dt_accurate: float
+    limited_by: str
+    eigenvalues: ndarray
+    relaxation_frequency: float
+    bandwidth: float
+
+class ConvergenceReport(NamedTuple):
+    """
+    ConvergenceReport class\n
+    A compact class for {'converged', 'dt', 'worst_key', 'worst_error', 'errors'}.
+    """
+    converged: bool
+    dt: float
+    worst_key: str
+    worst_error: float
+    errors: dict[str, float]
+
+def _laser_constants():
+    """Laser rate equation constants"""
+    get = LaserPyConstants.get
+    return (get('Tau_N'), get('Tau_P'), get('g'), get('Epsilon'), get('N_transparent'),
+            get('Beta'), get('Alpha'), get('Gamma_cap'), get('Laser_Vol'), get('Kappa'))
+
+def laser_steady_state(current: float):
+    """free running Laser (carrier, photon) steady state at a DC current"""
+    tau_n, tau_p, g, epsilon, n_transparent, beta, _, gamma_cap, laser_vol, _ = _laser_constants()
+    pump = current / (UniversalConstants.CHARGE.value * laser_vol)
+
+    def carrier_of(photon: float):
+        # dS/dt = 0 solved for the carrier
+        gain = g * photon / (1 + epsilon * photon)
+        return (photon / tau_p + gamma_cap * gain * n_transparent) / (gamma_cap * gain + gamma_cap * beta / tau_n)
+
+    def dN_dt(photon: float):
+        carrier = carrier_of(photon)
+        return pump - carrier / tau_n - g * (carrier - n_transparent) * photon / (1 + epsilon * photon)
+
+    # dN/dt decreases with photon, bisection in log space
+    low, high = 1.0, 1.0e30
+    for _ in range(200):
+        mid = sqrt_scalar(low * high)
+        if(dN_dt(mid) > 0):
+            low = mid
+        else:
+            high = mid
+    photon = sqrt_scalar(low * high)
+    return carrier_of(photon), photon
+
+def laser_jacobian(carrier: float, photon: float, master_photon: float = 0.0, delta_phase: float = 0.0):
+    """Jacobian of the (carrier, photon, phase) Laser rate equations, with injection of master_photon"""
+    tau_n, tau_p, g, epsilon, n_transparent, beta, alpha, gamma_cap, _, kappa = _laser_constants()
+    compression = 1 + epsilon * photon
+
+    jacobian = array([
+        [-1 / tau_n - g * photon / compression, -g * (carrier - n_transparent) / compression**2, 0.0],
+        [gamma_cap * g * photon / compression + gamma_cap * beta / tau_n, gamma_cap * g * (carrier - n_transparent) / compression**2 - 1 / tau_p, 0.0],
+        [alpha / 2 * gamma_cap * g, 0.0, 0.0]
+    ])
+
+    if(master_photon > 0):
+        # Injection terms 2 Kappa sqrt(S Sm) cos(dphi) and -Kappa sqrt(Sm / S) sin(dphi)
+        injection = kappa * sqrt_scalar(master_photon / photon)
+        jacobian[1, 1] += injection * cos(delta_phase)
+        jacobian[1, 2] += -2 * injection * photon * sin(delta_phase)
+        jacobian[2, 1] += injection * sin(delta_phase) / (2 * photon)
+        jacobian[2, 2] += -injection * cos(delta_phase)
+    return jacobian
+
+def stability_limit(eigenvalues: ndarray, integrator: str = "euler"):
+    """largest dt with |R(lambda dt)| <= 1 for every eigenvalue with negative real part"""
+    coefficients = STABILITY_POLYNOMIALS[integrator]
+    eigenvalues = asarray(eigenvalues, dtype=complex128)
+    eigenvalues = eigenvalues[eigenvalues.real < 0]
+    if(len(eigenvalues) == 0):
+        return float('inf')
+
+    def stable(dt: float):
+        return bool((abs(polyval(coefficients, eigenvalues * dt)) <= 1 + 1e-12).all())
+
+    # Bisection from a step inside the stability region
+    low = high = 1e-3 / max(abs(eigenvalues))
+    while(stable(high)):
+        low, high = high, 2 * high
+    for _ in range(60):
+        mid = 0.5 * (low + high)
+        if(stable(mid)):
+            low = mid
+        else:
+            high = mid
+    return low
+
+def waveform_bandwidth(arbitarywaves: ArbitaryWave|tuple[ArbitaryWave,...]):
+    """bandwidth in Hz of drive waves, one over the shortest pulse or gap"""
+    if(isinstance(arbitarywaves, ArbitaryWave)):
+        arbitarywaves = (arbitarywaves,)
+
+    bandwidth = 0.0
+    for arbitarywave in arbitarywaves:
+        if(isinstance(arbitarywave, StaticWave) or arbitarywave._t_unit <= 0):
+            continue
+        pulse = 2 * arbitarywave._signal_spread * arbitarywave._t_unit
+        gap = arbitarywave._t_unit - pulse
+        shortest = min(pulse, gap) if(gap > 0) else pulse
+        bandwidth = max(bandwidth, 1 / shortest if(shortest > 0) else 1 / arbitarywave._t_unit)
+    return bandwidth
+
+def estimate_time_step(current: float, drive_bandwidth: float = 0.0, master_photon: float = 0.0, detuning: float = 0.0,
+                    integrator: str = "euler", points_per_period: float = 100.0, safety: float = 0.5):
+    """largest stable and accurate Clock dt of a Laser at a DC current, drive_bandwidth and detuning in Hz"""
+    carrier, photon = laser_steady_state(current)
+
+    # Locked and quadrature injection phases bound the injection eigenvalues
+    eigenvalues = linalg.eigvals(laser_jacobian(carrier, photon))
+    if(master_photon > 0):
+        eigenvalues = concatenate([eigenvalues] + [linalg.eigvals(laser_jacobian(carrier, photon, master_photon, delta_phase))
+                                                  for delta_phase in (0.0, 0.5 * pi, pi)])
+
+    # Turn on overshoot below threshold is caught by the Laser clamps
+    dt_stable = stability_limit(eigenvalues, integrator)
+
+    # Fastest frequency to resolve
+    relaxation_frequency = float(max(abs(eigenvalues.imag)) / (2 * pi))
+    frequencies = {'stability': 0.0, 'relaxation oscillation': relaxation_frequency,
+                   'drive bandwidth': drive_bandwidth, 'detuning': abs(detuning)}
+    if(master_photon > 0):
+        frequencies['injection'] = LaserPyConstants.get('Kappa') * sqrt_scalar(master_photon / photon) / (2 * pi)
+    limited_by, frequency = max(frequencies.items(), key=lambda item: item[1])
+    dt_accurate = 1 / (points_per_period * frequency) if(frequency > 0) else float('inf')
+
+    if(safety * dt_stable < dt_accurate):
+        limited_by = 'stability'
+    dt = min(safety * dt_stable, dt_accurate)
+    return TimeStepEstimate(dt, dt_stable, dt_accurate, limited_by, eigenvalues, relaxation_frequency,
+                            max(drive_bandwidth, abs(detuning)))
+
+def _simulate_window(factory: Callable[..., Any], dt: float, t_window: float, factory_kwargs: dict[str, Any]):
+    """SimulationResult of factory(dt, **factory_kwargs) over t_window in its own SimulationContext"""
+    from ..Components import SimulationContext
+
+    with SimulationContext(f"convergence_dt_{dt}"):
+        simulator = factory(dt, **factory_kwargs)
+        simulator.simulation_clock.set(t_window)
+        simulator.simulate()
+        if(simulator.simulation_error):
+            return None
+        return simulator.get_result()
+
+def check_convergence(factory: Callable[..., Any], dt: float, t_window: float, keys: tuple[str,...]|None = None,
+                    rtol: float = 5e-2, factory_kwargs: dict[str, Any]|None = None):
+    """relative RMS difference of a run of factory(dt) and factory(dt / 2) on t_window, factory returns a saving Simulator"""
+    factory_kwargs = factory_kwargs if(factory_kwargs) else {}
+    result = _simulate_window(factory, dt, t_window, factory_kwargs)
+    half_step_result = _simulate_window(factory, dt / 2, t_window, factory_kwargs)
+    if(result is None or half_step_result is None):
+        return ConvergenceReport(False, dt, "simulation_error", float('inf'), {})
+
+    errors: dict[str, float] = {}
+    for key in (keys if(keys) else result.keys()):
+        if(key == 'time' or key not in half_step_result):
+            continue
+        column, half_step_column = result[key], half_step_result[key]
+
+        # Half step run on the time index of the run
+        if(iscomplexobj(column)):
+            reference = interp(result.time, half_step_result.time, half_step_column.real) + \
+                        1j * interp(result.time, half_step_result.time, half_step_column.imag)
+        else:
+            reference = interp(result.time, half_step_result.time, half_step_column)
+        # Relative RMS error, late started columns are nan padded
+        scale = sqrt(nanmean(square(abs(reference))))
+        errors[key] = float(sqrt(nanmean(square(abs(column - reference)))) / scale) if(scale > 0) else 0.0
+
+    if(not errors):
+        return ConvergenceReport(False, dt, "", float('inf'), errors)
+    worst_key = max(errors, key=lambda key: errors[key])
+    return ConvergenceReport(errors[worst_key] <= rtol, dt, worst_key, errors[worst_key], errors)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from numpy import (
+    ndarray, int64, uint8, float64,
+    asarray, arange, concatenate, argsort, searchsorted, repeat, cumsum, bincount,
+    exp, rint, frombuffer, zeros
+)
+
+# Binary layout: magic, resolution float64, n_events uint64, timestamps int64, channels uint8
+TIME_TAG_MAGIC = b"LPQTTAG1"
+
+# Default time tag resolution of 1 ps
+TIME_TAG_RESOLUTION = 1e-12
+
+class TimeTagStream:
+    """
+    TimeTagStream class\n
+    Sorted int64 timestamps in units of resolution with a uint8 channel per click.
+    """
+    def __init__(self, timestamps: ndarray, channels: ndarray|int = 0, resolution: float = TIME_TAG_RESOLUTION, sort: bool = True):
+        timestamps = asarray(timestamps, dtype=int64)
+        channels = asarray(channels, dtype=uint8)
+        if(channels.ndim == 0):
+            channels = zeros(len(timestamps), dtype=uint8) + channels
+
+        if(sort):
+            order = argsort(timestamps, kind='stable')
+            timestamps, channels = timestamps[order], channels[order]
+
+        self.timestamps = timestamps
+        """sorted timestamps of TimeTagStream"""
+
+        self.channels = channels
+        """channel of every timestamp of TimeTagStream"""
+
+        self.resolution = resolution
+        """seconds per timestamp unit of TimeTagStream"""
+
+    def __repr__(self) -> str:
+        return f"TimeTagStream: {len(self.timestamps)} clicks at {self.resolution} s resolution"
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def merge(cls, *streams: TimeTagStream):
+        """TimeTagStream merge method of streams with the same resolution"""
+        return cls(concatenate([stream.timestamps for stream in streams]),
+                   concatenate([stream.channels for stream in streams]), streams[0].resolution)
+
+    def select(self, channel: int):
+        """TimeTagStream select method returning the timestamps of one channel"""
+        return self.timestamps[self.channels == channel]
+
+    def to_seconds(self):
+        """TimeTagStream to_seconds method"""
+        return self.timestamps * self.resolution
+
+    def save(self, filepath: str):
+        """TimeTagStream save method in the compact binary layout"""
+        with open(filepath, "wb") as f:
+            f.write(TIME_TAG_MAGIC)
+            f.write(float64(self.resolution).tobytes())
+            f.write(len(self.timestamps).to_bytes(8, "little"))
+            f.write(self.timestamps.astype("<i8").tobytes())
+            f.write(self.channels.tobytes())
+
+    @classmethod
+    def load(cls, filepath: str):
+        """TimeTagStream load method of the compact binary layout"""
+        with open(filepath, "rb") as f:
+            data = f.read()
+        if(data[:8] != TIME_TAG_MAGIC):
+            raise ValueError(f"{filepath} is not a LaserPy_Quantum time tag stream")
+
+        resolution = float(frombuffer(data, dtype="<f8", count=1, offset=8)[0])
+        n_events = int.from_bytes(data[16:24], "little")
+        timestamps = frombuffer(data, dtype="<i8", count=n_events, offset=24).astype(int64)
+        channels = frombuffer(data, dtype=uint8, count=n_events, offset=24 + 8 * n_events).copy()
+        return cls(timestamps, channels, resolution, sort=False)
+
+def click_probability(intensity: ndarray|float, photons_per_intensity: float, eta: float, dark_count_probability: float = 0.0):
+    """click probability of a threshold detector for Poisson light of mean photon number intensity * photons_per_intensity"""
+    return 1 - (1 - dark_count_probability) * exp(-eta * photons_per_intensity * asarray(intensity))
+
+def _apply_dead_time(timestamps: ndarray, dead_time: int):
+    """drop clicks within dead_time of the previous registered click, loops over clicks only"""
+    if(dead_time <= 0 or len(timestamps) < 2):
+        return timestamps
+    keep = []
+    last = int(timestamps[0]) - dead_time
+    for timestamp in timestamps.tolist():
+        if(timestamp - last >= dead_time):
+            keep.append(timestamp)
+            last = timestamp
+    return asarray(keep, dtype=int64)
+
+def clicks_from_intensity(time_data: ndarray, intensity: ndarray, photons_per_intensity: float = 1.0, eta: float = 1.0,
+                        dark_count_probability: float = 0.0, dead_time: float = 0.0, channel: int = 0,
+                        resolution: float = TIME_TAG_RESOLUTION, seed: int|None = None):
+    """TimeTagStream of detector clicks drawn from a recorded intensity trace"""
+    from numpy.random import default_rng
+
+    probability = click_probability(intensity, photons_per_intensity, eta, dark_count_probability)
+    clicked = default_rng(seed).random(len(probability)) < probability
+    timestamps = rint(asarray(time_data)[-len(probability):][clicked] / resolution).astype(int64)
+    timestamps = _apply_dead_time(timestamps, int(rint(dead_time / resolution)))
+    return TimeTagStream(timestamps, channel, resolution, sort=False)
+
+def _pair_ranges(timestamps_a: ndarray, timestamps_b: ndarray, low: int, high: int):
+    """searchsorted index ranges of timestamps_b within [a + low, a + high] for every a"""
+    start = searchsorted(timestamps_b, timestamps_a + low, side='left')
+    stop = searchsorted(timestamps_b, timestamps_a + high, side='right')
+    return start, stop
+
+def coincidences(timestamps_a: ndarray, timestamps_b: ndarray, window: int, delay: int = 0):
+    """number of (a, b) click pairs with |b - a - delay| <= window, timestamps sorted"""
+    start, stop = _pair_ranges(asarray(timestamps_a), asarray(timestamps_b), delay - window, delay + window)
+    return int((stop - start).sum())
+
+def correlation_histogram(timestamps_a: ndarray, timestamps_b: ndarray, bin_width: int, max_delay: int):
+    """histogram of b - a delays in bins centred within +-max_delay, returns (bin centre delays, counts)"""
+    timestamps_a, timestamps_b = asarray(timestamps_a), asarray(timestamps_b)
+    n_bins = 2 * (max_delay // bin_width) + 1
+
+    # Pairs up to the outer edges of the first and last bins, so edge bins are complete
+    low = -(n_bins // 2) * bin_width - bin_width // 2
+    start, stop = _pair_ranges(timestamps_a, timestamps_b, low, low + n_bins * bin_width - 1)
+
+    # All pairs without a Python loop
+    n_pairs = stop - start
+    idx_a = repeat(arange(len(timestamps_a)), n_pairs)
+    pair_offsets = arange(n_pairs.sum()) - repeat(cumsum(n_pairs) - n_pairs, n_pairs)
+    delays = timestamps_b[repeat(start, n_pairs) + pair_offsets] - timestamps_a[idx_a]
+
+    counts = bincount((delays - low) // bin_width, minlength=n_bins)
+    return (arange(n_bins) - n_bins // 2) * bin_width, counts
+
+def g2(timestamps_a: ndarray, timestamps_b: ndarray, bin_width: int, max_delay: int, duration: int):
+    """second order correlation g2(delay) normalized by uncorrelated coincidences over duration"""
+    delays, counts = correlation_histogram(timestamps_a, timestamps_b, bin_width, max_delay)
+    accidentals = len(timestamps_a) * len(timestamps_b) * bin_width / duration
+    if(accidentals == 0):
+        return delays, zeros(len(counts))
+    return delays, counts / accidentals
+
+def bin_slots(timestamps: ndarray, slot_width: int, n_slots: int|None = None, offset: int = 0):
+    """clicks per time slot of slot_width from offset"""
+    slots = (asarray(timestamps) - offset) // slot_width
+    slots = slots[slots >= 0]
+    if(n_slots is not None):
+        slots = slots[slots < n_slots]
+    return bincount(slots, minlength=n_slots if(n_slots) else 0)
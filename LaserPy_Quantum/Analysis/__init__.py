@@ -0,0 +1,67 @@
+""" Analysis for LaserPy_Quantum """
+
+from .Spectrum import SpectrumEstimator
+from .Spectrum import (
+    optical_spectrum,
+    relative_intensity_noise,
+    frequency_noise,
+    linewidth
+)
+
+from .Calibration import AMZICalibration
+from .Calibration import (
+    delay_correlations,
+    amzi_port_energies,
+    calibrate_amzi
+)
+
+from .Stability import TimeStepEstimate
+from .Stability import ConvergenceReport
+from .Stability import (
+    laser_steady_state,
+    laser_jacobian,
+    stability_limit,
+    waveform_bandwidth,
+    estimate_time_step,
+    check_convergence
+)
+
+from .TimeTags import TimeTagStream
+from .TimeTags import (
+    click_probability,
+    clicks_from_intensity,
+    coincidences,
+    correlation_histogram,
+    g2,
+    bin_slots
+)
+
+__all__ = [
+    "SpectrumEstimator",
+    "optical_spectrum",
+    "relative_intensity_noise",
+    "frequency_noise",
+    "linewidth",
+
+    "AMZICalibration",
+    "delay_correlations",
+    "amzi_port_energies",
+    "calibrate_amzi",
+
+    "TimeStepEstimate",
+    "ConvergenceReport",
+    "laser_steady_state",
+    "laser_jacobian",
+    "stability_limit",
+    "waveform_bandwidth",
+    "estimate_time_step",
+    "check_convergence",
+
+    "TimeTagStream",
+    "click_probability",
+    "clicks_from_intensity",
+    "coincidences",
+    "correlation_histogram",
+    "g2",
+    "bin_slots"
+]
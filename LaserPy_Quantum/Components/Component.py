@@ -1,28 +1,73 @@
 from __future__ import annotations
 
-import matplotlib.pyplot as plt
+from itertools import count
+from numbers import Real
+from operator import attrgetter
+from weakref import WeakValueDictionary
+
 import numpy as np
 
-from ..Constants import FIG_WIDTH, FIG_HEIGHT
+from .Context import get_active_context
+
+from ..Precision import new_trace
 
 # TODO refine reset and reset_data behaviour
 
+class _TupleGetter:
+    """picklable attrgetter of at most one key returning a tuple"""
+    __slots__ = ('_keys', '_getter')
+
+    def __init__(self, keys: tuple[str,...]):
+        self._keys = keys
+        self._getter = attrgetter(keys[0]) if(keys) else None
+
+    def __call__(self, component):
+        return () if(self._getter is None) else (self._getter(component),)
+
+    def __reduce__(self):
+        return (_TupleGetter, (self._keys,))
+
+def _make_getter(keys: tuple[str,...]):
+    """attrgetter always returning a tuple of attribute values, picklable for worker processes"""
+    if(len(keys) < 2):
+        return _TupleGetter(keys)
+    return attrgetter(*keys)
+
+def _instance_attributes(value) -> dict:
+    """instance attributes of value from its __slots__ and __dict__"""
+    attributes = {}
+    for cls in reversed(type(value).__mro__):
+        for key in cls.__dict__.get('__slots__', ()):
+            if(key not in ('__dict__', '__weakref__') and hasattr(value, key)):
+                attributes[key] = getattr(value, key)
+    attributes.update(getattr(value, '__dict__', {}))
+    return attributes
+
 class CLASSID:
     """
     CLASSID class
     """
+    # Hot Components are slotted down to CLASSID, subclasses without __slots__ get a __dict__
+    __slots__ = ('class_id', '__weakref__')
+
     ######  Special Component Registry  #######
-    _Component_registry = {}
+    _Component_registry: dict[str, WeakValueDictionary[int, Component]] = {}
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
-        cls._instances: list[Component] = []
+        cls._instances: WeakValueDictionary[int, Component] = WeakValueDictionary()
+        cls._instance_ids = count()
         cls._Component_registry[cls.__name__] = cls._instances
 
     def __init__(self):
         ## Added class_id
-        self.class_id = len(self._instances)
-        self.__class__._instances.append(self) # type: ignore
+        context = get_active_context()
+        if(context):
+            # Scoped Component owned by SimulationContext
+            self.class_id = context._register(self) # type: ignore
+            return
+        self.class_id = next(self._instance_ids)
+        self._instances[self.class_id] = self # type: ignore
 
     # @classmethod
     # def get_all_Component_registry(cls):
@@ -34,6 +79,22 @@ class Component(CLASSID):
     """
     Component class
     """
+    # _data of TimeComponent and PhysicalComponent, both bases of PhysicalComponent cannot add slots
+    __slots__ = ('name', '_save_simulation', '_data')
+
+    _state_keys: tuple[str,...] = ()
+    """Component hot state attribute keys to override"""
+
+    _health_counters: dict[str, float] = {}
+    """Component event counter keys to override, HealthMonitor fails above the given events per step"""
+
+    _drift_keys: tuple[str,...] = ()
+    """Component state keys to override, advancing by a constant every period of a periodic orbit"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._state_getter = staticmethod(_make_getter(cls._state_keys))
+
     def __init__(self, name:str="default_component"):
         super().__init__()
         self.name = name
@@ -46,6 +107,28 @@ class Component(CLASSID):
         """Component __repr__ method to override"""
         return f"Component: {self.name} id:{self.class_id}"
 
+    def _column_name(self, key:str) -> str:
+        """Component _column_name method for state and data columns"""
+        return f"{self.name}_{self.class_id}.{key}"
+
+    def get_state(self) -> tuple:
+        """Component get_state method"""
+        return self._state_getter(self)
+
+    def set_state(self, state:tuple):
+        """Component set_state method"""
+        for key, value in zip(self._state_keys, state):
+            # Buffers are copied, not views of the state record
+            setattr(self, key, value.copy() if(isinstance(value, np.ndarray)) else value)
+
+    def _get_data_components(self) -> tuple[DataComponent,...]:
+        """Component _get_data_components method for Components holding simulation data"""
+        return ()
+
+    def _get_state_components(self) -> tuple[Component,...]:
+        """Component _get_state_components method for itself and sub-Components holding state"""
+        return (self,)
+
     def store_data(self):
         """Component store_data method to override"""
         # Empty method
@@ -70,6 +153,11 @@ class Component(CLASSID):
         # Empty method
         pass
 
+    def replay(self, electric_field):
+        """Component replay method to override, array simulate without changing state"""
+        print(f"{self.name} cannot replay recorded fields")
+        return None
+
     def input_port(self):
         """Component input port method to override"""  
         kwargs = {}
@@ -83,6 +171,10 @@ class Clock(Component):
     """
     Clock class
     """
+    __slots__ = ('dt', '_sampling_rate', 't', '_t_sample', 'running', '_t_final')
+
+    _state_keys = ('t', '_t_sample')
+
     def __init__(self, dt:float, sampling_rate:int = -1, name:str="default_clock"):
         super().__init__(name)
         self.dt = dt
@@ -136,6 +228,8 @@ class TimeComponent(Component):
     """
     TimeComponent class
     """
+    __slots__ = ()
+
     def __init__(self, name:str="default_time_component"):
         super().__init__(name)
 
@@ -157,6 +251,14 @@ class DataComponent(Component):
     """
     DataComponent class
     """
+    __slots__ = ('_simulation_data', '_simulation_data_units', '_data_getter', '_trace_list_keys')
+
+    _double_precision_keys: tuple[str,...] = ()
+    """simulation data keys stored in float64 under every PrecisionPolicy"""
+
+    _list_keys: tuple[str,...] = ()
+    """simulation data keys of complex or other non-real values stored in lists"""
+
     def __init__(self, save_simulation:bool=False, name:str="default_data_component"):
         super().__init__(name)
         
@@ -169,6 +271,12 @@ class DataComponent(Component):
         self._simulation_data_units = {}
         """DataComponent simulation data units"""
 
+        self._data_getter = None
+        """DataComponent cached getter of simulation data keys"""
+
+        self._trace_list_keys = self._list_keys
+        """DataComponent _list_keys with undeclared non-real keys found while storing"""
+
     def _handle_display_data(self, time_data:np.ndarray):
         """DataComponent _handle_display_data method"""
         if(self._handle_get_data()):
@@ -193,17 +301,61 @@ class DataComponent(Component):
             return True
         return False
 
+    def _new_trace(self, key: str, values=()):
+        """DataComponent _new_trace method, typed trace of the active PrecisionPolicy or list for _list_keys"""
+        if(key in self._trace_list_keys):
+            return list(values)
+        return new_trace(values, key in self._double_precision_keys)
+
     def store_data(self):
         """DataComponent store_data method"""
-        for key in self._simulation_data:
-            self._simulation_data[key].append(getattr(self, key))
+        values = None
+        if(self._data_getter is None):
+            self._data_getter = _make_getter(tuple(self._simulation_data))
+            values = self._data_getter(self)
+            self._check_list_keys(values)
+
+            # Typed traces of the active PrecisionPolicy
+            self._simulation_data = {key: self._new_trace(key, data_list) for key, data_list in self._simulation_data.items()}
+
+        values = values if(values is not None) else self._data_getter(self)
+        try:
+            for data_list, value in zip(self._simulation_data.values(), values):
+                data_list.append(value)
+        except TypeError:
+            # A value turned non-real after the first sample
+            self._store_list_fallback(values)
+
+    def _check_list_keys(self, values: tuple):
+        """DataComponent _check_list_keys method adding undeclared keys of non-real values to _list_keys"""
+        list_keys = tuple(key for key, value in zip(self._simulation_data, values) 
+                          if(key not in self._trace_list_keys and not isinstance(value, (Real, np.bool_))))
+        if(list_keys):
+            print(f"WARNING:: {self.name} id:{self.class_id} stores non-real {list_keys} in lists, declare them in _list_keys")
+            self._trace_list_keys = self._trace_list_keys + list_keys
+        return list_keys
+
+    def _store_list_fallback(self, values: tuple):
+        """DataComponent _store_list_fallback method moving traces of non-real values to lists"""
+        n_stored = min(len(data_list) for data_list in self._simulation_data.values())
+        for key in self._check_list_keys(values):
+            self._simulation_data[key] = list(self._simulation_data[key])
+
+        for data_list, value in zip(self._simulation_data.values(), values):
+            # Traces before the failing key hold the value already
+            if(len(data_list) == n_stored):
+                data_list.append(value)
+
+    def _release_data(self):
+        """DataComponent _release_data method starting fresh traces, exported buffers of old traces stay valid"""
+        self._simulation_data = {key: self._new_trace(key) for key in self._simulation_data}
 
     def reset_data(self):
         """DataComponent reset_data method"""
-        for key in self._simulation_data:
-            self._simulation_data[key].clear()
+        self._data_getter = None
+        self._release_data()
 
-    def display_data(self, time_data:np.ndarray, simulation_keys:tuple[str,...]|None=None):
+    def display_data(self, time_data:np.ndarray, simulation_keys:tuple[str,...]|None=None, filepath:str|None=None):
         """DataComponent display_data method"""        
         
         # Handle cases
@@ -211,8 +363,6 @@ class DataComponent(Component):
             print(f"{self.name}id:{self.class_id} cannot display data")
             return
 
-        plt.figure(figsize=(FIG_WIDTH, FIG_HEIGHT))
-
         key_tuple = tuple(self._simulation_data_units)
         
         # Display fixed tuple of data
@@ -223,22 +373,11 @@ class DataComponent(Component):
                     key_list.append(key)
             key_tuple = tuple(key_list)
 
-        max_hf_plots = 1 + (len(key_tuple) >> 1)
-        sub_plot_idx = 1
-        for key in key_tuple:
-            plt.subplot(max_hf_plots, 2, sub_plot_idx)
-            plt.plot(time_data, np.array(self._simulation_data[key]), label=f"{key}")
-
-            plt.xlabel(r"Time $(s)$")
-            plt.ylabel(key.capitalize() + self._simulation_data_units[key])
-            
-            plt.grid()
-            plt.legend()
-            sub_plot_idx += 1
-
-        plt.suptitle(f"{self.name} {self.__class__.__name__}_id:{self.class_id}")
-        plt.tight_layout()
-        plt.show()
+        from ..Plotting import plot_series
+        plot_series(f"{self.name} {self.__class__.__name__}_id:{self.class_id}", time_data,
+                    {key: {key: np.array(self._simulation_data[key])} for key in key_tuple},
+                    {key: key.capitalize() + self._simulation_data_units[key] for key in key_tuple},
+                    filepath=filepath)
 
     def get_data(self):
         """DataComponent get_data method"""
@@ -251,6 +390,11 @@ class DataComponent(Component):
             data_dict[key] = np.zeros(1) if(val) else np.array(self._simulation_data[key])
         return data_dict
 
+    def _get_data_components(self):
+        """DataComponent _get_data_components method"""
+        #return super()._get_data_components()
+        return (self,)
+
     def get_data_units(self):
         """DataComponent get_data_units method"""        
         return dict(self._simulation_data_units)
@@ -259,6 +403,7 @@ class DataComponent(Component):
         """DataComponent reset method to override"""
         #return super().reset()
         self._save_simulation = save_simulation
+        self._data_getter = None
 
     def output_port(self, kwargs:dict={}):
         """DataComponent output port method to override"""
@@ -272,6 +417,10 @@ class PhysicalComponent(DataComponent, TimeComponent):
     """
     PhysicalComponent class
     """
+    __slots__ = ()
+
+    _state_keys = ('_data',)
+
     def __init__(self, save_simulation:bool=False, name:str="default_physical_component"):
         super().__init__(save_simulation, name)  
 
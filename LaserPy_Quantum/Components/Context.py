@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .Component import Component
+    from .Signal import ArbitaryWaveGenerator
+
+_active_context: ContextVar[SimulationContext|None] = ContextVar("LaserPy_Quantum_simulation_context", default=None)
+
+def get_active_context():
+    """return the active SimulationContext or None"""
+    return _active_context.get()
+
+class SimulationContext:
+    """
+    SimulationContext class\n
+    Scoped owner of Components, ArbitaryWaveGenerator and Component registry.
+    """
+    def __init__(self, name: str = "default_simulation_context"):
+        self.name = name
+        """SimulationContext name data"""
+
+        self._components: list[Component] = []
+        """Components owned by SimulationContext"""
+
+        self._registry: dict[str, list[Component]] = {}
+        """Component registry of SimulationContext"""
+
+        self._AWG: ArbitaryWaveGenerator|None = None
+        """ArbitaryWaveGenerator of SimulationContext"""
+
+        self._tokens = []
+
+    def __repr__(self) -> str:
+        """SimulationContext __repr__ method"""
+        return f"SimulationContext: {self.name} components:{len(self._components)}"
+
+    def __enter__(self):
+        self._tokens.append(_active_context.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _active_context.reset(self._tokens.pop())
+        self.close()
+        return False
+
+    def _register(self, component: Component) -> int:
+        """SimulationContext _register method returning context class_id"""
+        class_instances = self._registry.setdefault(component.__class__.__name__, [])
+        class_instances.append(component)
+        self._components.append(component)
+        return len(class_instances) - 1
+
+    def get_registry(self):
+        """SimulationContext get_registry method"""
+        return {class_name: tuple(class_instances) for class_name, class_instances in self._registry.items()}
+
+    def get_AWG(self):
+        """SimulationContext get_AWG method for the scoped ArbitaryWaveGenerator"""
+        if(self._AWG is None):
+            from .Signal import ArbitaryWaveGenerator
+
+            token = _active_context.set(self)
+            self._AWG = ArbitaryWaveGenerator()
+            _active_context.reset(token)
+        return self._AWG
+
+    def close(self):
+        """SimulationContext close method releasing all owned data"""
+        for component in self._components:
+            component.reset_data()
+
+        if(self._AWG):
+            self._AWG.signals.clear()
+
+        self._components.clear()
+        self._registry.clear()
+        self._AWG = None
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from math import isfinite
+from typing import TYPE_CHECKING
+
+from numpy import ndarray
+
+from .Component import _make_getter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from .Component import Component
+    from .Simulator import Simulator
+
+class SimulationDivergenceError(Exception):
+    """
+    SimulationDivergenceError class\n
+    Raised when a Component state leaves its finite range or bounds, with the Clock step and Component.
+    """
+    def __init__(self, step: int, component: str, key: str|None, value: float|complex|None, t: float, reason: str):
+        self.step = step
+        """Clock step of the divergence"""
+
+        self.component = component
+        """name of the diverged Component or Connection"""
+
+        self.key = key
+        """state key of the diverged value, None for arithmetic errors"""
+
+        self.value = value
+        self.t = t
+        self.reason = reason
+        super().__init__(f"{component}.{key} = {value} {reason} at step {step} (t = {t})")
+
+    def __reduce__(self):
+        return (type(self), (self.step, self.component, self.key, self.value, self.t, self.reason))
+
+class HealthMonitor:
+    """
+    HealthMonitor class\n
+    Periodic finite and range checks of Component states, every check_interval Clock steps.\n
+    A value is healthy when finite and low <= value <= high, and event counters stay below their rate.
+    """
+    def __init__(self, check_interval: int = 256, bounds: dict[str, tuple[float|None, float|None]]|None = None,
+                name: str = "default_health_monitor"):
+        self.name = name
+        self.check_interval = max(1, check_interval)
+        """Clock steps between checks for HealthMonitor"""
+
+        self._bounds = dict(bounds) if(bounds) else {}
+        """(low, high) per state key like 'photon', or per column like 'master_laser_0.photon'"""
+
+        self._checks: list[tuple[Component, Callable, tuple[tuple[str, float|None, float|None],...]]] = []
+        """per Component (getter, (key, low, high) checks) for HealthMonitor"""
+
+        self._counters: list[list] = []
+        """per Component [Component, key, max events per step, last value] for HealthMonitor"""
+        self._last_step: int = 0
+
+    def __repr__(self) -> str:
+        return f"HealthMonitor: {self.name} every {self.check_interval} steps, {len(self._bounds)} bounds"
+
+    def set_bounds(self, key: str, low: float|None = None, high: float|None = None):
+        """HealthMonitor set_bounds method, attach again for running Simulators"""
+        self._bounds[key] = (low, high)
+
+    def attach(self, simulator: Simulator):
+        """HealthMonitor attach method building the checks of all Simulator Components"""
+        self._checks = []
+        self._counters = []
+        for component in simulator._components:
+            checks = []
+            for key in component._state_keys:
+                # Buffers like delay line history are checked where they are read
+                if(isinstance(getattr(component, key), ndarray)):
+                    continue
+                # Column bounds before key bounds
+                low, high = self._bounds.get(component._column_name(key), self._bounds.get(key, (None, None)))
+                checks.append((key, low, high))
+            if(checks):
+                self._checks.append((component, _make_getter(tuple(key for key, _, _ in checks)), tuple(checks)))
+
+            for key, max_rate in component._health_counters.items():
+                self._counters.append([component, key, max_rate, 0])
+        self.start(simulator)
+
+    def start(self, simulator: Simulator):
+        """HealthMonitor start method, event counters are compared from here"""
+        for counter in self._counters:
+            counter[3] = getattr(counter[0], counter[1])
+        clock = simulator.simulation_clock
+        self._last_step = round(clock.t / clock.dt)
+
+    def check(self, simulator: Simulator):
+        """HealthMonitor check method raising SimulationDivergenceError on the first unhealthy state value"""
+        clock = simulator.simulation_clock
+        step = round(clock.t / clock.dt)
+        for component, getter, checks in self._checks:
+            for value, (key, low, high) in zip(getter(component), checks):
+
+                # Complex fields are bounded by magnitude
+                magnitude = abs(value)
+                if(not isfinite(magnitude)):
+                    reason = "is not finite"
+                elif(low is not None and (magnitude if(isinstance(value, complex)) else value) < low):
+                    reason = f"is below {low}"
+                elif(high is not None and (magnitude if(isinstance(value, complex)) else value) > high):
+                    reason = f"is above {high}"
+                else:
+                    continue
+                raise SimulationDivergenceError(step, component.name, key, value, clock.t, reason)
+
+        # Event counters since the last check
+        n_steps = step - self._last_step
+        for counter in self._counters:
+            component, key, max_rate, last_value = counter
+            value = getattr(component, key)
+            counter[3] = value
+            if(n_steps > 0 and value - last_value > max_rate * n_steps):
+                raise SimulationDivergenceError(step, component.name, key, value, clock.t, 
+                                                f"grew by {value - last_value} in {n_steps} steps")
+        self._last_step = step
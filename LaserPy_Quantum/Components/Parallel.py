@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from pickle import dumps, loads, PicklingError
+
+from .Component import Component
+from .Component import Clock
+from .Component import _instance_attributes
+
+from .Signal import LangevinNoise
+
+from .Simulator import Connection
+from .Simulator import Simulator
+
+def partition_connections(connections: tuple[Connection,...]) -> list[tuple[Connection,...]]:
+    """partition connections into groups sharing no Component except the Clock"""
+    parent = list(range(len(connections)))
+
+    def find(idx: int):
+        while(parent[idx] != idx):
+            parent[idx] = parent[parent[idx]]
+            idx = parent[idx]
+        return idx
+
+    # Union connections touching the same Component
+    owner: dict[int, int] = {}
+    for idx, connection in enumerate(connections):
+        for component in connection._get_input_components() + connection._get_output_components():
+            if(isinstance(component, Clock)):
+                continue
+            if(id(component) in owner):
+                parent[find(idx)] = find(owner[id(component)])
+            else:
+                owner[id(component)] = idx
+
+    groups: dict[int, list[Connection]] = {}
+    for idx, connection in enumerate(connections):
+        groups.setdefault(find(idx), []).append(connection)
+    return [tuple(group) for group in groups.values()]
+
+def _group_components(connections: tuple[Connection,...]) -> tuple[Component,...]:
+    """unique non Clock Components of a connection group in order"""
+    components: dict[int, Component] = {}
+    for connection in connections:
+        for component in connection._get_input_components() + connection._get_output_components():
+            if(not isinstance(component, Clock)):
+                components.setdefault(id(component), component)
+    return tuple(components.values())
+
+def _component_state(component: Component) -> tuple[tuple, tuple]:
+    """narrow worker result of a Component, states and simulation data of its sub-Components"""
+    states = tuple(state_component.get_state() for state_component in component._get_state_components())
+    data = tuple((data_component._simulation_data, data_component._trace_list_keys, getattr(data_component, '_time_tags', None))
+                 for data_component in component._get_data_components())
+    return states, data
+
+def _apply_component_state(target: Component, component_state: tuple[tuple, tuple]):
+    """copy a worker result into target and its sub-Components, live shared objects stay"""
+    states, data = component_state
+    for target_state, state in zip(target._get_state_components(), states):
+        target_state.set_state(state)
+
+    for target_data, (simulation_data, trace_list_keys, time_tags) in zip(target._get_data_components(), data):
+        target_data._simulation_data = simulation_data
+        target_data._trace_list_keys = trace_list_keys
+        target_data._data_getter = None
+        if(time_tags is not None):
+            target_data._time_tags = time_tags
+
+def _seed_noise(components: tuple[Component,...], seed_sequence):
+    """seed the global numpy state and unseeded LangevinNoise of a worker from its own SeedSequence"""
+    from numpy import random
+    random.seed(seed_sequence.generate_state(1)[0])
+
+    for component in components:
+        for value in _instance_attributes(component).values():
+            if(isinstance(value, LangevinNoise) and value._rng is None):
+                value.set_seed(seed_sequence.spawn(1)[0])
+
+def _simulate_partition(payload: bytes, seed_sequence):
+    """worker simulation of one independent connection group"""
+    connections, clock = loads(payload)
+    _seed_noise(_group_components(connections), seed_sequence)
+    simulator = Simulator(clock, name="partition_simulator")
+    simulator.set(connections)
+    simulator.simulate()
+    return tuple(_component_state(component) for component in _group_components(connections))
+
+def simulate_parallel(simulator: Simulator, max_workers: int|None = None, seed: int|None = None):
+    """simulate independent connection groups of simulator in worker processes, seed makes unseeded noise reproducible"""
+    groups = partition_connections(simulator._connections)
+    if(len(groups) < 2):
+        print(f"{simulator.name} has no independent connection groups, simulating serially")
+        simulator.simulate()
+        return
+
+    # Hooks need the whole system every step
+    hooks = [name for name, hook in (("HealthMonitor", simulator._health_monitor), ("progress", simulator._progress_callback),
+                                     ("PeriodicSteadyState", simulator._periodic_steady_state)) if(hook is not None)]
+    if(hooks):
+        print(f"{simulator.name} {', '.join(hooks)} not supported by worker processes, simulating serially")
+        simulator.simulate()
+        return
+
+    # Worker payloads, closures and lambdas cannot cross processes
+    clock = simulator.simulation_clock
+    try:
+        payloads = [dumps((group, clock)) for group in groups]
+    except (PicklingError, AttributeError, TypeError) as e:
+        print(f"{simulator.name} connections cannot be sent to workers ({e}), simulating serially")
+        simulator.simulate()
+        return
+
+    # Independent noise streams, forked workers share the parent random state
+    from numpy.random import SeedSequence
+    seed_sequences = SeedSequence(seed).spawn(len(groups))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_simulate_partition, payload, seed_sequence) for payload, seed_sequence in zip(payloads, seed_sequences)]
+
+        # Simulator time data while workers run
+        while(clock.running):
+            if(simulator._save_simulation and clock._should_sample()):
+                simulator.store_data()
+            clock.update()
+
+        # Synchronize worker states into the original Components
+        for group, future in zip(groups, futures):
+            for target, component_state in zip(_group_components(group), future.result()):
+                _apply_component_state(target, component_state)
+    print(f"Simulations Complete: {len(simulator._simulation_data)} samples in {len(groups)} groups")
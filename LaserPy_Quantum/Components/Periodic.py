@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from numpy import (
+    ndarray,
+    float64,
+    array, arange, frombuffer, full, iscomplexobj,
+    abs, add,
+    inf
+)
+
+if TYPE_CHECKING:
+    from .Component import Component
+    from .Signal import NoNoise
+    from .Simulator import Simulator
+
+# Clock times accumulated per block by PeriodicSteadyState _clock_run
+CLOCK_RUN_CHUNK = 1 << 16
+
+class PeriodicSteadyState:
+    """
+    PeriodicSteadyState class\n
+    Detects a periodic orbit of the Simulator state and tiles its last period for the rest of the run.\n
+    The orbit is periodic when the state change over a period stays below atol + rtol |state|,
+    drift keys like the Laser phase need the spread of their change per period over the last min_cycles periods,
+    times the tiled periods, to stay below it instead.
+    Noise is superposed on the tiled samples only, time tags are not tiled.
+    """
+    def __init__(self, period: float, rtol: float = 1e-6, atol: float = 0.0, min_cycles: int = 2,
+                noise: dict[str, NoNoise]|None = None, name: str = "default_periodic_steady_state"):
+        self.name = name
+        self.period = period
+        """period of the drive for PeriodicSteadyState, a whole number of Clock samples"""
+
+        self.rtol = rtol
+        self.atol = atol
+        self.min_cycles = max(2, min_cycles)
+        """simulated periods before tiling and compared drift periods for PeriodicSteadyState"""
+
+        self._noise = dict(noise) if(noise) else {}
+        """noise superposed on tiled samples, per column like 'slave_laser_1.photon' or per key like 'photon'"""
+
+        # Results of the last run
+        self.converged: bool = False
+        self.settling_cycles: int = 0
+        self.tiled_cycles: int = 0
+
+        self._fields: tuple[str,...] = ()
+        """compared state columns for PeriodicSteadyState"""
+        self._drift_mask: ndarray = array([], dtype=bool)
+        self._drift_states: list[tuple[Component, str]] = []
+        """(Component, key) of drift state columns for PeriodicSteadyState"""
+
+    def __repr__(self) -> str:
+        return f"PeriodicSteadyState: {self.name} period {self.period} s, {self.settling_cycles} settling and {self.tiled_cycles} tiled periods"
+
+    def set_noise(self, key: str, noise: NoNoise|None):
+        """PeriodicSteadyState set_noise method, None removes the noise of key"""
+        if(noise is None):
+            self._noise.pop(key, None)
+        else:
+            self._noise[key] = noise
+
+    def _attach(self, simulator: Simulator):
+        """PeriodicSteadyState _attach method for the compared state columns"""
+        fields = []
+        drift_mask = []
+        self._drift_states = []
+        state_dtype = simulator.snapshot_state().dtype
+        for component in simulator._state_components:
+            # Clock time always advances
+            if(component is simulator.simulation_clock):
+                continue
+            for key in component._state_keys:
+                # Buffers and integer tick counters are bookkeeping of the compared fields
+                field_dtype = state_dtype[component._column_name(key)]
+                if(field_dtype.shape or field_dtype.kind not in 'fc'):
+                    continue
+                fields.append(component._column_name(key))
+                drift_mask.append(key in component._drift_keys)
+                if(key in component._drift_keys):
+                    self._drift_states.append((component, key))
+        self._fields = tuple(fields)
+        self._drift_mask = array(drift_mask, dtype=bool)
+
+    def _state_values(self, state: ndarray):
+        """PeriodicSteadyState _state_values method of the compared columns of a snapshot_state record"""
+        # Complex fields rotate with the Laser phase drift, their magnitude is periodic
+        return array([abs(state[field]) if(iscomplexobj(state[field])) else state[field] for field in self._fields], dtype=float64)
+
+    def _is_periodic(self, values: ndarray, deltas: list[ndarray], n_cycles: int):
+        """PeriodicSteadyState _is_periodic method comparing the last periods before n_cycles tiled periods"""
+        delta = deltas[-1]
+        change = abs(delta)
+        scale = abs(values)
+
+        # Drift keys are extrapolated, their per period spread accumulates over the tiled periods
+        drift_deltas = array([period_delta[self._drift_mask] for period_delta in deltas])
+        change[self._drift_mask] = max(n_cycles, 1) * (drift_deltas.max(axis=0) - drift_deltas.min(axis=0))
+        return bool((change <= self.atol + self.rtol * scale).all())
+
+    @staticmethod
+    def _clock_run(t: float, dt: float, t_final: float, max_steps: int|None = None):
+        """PeriodicSteadyState _clock_run method returning (steps, last time) of a run from t,
+        Clock times accumulate dt like Clock update so the step count matches a simulated run"""
+        steps = 0
+        while(True):
+            # Sequential sums round like repeated t += dt
+            times = full(CLOCK_RUN_CHUNK, dt)
+            times[0] = t
+            add.accumulate(times, out=times)
+
+            n_steps = CLOCK_RUN_CHUNK if(max_steps is None) else min(CLOCK_RUN_CHUNK, max_steps - steps)
+            ended = (times[:n_steps] >= t_final).nonzero()[0]
+            if(ended.size):
+                return steps + int(ended[0]) + 1, float(times[ended[0]])
+            steps += n_steps
+            if(steps == max_steps):
+                return steps, float(times[n_steps - 1])
+            t = float(times[-1]) + dt
+
+    def _tile(self, simulator: Simulator, n_cycles: int, n_samples: int, cycle_duration: float, drifts: dict[str, float]):
+        """PeriodicSteadyState _tile method appending n_cycles copies of the last n_samples of every trace, 
+        returns (trace, length, offset) of traces advancing every period"""
+        offsets = arange(1, n_cycles + 1, dtype=float64)[:, None]
+        advancing = []
+
+        def extend(trace, column: str, key: str, drift: float):
+            if(len(trace) < n_samples):
+                return
+            if(isinstance(trace, list)):
+                # Non-real values of _list_keys are tiled as stored
+                trace.extend(trace[-n_samples:] * n_cycles)
+                return
+            if(drift):
+                advancing.append((trace, n_cycles * drift))
+            cycle = frombuffer(trace[-n_samples:], dtype=trace.typecode).astype(float64)
+            tiled = cycle[None, :] + drift * offsets if(drift) else cycle[None, :].repeat(n_cycles, axis=0)
+
+            noise = self._noise.get(column, self._noise.get(key))
+            if(noise is not None):
+                tiled = tiled + noise.samples(tiled.size).reshape(tiled.shape)
+            trace.frombytes(tiled.astype(trace.typecode).tobytes())
+
+        if(simulator._save_simulation):
+            extend(simulator._simulation_data, 'time', 'time', cycle_duration)
+        for component in simulator._components:
+            for data_component in component._get_data_components():
+                if(not data_component._save_simulation):
+                    continue
+                for key, trace in data_component._simulation_data.items():
+                    column = data_component._column_name(key)
+                    extend(trace, column, key, drifts.get(column, 0.0))
+        return [(trace, len(trace), offset) for trace, offset in advancing]
+
+    @staticmethod
+    def _offset_tail(trace, start: int, offset: float):
+        """PeriodicSteadyState _offset_tail method adding offset to the samples of trace from start"""
+        tail = frombuffer(trace[start:], dtype=trace.typecode).astype(float64) + offset
+        trace[start:] = type(trace)(trace.typecode, tail.astype(trace.typecode).tobytes())
+
+    def run(self, simulator: Simulator):
+        """PeriodicSteadyState run method simulating until the orbit is periodic, returns Clock steps covered"""
+        clock = simulator.simulation_clock
+        cycle_steps = round(self.period / clock.dt)
+        sample_steps = round(clock._sampling_rate / clock.dt)
+        self.converged = False
+        self.settling_cycles = 0
+        self.tiled_cycles = 0
+
+        if(cycle_steps < 1 or cycle_steps % sample_steps or abs(cycle_steps * clock.dt - self.period) > 1e-6 * self.period):
+            print(f"WARNING:: {self.name} period {self.period} is not a whole number of Clock samples, simulating every step")
+            return simulator._run_steps()
+        self._attach(simulator)
+
+        steps = 0
+        values = self._state_values(simulator.snapshot_state())
+        deltas: list[ndarray] = []
+        while(clock.running):
+            t_start = clock.t
+            taken = simulator._run_steps(cycle_steps)
+            steps += taken
+            if(taken < cycle_steps or simulator.simulation_error is not None or simulator.cancelled):
+                return steps
+            self.settling_cycles += 1
+
+            # Whole periods before t_final, the last ones are simulated to end as a normal run
+            cycle_duration = clock.t - t_start
+            n_cycles = int((clock._t_final - clock.t) / cycle_duration) - 1
+
+            next_values = self._state_values(simulator.snapshot_state())
+            deltas = deltas[1 - self.min_cycles:] + [next_values - values]
+            if(len(deltas) == self.min_cycles and self._is_periodic(next_values, deltas, max(n_cycles, 0))):
+                self.converged = True
+                break
+            values = next_values
+
+        if(not self.converged):
+            return steps
+        if(n_cycles <= 0):
+            return steps + simulator._run_steps()
+
+        drifts = {field: float(deltas[-1][idx]) for idx, field in enumerate(self._fields) if(self._drift_mask[idx])}
+        advancing = self._tile(simulator, n_cycles, cycle_steps // sample_steps, cycle_duration, drifts)
+        self.tiled_cycles = n_cycles
+
+        # Steps and end time a simulated run would reach from here
+        t_final = clock._t_final
+        run_steps, t_end = self._clock_run(clock.t, clock.dt, t_final)
+        rest_steps = run_steps - n_cycles * cycle_steps
+
+        # Rest of the run continues the last simulated period, so complex fields and delay buffers keep their phase
+        clock._t_final = self._clock_run(clock.t, clock.dt, inf, rest_steps)[1]
+        steps += n_cycles * cycle_steps + simulator._run_steps()
+        clock._t_final = t_final
+        clock.t = t_end
+
+        # Time and drift columns of the rest of the run, then drift states
+        for trace, start, offset in advancing:
+            self._offset_tail(trace, start, offset)
+        for component, key in self._drift_states:
+            setattr(component, key, getattr(component, key) + n_cycles * drifts[component._column_name(key)])
+        return steps
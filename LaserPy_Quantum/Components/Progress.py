@@ -0,0 +1,19 @@
+from typing import NamedTuple
+
+class SimulationProgress(NamedTuple):
+    """
+    SimulationProgress class\n
+    A compact class for {'step', 't', 't_final', 'fraction', 'steps_per_second', 'eta', 'elapsed'}.
+    """
+    step: int
+    t: float
+    t_final: float
+    fraction: float
+    steps_per_second: float
+    eta: float
+    elapsed: float
+
+def print_progress(progress: SimulationProgress):
+    """progress callback printing one status line"""
+    print(f"\r{100 * progress.fraction:6.2f}% t = {progress.t:.4e} s, {progress.steps_per_second:.0f} steps/s, "
+          f"ETA {progress.eta:.1f} s", end="" if(progress.fraction < 1) else "\n", flush=True)
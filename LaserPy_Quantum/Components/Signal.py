@@ -1,18 +1,20 @@
 from typing import Self
 
 from numpy import (
-    random,
+    ndarray,
+    asarray, fromiter, full, where, floor, zeros,
     mod
 )
 
 from .Component import Clock
+from .Context import get_active_context
 
 from ..Constants import ERR_TOLERANCE
 
-from uuid import uuid4
-
 class SignalID:
     def __init__(self, name:str) -> None:
+        from uuid import uuid4
+
         self.name = name
         self.uid = uuid4()
 
@@ -31,19 +33,41 @@ class NoNoise(SignalID):
         """NoNoise __call__ method to override"""
         return 0
 
+    def samples(self, n_samples: int) -> ndarray:
+        """NoNoise samples method to override, n_samples noise values in one call"""
+        return zeros(n_samples)
+
 class LangevinNoise(NoNoise):
     """
     LangevinNoise class
     """
-    def __init__(self, Mu: int, Std_dev: int, name: str = "default_langevin_noise"):
+    def __init__(self, Mu: int, Std_dev: int, name: str = "default_langevin_noise", seed: int|None = None):
         super().__init__(name)
 
         self._Mu = Mu
         self._Std_dev = Std_dev
 
+        from numpy import random
+        self._rng = random.default_rng(seed) if(seed is not None) else None
+        """seeded random Generator for LangevinNoise, None uses the global state"""
+
+        self._normal = self._rng.normal if(self._rng) else random.normal
+        """normal distribution sampler for LangevinNoise"""
+
+    def set_seed(self, seed):
+        """LangevinNoise set_seed method, seed is an int or a numpy SeedSequence"""
+        from numpy import random
+        self._rng = random.default_rng(seed)
+        self._normal = self._rng.normal
+
     def __call__(self):
         """LangevinNoise __call__ method"""
-        return random.normal(loc=self._Mu, scale=self._Std_dev)
+        return self._normal(loc=self._Mu, scale=self._Std_dev)
+
+    def samples(self, n_samples: int):
+        """LangevinNoise samples method"""
+        #return super().samples(n_samples)
+        return self._normal(loc=self._Mu, scale=self._Std_dev, size=n_samples)
 
 ########################################################
 # Wave definitions
@@ -68,6 +92,12 @@ class ArbitaryWave(SignalID):
         """ArbitaryWave WaveSignal method to override"""
         return 0
 
+    def samples(self, t: ndarray) -> ndarray:
+        """ArbitaryWave samples method to override, wave at every time of t without changing state"""
+        # Scalar fallback for custom waves
+        t = asarray(t, dtype=float)
+        return fromiter((self(t_value) for t_value in t.tolist()), dtype=float, count=len(t))
+
 class StaticWave(ArbitaryWave):
     """
     StaticWave class
@@ -81,6 +111,11 @@ class StaticWave(ArbitaryWave):
         #return super().WaveSignal(t)
         return self.static_val
 
+    def samples(self, t: ndarray):
+        """StaticWave samples method"""
+        #return super().samples(t)
+        return full(len(t), self.static_val, dtype=float)
+
 class PulseWave(ArbitaryWave):
     """
     PulseWave class
@@ -99,6 +134,13 @@ class PulseWave(ArbitaryWave):
             return self.pulse_high
         return self.pulse_low
 
+    def samples(self, t: ndarray):
+        """PulseWave samples method"""
+        #return super().samples(t)
+        t = mod(asarray(t, dtype=float), self._t_unit)
+        in_pulse = (t > self._t_unit * (0.5 - self._signal_spread)) & (t < self._t_unit * (0.5 + self._signal_spread))
+        return where(in_pulse, self.pulse_high, self.pulse_low)
+
 class AlternatingPulseWave(ArbitaryWave):
     """
     AlternatingPulseWave class
@@ -110,26 +152,50 @@ class AlternatingPulseWave(ArbitaryWave):
         self.static_val = static_val
         self.pulse_val = pulse_val
 
+    def __call__(self, t: float):
+        """AlternatingPulseWave __call__ method, sign of the period index of t like samples"""
+        #return super().__call__(t)
+        # First period at -1, alternating every period independent of the call history
+        self.sign = -1 if(floor((t + ERR_TOLERANCE) / self._t_unit) % 2 == 0) else 1
+        return super().__call__(t)
+
     def WaveSignal(self, t: float):
         """AlternatingPulseWave WaveSignal method"""
         #return super().WaveSignal(t)
-        if(t <= ERR_TOLERANCE):
-            self.sign *= -1
         if(t > self._t_unit * (0.5 - self._signal_spread) and   
            t < self._t_unit * (0.5 + self._signal_spread)):   
             return self.static_val + self.pulse_val * self.sign
         return self.static_val
+
+    def samples(self, t: ndarray):
+        """AlternatingPulseWave samples method, sign of the period index as sampled from t = 0"""
+        #return super().samples(t)
+        t = asarray(t, dtype=float)
+        period = floor((t + ERR_TOLERANCE) / self._t_unit)
+        t = mod(t, self._t_unit)
+
+        # First period at -1, alternating every period
+        sign = where(period % 2 == 0, -1, 1)
+        in_pulse = (t > self._t_unit * (0.5 - self._signal_spread)) & (t < self._t_unit * (0.5 + self._signal_spread))
+        return where(in_pulse, self.static_val + self.pulse_val * sign, self.static_val)
     
 ########################################################
 
 class ArbitaryWaveGenerator:
     """
-    ArbitaryWaveGenerator Singleton class
+    ArbitaryWaveGenerator Singleton class, scoped inside a SimulationContext
     """
     _SELF = None
     _SINGLETON = False
 
     def __new__(cls, *arg, **kwargs) -> Self:
+        context = get_active_context()
+        if(context):
+            # One ArbitaryWaveGenerator per SimulationContext
+            if(context._AWG is None):
+                context._AWG = super().__new__(cls)
+            return context._AWG # type: ignore
+
         if(cls._SELF is None):
             cls._SELF = super().__new__(cls)
         return cls._SELF
@@ -151,6 +217,16 @@ class ArbitaryWaveGenerator:
         for arbitarywave in arbitarywaves:
             self.signals[arbitarywave.name] = arbitarywave
 
+    def samples(self, t: ndarray, signal_keys:str|tuple[str,...]) -> ndarray:
+        """ArbitaryWaveGenerator samples method of superimposed signals at every time of t"""
+        if(isinstance(signal_keys, str)):
+            signal_keys = (signal_keys,)
+
+        superimposed_signal = full(len(t), 0.0)
+        for signal_key in signal_keys:
+            superimposed_signal += self.signals[signal_key].samples(t)
+        return superimposed_signal
+
     def simulate(self, clock:Clock, signal_keys:str|tuple[str,...]) -> float:
         """ArbitaryWaveGenerator simulate method"""
         if(isinstance(signal_keys, str)):
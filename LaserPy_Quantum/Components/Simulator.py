@@ -1,16 +1,31 @@
-import matplotlib.pyplot as plt
+from collections.abc import Callable
+from heapq import heappush, heappop
+from itertools import chain
+from time import perf_counter
 
 from numpy import (
+    ndarray, dtype, complexfloating, integer,
+    complex128, float64, int64,
     array
 )
 
-from ..Constants import FIG_WIDTH, FIG_HEIGHT
-
 from .Component import Component
 from .Component import Clock
 from .Component import TimeComponent
 from .Component import DataComponent
 
+from .Health import HealthMonitor
+from .Health import SimulationDivergenceError
+
+from .Progress import SimulationProgress
+
+from .Periodic import PeriodicSteadyState
+
+from ..Precision import new_trace
+
+# Clock steps between checks of a cancel request
+CANCEL_CHECK_INTERVAL = 1024
+
 class Connection(TimeComponent):
     """
     Connection class
@@ -28,6 +43,17 @@ class Connection(TimeComponent):
             output_components = (output_components,)
         self._output_components = output_components
 
+        self._input_port_kwargs: tuple[dict,...]|None = None
+        """cached input_port kwargs of output Components for Connection"""
+
+    def _get_input_components(self) -> tuple[Component,...]:
+        """Connection _get_input_components method for read Components"""
+        return self._input_components if(self._input_components) else ()
+
+    def _get_output_components(self) -> tuple[Component,...]:
+        """Connection _get_output_components method for simulated Components"""
+        return self._output_components
+
     def reset_data(self):
         """Connection reset_data method"""
         # Output devices reset
@@ -42,6 +68,8 @@ class Connection(TimeComponent):
     def reset(self, save_simulation: bool):
         """Connection reset method"""
         #return super().reset()
+        self._input_port_kwargs = None
+
         for component in self._output_components:
             component.reset(save_simulation)
 
@@ -55,9 +83,12 @@ class Connection(TimeComponent):
         #return super().simulate(clock)
         
         # Input-Output device ports
+        if(self._input_port_kwargs is None):
+            self._input_port_kwargs = tuple(component.input_port() for component in self._output_components)
+
         component_kwargs = []
-        for idx, component in enumerate(self._output_components):
-            component_kwargs.append(component.input_port())
+        for idx, port_kwargs in enumerate(self._input_port_kwargs):
+            component_kwargs.append(dict(port_kwargs))
             if('clock' in component_kwargs[idx]):
                 component_kwargs[idx]['clock'] = clock
 
@@ -74,16 +105,58 @@ class Connection(TimeComponent):
             if(component._save_simulation and clock._should_sample()):
                 component.store_data()
 
+class DelayConnection(Connection):
+    """
+    DelayConnection class\n
+    Connection reading its input Components one step delayed, for feedback loops.
+    """
+    def __init__(self, input_components:Component|tuple[Component,...]|None, output_components:Component|tuple[Component,...], name:str="default_delay_connection"):
+        super().__init__(input_components, output_components, name)
+
 class Simulator(DataComponent):
     """
     Simulator class
     """
-    def __init__(self, simulation_clock:Clock, save_simulation:bool=False, name:str="default_simulator"):
+    def __init__(self, simulation_clock:Clock, save_simulation:bool=False, name:str="default_simulator", 
+                raise_on_error:bool=False):
         super().__init__(save_simulation, name)
         self.simulation_clock:Clock = simulation_clock
+        self._connections: tuple[Connection,...] = ()
+        self.simulation_error: Exception|None = None
+        """last unexpected error of Simulator simulate"""
+        self.raise_on_error = raise_on_error
+        """re-raise errors of simulate after recording them in simulation_error"""
+        self._components: tuple[Component,...] = (simulation_clock,)
+        self._state_components: tuple[Component,...] = (simulation_clock,)
+        """Components and their sub-Components in snapshot_state order"""
+
+        self._health_monitor: HealthMonitor|None = None
+        """periodic state checks of Simulator, None disables them"""
+
+        self._periodic_steady_state: PeriodicSteadyState|None = None
+        """periodic orbit detection and tiling of Simulator simulate, None disables it"""
+
+        # Progress callback every progress_steps or every progress_seconds of wall time
+        self._progress_callback: Callable[[SimulationProgress], None]|None = None
+        self._progress_steps: int = 0
+        self._progress_seconds: float = 0.0
+
+        self._cancel_requested: bool = False
+        self.cancelled: bool = False
+        """last simulate stopped by cancel with the data recorded so far"""
+
+        # Step of the next health check, progress callback and cancel check, -1 when disabled
+        self._next_check: int = -1
+        self._next_progress_step: int = -1
+        self._next_cancel_check: int = CANCEL_CHECK_INTERVAL
+        self._run_started: float = 0.0
+        self._last_progress: float = 0.0
+
+        # Compact state layout
+        self._state_dtype: dtype|None = None
 
         # Data storage
-        self._simulation_data: list[float] = []
+        self._simulation_data = new_trace(double=True)
         self._simulation_data_units = r" $(s)$"
 
     def store_data(self):
@@ -99,12 +172,12 @@ class Simulator(DataComponent):
         self.simulation_clock.t = 0.0
 
         # Data reset
-        self._simulation_data.clear()
+        self._simulation_data = new_trace(double=True)
         # Propagate the changes
         for connection in self._connections:
             connection.reset_data()
 
-    def display_data(self):
+    def display_data(self, filepath:str|None=None):
         """Simulator display_data method"""
         #return super().display_data()
 
@@ -113,18 +186,12 @@ class Simulator(DataComponent):
             print(f"{self.name} id:{self.class_id} cannot display data")
             return
 
-        plt.figure(figsize=(FIG_WIDTH, FIG_HEIGHT))
-
         time_data = array(self._simulation_data)
 
-        plt.plot(time_data, time_data, label="Time")
-        plt.xlabel(self._simulation_data_units)
-        plt.ylabel(self._simulation_data_units)
-        plt.grid()
-
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        from ..Plotting import plot_series
+        plot_series(f"{self.name}", time_data, {'time': {"Time": time_data}}, 
+                    {'time': self._simulation_data_units}, xlabel=self._simulation_data_units, 
+                    filepath=filepath, n_cols=1)
 
     def get_data(self):
         """Simulator get_data method"""
@@ -136,6 +203,15 @@ class Simulator(DataComponent):
             return array([0.0])
         return array(self._simulation_data)
 
+    def get_result(self):
+        """Simulator get_result method returning a SimulationResult of all saved data"""
+        from ..Results import SimulationResult
+        return SimulationResult.from_simulator(self)
+
+    def get_columns(self):
+        """Simulator get_columns method for all saved simulation data aligned on time"""
+        return self.get_result().to_dict()
+
     def reset(self, save_simulation: bool = False):
         """Simulator reset method"""
         # Propagate the changes
@@ -149,21 +225,309 @@ class Simulator(DataComponent):
         #return super().set()
         if(isinstance(connections, Connection)):
             connections = (connections,)
-        self._connections = connections
+        self._connections = self._order_connections(connections)
+
+        # Unique Components in connection order
+        components: dict[int, Component] = {id(self.simulation_clock): self.simulation_clock}
+        for connection in self._connections:
+            for component in connection._get_input_components() + connection._get_output_components():
+                components.setdefault(id(component), component)
+        self._components = tuple(components.values())
+
+        # Sub-Components like AMZI detectors and shared delay lines once
+        state_components: dict[int, Component] = {}
+        for component in self._components:
+            for state_component in component._get_state_components():
+                state_components.setdefault(id(state_component), state_component)
+        self._state_components = tuple(state_components.values())
+        self._state_dtype = None
+        if(self._health_monitor):
+            self._health_monitor.attach(self)
+
+    def set_progress(self, callback: Callable[[SimulationProgress], None]|None, every_steps: int|None = None, 
+                    every_seconds: float|None = None):
+        """Simulator set_progress method, callback every_steps Clock steps or about every_seconds of wall time"""
+        self._progress_callback = callback
+        self._progress_steps = max(1, every_steps) if(every_steps) else 0
+        self._progress_seconds = every_seconds if(every_seconds) else (0.0 if(every_steps) else 1.0)
+
+    def cancel(self):
+        """Simulator cancel method, thread safe request to stop the active run at the next check keeping recorded data"""
+        self._cancel_requested = True
+
+    def _take_cancel(self):
+        """Simulator _take_cancel method marking the run cancelled on a pending request, returns cancelled"""
+        if(self._cancel_requested):
+            self._cancel_requested = False
+            self.cancelled = True
+        return self.cancelled
+
+    def _start_run(self):
+        """Simulator _start_run method, requests made before a run do not cancel it"""
+        self.simulation_error = None
+        self.cancelled = False
+        self._cancel_requested = False
+
+    def _progress(self, steps: int):
+        """Simulator _progress method"""
+        clock = self.simulation_clock
+        elapsed = perf_counter() - self._run_started
+        steps_per_second = steps / elapsed if(elapsed > 0) else 0.0
+        remaining_steps = max(0.0, (clock._t_final - clock.t) / clock.dt)
+        eta = remaining_steps / steps_per_second if(steps_per_second > 0) else float('inf')
+        fraction = min(1.0, clock.t / clock._t_final) if(clock._t_final > 0) else 1.0
+        return SimulationProgress(round(clock.t / clock.dt), clock.t, clock._t_final, fraction, steps_per_second, eta, elapsed)
+
+    def _next_progress(self, steps: int):
+        """Simulator _next_progress method returning the step of the next progress callback"""
+        if(self._progress_steps):
+            return steps + self._progress_steps
+
+        # Wall time interval from the measured step rate
+        elapsed = perf_counter() - self._run_started
+        if(steps == 0 or elapsed <= 0):
+            return steps + 256
+        return steps + max(1, int(self._progress_seconds * steps / elapsed))
+
+    def _step_events(self, steps: int):
+        """Simulator _step_events method of health checks, progress and cancel, returns True to stop"""
+        if(steps == self._next_check):
+            self._health_monitor.check(self) # type: ignore
+            self._next_check += self._health_monitor.check_interval # type: ignore
+
+        if(steps == self._next_progress_step):
+            now = perf_counter()
+            if(self._progress_steps or now - self._last_progress >= self._progress_seconds):
+                self._last_progress = now
+                self._progress_callback(self._progress(steps)) # type: ignore
+            self._next_progress_step = self._next_progress(steps)
+
+        if(steps == self._next_cancel_check):
+            self._next_cancel_check += CANCEL_CHECK_INTERVAL
+            return self._take_cancel()
+        return False
+
+    def _next_event(self):
+        """Simulator _next_event method, the earliest step of a health check, progress callback or cancel check"""
+        return min(step for step in (self._next_check, self._next_progress_step, self._next_cancel_check) if(step > 0))
+
+    def set_health_monitor(self, health_monitor: HealthMonitor|None):
+        """Simulator set_health_monitor method, unhealthy states abort simulate with a SimulationDivergenceError"""
+        self._health_monitor = health_monitor
+        if(health_monitor):
+            health_monitor.attach(self)
+
+    def set_periodic_steady_state(self, periodic_steady_state: PeriodicSteadyState|None):
+        """Simulator set_periodic_steady_state method, simulate tiles the orbit once periodic"""
+        self._periodic_steady_state = periodic_steady_state
+
+    def _order_connections(self, connections:tuple[Connection,...]) -> tuple[Connection,...]:
+        """Simulator _order_connections method for a topological order of connections"""
+        # Connections simulating each Component
+        producers: dict[int, list[int]] = {}
+        for idx, connection in enumerate(connections):
+            for component in connection._get_output_components():
+                component_producers = producers.setdefault(id(component), [])
+                component_producers.append(idx)
+                if(len(component_producers) > 1):
+                    names = [connections[producer_idx].name for producer_idx in component_producers]
+                    print(f"WARNING:: {component} simulated {len(component_producers)} times per tick by connections {names}")
+
+        # Dependency DAG, delayed inputs are read before being simulated
+        dependents: list[set[int]] = [set() for _ in connections]
+        for idx, connection in enumerate(connections):
+            for component in connection._get_input_components():
+                for producer_idx in producers.get(id(component), ()):
+                    if(producer_idx == idx):
+                        continue
+                    elif(isinstance(connection, DelayConnection)):
+                        dependents[idx].add(producer_idx)
+                    else:
+                        dependents[producer_idx].add(idx)
+
+        in_degree = [0] * len(connections)
+        for idx_set in dependents:
+            for idx in idx_set:
+                in_degree[idx] += 1
+
+        # Kahn's algorithm keeping the user order among ready connections
+        ready = [idx for idx in range(len(connections)) if(in_degree[idx] == 0)]
+        order: list[int] = []
+        while(ready):
+            idx = heappop(ready)
+            order.append(idx)
+            for dependent_idx in dependents[idx]:
+                in_degree[dependent_idx] -= 1
+                if(in_degree[dependent_idx] == 0):
+                    heappush(ready, dependent_idx)
+
+        if(len(order) < len(connections)):
+            cycle = [connections[idx].name for idx in range(len(connections)) if(in_degree[idx] > 0)]
+            print(f"WARNING:: Connection cycle detected in {cycle}, use DelayConnection for feedback loops. Keeping given order")
+            return tuple(connections)
+        return tuple(connections[idx] for idx in order)
+
+    def _build_state_dtype(self):
+        """Simulator _build_state_dtype method for the structured state layout"""
+        fields = []
+        for component in self._state_components:
+            for key, value in zip(component._state_keys, component.get_state()):
+                if(isinstance(value, ndarray)):
+                    fields.append((component._column_name(key), value.dtype, value.shape))
+                elif(isinstance(value, (complex, complexfloating))):
+                    fields.append((component._column_name(key), complex128))
+                elif(isinstance(value, (int, integer)) and not isinstance(value, bool)):
+                    fields.append((component._column_name(key), int64))
+                else:
+                    fields.append((component._column_name(key), float64))
+        self._state_dtype = dtype(fields)
+
+    def snapshot_state(self) -> ndarray:
+        """Simulator snapshot_state method returning one structured state record of all Components and sub-Components"""
+        if(self._state_dtype is None):
+            self._build_state_dtype()
+        return array(tuple(chain.from_iterable(component.get_state() for component in self._state_components)), dtype=self._state_dtype)
+
+    def restore_state(self, state: ndarray):
+        """Simulator restore_state method from a snapshot_state record"""
+        values = state.item()
+        idx = 0
+        for component in self._state_components:
+            n_keys = len(component._state_keys)
+            component.set_state(values[idx:idx + n_keys])
+            idx += n_keys
+
+    def _run_steps(self, n_steps: int|None = None):
+        """Simulator _run_steps method advancing at most n_steps Clock steps, returns steps taken"""
+        clock = self.simulation_clock
+        steps = 0
+
+        # Cancel requested between chunks or periods
+        if(self._take_cancel()):
+            return steps
+
+        health_monitor = self._health_monitor
+        self._next_check = -1
+        if(health_monitor):
+            health_monitor.start(self)
+            self._next_check = health_monitor.check_interval
+
+        self._run_started = self._last_progress = perf_counter()
+        self._next_progress_step = self._next_progress(0) if(self._progress_callback) else -1
+        self._next_cancel_check = CANCEL_CHECK_INTERVAL
+        next_event = self._next_event()
+
+        connection = None
+        try:
+            while(clock.running and steps != n_steps):
+                for connection in self._connections:
+                        connection.simulate(clock)
+
+                if(self._save_simulation and clock._should_sample()):
+                    self.store_data()
+                clock.update()
+                steps += 1
+
+                # One integer comparison per step between events
+                if(steps == next_event):
+                    if(self._step_events(steps)):
+                        break
+                    next_event = self._next_event()
+
+            # Runs shorter than CANCEL_CHECK_INTERVAL check once at the end
+            if(clock.running):
+                self._take_cancel()
+            if(health_monitor and steps):
+                health_monitor.check(self)
+        except SimulationDivergenceError as e:
+            print(f"WARNING:: {self.name} aborted: {e}")
+            self.simulation_error = e
+            if(self.raise_on_error):
+                raise
+        except ArithmeticError as e:
+            # Overflow and zero division of an unstable run
+            self.simulation_error = SimulationDivergenceError(round(clock.t / clock.dt), connection.name if(connection) else self.name, 
+                                                            None, None, clock.t, f"raised {e!r}")
+            print(f"WARNING:: {self.name} aborted: {self.simulation_error}")
+            if(self.raise_on_error):
+                raise self.simulation_error from e
+        except Exception as e:
+            # Unexpected errors of Component code
+            print(f"WARNING:: {self.name} aborted at t {clock.t} in {connection.name if(connection) else self.name}: {e!r}")
+            self.simulation_error = e
+            if(self.raise_on_error):
+                raise
+        return steps
 
     def simulate(self):
         """Simulator simulate method"""
         #return super().simulate(args)
+        self._start_run()
+        if(self._periodic_steady_state):
+            steps = self._periodic_steady_state.run(self)
+        else:
+            steps = self._run_steps()
+        if(self._progress_callback and self.simulation_error is None):
+            self._progress_callback(self._progress(steps))
+
+        if(self.cancelled):
+            print(f"Simulations Cancelled: {len(self._simulation_data)} samples kept")
+        elif(self.simulation_error is None):
+            print(f"Simulations Complete: {len(self._simulation_data)} samples")
+
+    def _trace_lengths(self):
+        """Simulator _trace_lengths method of time and every saved column"""
+        lengths = {'time': len(self._simulation_data)}
+        for component in self._components:
+            for data_component in component._get_data_components():
+                for key, data_list in data_component._simulation_data.items():
+                    lengths[data_component._column_name(key)] = len(data_list)
+        return lengths
+
+    def _release_data(self):
+        """Simulator _release_data method starting fresh traces for time and every Component"""
+        self._simulation_data = new_trace(double=True)
+        for component in self._components:
+            for data_component in component._get_data_components():
+                data_component._release_data()
+
+    def _next_chunk(self, n_steps: int, keep_data: bool):
+        """Simulator _next_chunk method returning the SimulationResult of the samples of the next n_steps"""
+        from ..Results import SimulationResult
+        starts = self._trace_lengths() if(keep_data) else None
+        self._run_steps(n_steps)
+        chunk = SimulationResult.from_simulator(self, starts)
+        if(not keep_data):
+            # Bounded memory, yielded samples are dropped
+            self._release_data()
+        return chunk
+
+    def iter_chunks(self, n_steps: int, keep_data: bool = False):
+        """Simulator iter_chunks generator yielding a SimulationResult of the samples recorded in every n_steps"""
+        self._start_run()
         while(self.simulation_clock.running):
-            try:
-                for connection in self._connections:
-                        connection.simulate(self.simulation_clock)
+            chunk = self._next_chunk(n_steps, keep_data)
+            if(self.simulation_error is not None):
+                return
+            yield chunk
+            if(self._take_cancel()):
+                return
 
-                if(self._save_simulation and self.simulation_clock._should_sample()):
-                    self.store_data()
-            except Exception as e:
-                # Handle any unexpected exceptions
-                print(f"DEBUG:: An unexpected error occurred: {e}")
+    async def aiter_chunks(self, n_steps: int, keep_data: bool = False):
+        """Simulator aiter_chunks async generator, chunks run in a worker thread so the event loop stays free"""
+        import asyncio
+        loop = asyncio.get_running_loop()
+
+        self._start_run()
+        while(self.simulation_clock.running):
+            chunk = await loop.run_in_executor(None, self._next_chunk, n_steps, keep_data)
+            if(self.simulation_error is not None):
                 return
-            self.simulation_clock.update()
-        print(f"Simulations Complete: {len(self._simulation_data)} samples")
\ No newline at end of file
+            yield chunk
+            if(self._take_cancel()):
+                return
+
+    def simulate_parallel(self, max_workers:int|None=None, seed:int|None=None):
+        """Simulator simulate_parallel method running independent connection groups in worker processes"""
+        from .Parallel import simulate_parallel
+        simulate_parallel(self, max_workers, seed)
\ No newline at end of file
@@ -14,9 +14,21 @@ from .Signal import (
 )
 from .Signal import ArbitaryWaveGenerator
 
+from .Context import SimulationContext
+from .Context import get_active_context
+
 from .Simulator import Connection
+from .Simulator import DelayConnection
 from .Simulator import Simulator
 
+from .Health import HealthMonitor
+from .Health import SimulationDivergenceError
+
+from .Progress import SimulationProgress
+from .Progress import print_progress
+
+from .Periodic import PeriodicSteadyState
+
 __all__ = [
     "Clock",
     "TimeComponent",
@@ -30,6 +42,18 @@ __all__ = [
     "AlternatingPulseWave",
     "ArbitaryWaveGenerator",
     
+    "SimulationContext",
+    "get_active_context",
+
     "Connection",
+    "DelayConnection",
     "Simulator",
+
+    "HealthMonitor",
+    "SimulationDivergenceError",
+
+    "SimulationProgress",
+    "print_progress",
+
+    "PeriodicSteadyState",
 ]
\ No newline at end of file
@@ -2,9 +2,6 @@
 
 from enum import Enum
 
-from importlib import resources
-import json
-
 from numpy import (
     complexfloating,
     exp,
@@ -39,13 +36,22 @@ class LaserPyConstants:
     Simulation Constants for LaserPy_Quantum
     """
     _Constants: dict[str, float] = {}
+    _loaded: bool = False
+
+    _descriptors: dict[str, list] = {}
+    """LaserPyConstant class variables per key, invalidated by set"""
 
     @classmethod
     def load_from_json(cls, filepath=r'Constants.json'):
         """Loads constants from a JSON file."""
+        from importlib import resources
+        import json
+
         try:
             with resources.open_text("LaserPy_Quantum", filepath) as f:
                 cls._Constants = json.load(f)
+            cls._loaded = True
+            cls._invalidate(tuple(cls._descriptors))
         except FileNotFoundError:
             print(f"Error: The file '{filepath}' was not found.")
             exit()
@@ -53,15 +59,57 @@ class LaserPyConstants:
     @classmethod
     def get(cls, key, default=1.0):
         """Retrieves a constant value by key."""
+        if(not cls._loaded):
+            cls.load_from_json()
         return cls._Constants.get(key, default)
 
+    @classmethod
+    def get_all(cls):
+        """Retrieves a copy of all constants."""
+        if(not cls._loaded):
+            cls.load_from_json()
+        return dict(cls._Constants)
+
     @classmethod
     def set(cls, key, value):
         """Allows for runtime modification of a constant."""
+        if(not cls._loaded):
+            cls.load_from_json()
         cls._Constants[key] = value
+        cls._invalidate((key,))
+
+    @classmethod
+    def _invalidate(cls, keys: tuple[str,...]):
+        """Class variables of keys resolve again on their next access"""
+        for key in keys:
+            for descriptor in cls._descriptors.get(key, ()):
+                descriptor._restore()
+
+class LaserPyConstant:
+    """
+    LaserPyConstant descriptor class\n
+    Class variable loaded from LaserPyConstants on first access and again after LaserPyConstants.set of its key.
+    """
+    def __init__(self, key: str, default: float = 1.0):
+        self._key = key
+        self._default = default
+
+    def __set_name__(self, owner, name: str):
+        self._owner = owner
+        self._name = name
+        LaserPyConstants._descriptors.setdefault(self._key, []).append(self)
+
+    def __get__(self, instance, owner=None):
+        # Replace descriptor by the plain class variable until the constant changes
+        value = LaserPyConstants.get(self._key, self._default)
+        setattr(self._owner, self._name, value)
+        return value
+
+    def _restore(self):
+        """LaserPyConstant _restore method putting the descriptor back on its owner class"""
+        setattr(self._owner, self._name, self)
 
-# Load the constants at the runtime
-LaserPyConstants.load_from_json()
+# Constants are loaded from JSON at first use
 
 ERR_TOLERANCE = 1.0e-12
 
@@ -69,6 +117,7 @@ EMPTY_FIELD: complexfloating = ERR_TOLERANCE * exp(1j * 0)
 
 FIG_WIDTH = 12
 FIG_HEIGHT = 6
+FIG_DPI = 100
 
 # if __name__ == "__main__":
 #     constants = rust_optimizer.UniversalConstant
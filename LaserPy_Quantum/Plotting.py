@@ -0,0 +1,81 @@
+"""Plotting backend for LaserPy_Quantum"""
+
+from __future__ import annotations
+
+from numpy import (
+    ndarray,
+    asarray, arange, concatenate,
+    minimum, maximum, sort,
+    argmin, argmax
+)
+
+from .Constants import FIG_WIDTH, FIG_HEIGHT, FIG_DPI
+
+def decimate_minmax(x_data: ndarray, y_data: ndarray, n_bins: int):
+    """decimate trace to n_bins preserving the min and max of every bin"""
+    y_data = asarray(y_data)
+    n_samples = len(y_data)
+    if(n_samples <= 2 * n_bins):
+        return asarray(x_data), y_data
+
+    bin_size = -(-n_samples // n_bins)
+    n_full = (n_samples // bin_size) * bin_size
+    bins = y_data[:n_full].reshape(-1, bin_size)
+
+    # min/max positions of each bin in time order
+    offsets = arange(0, n_full, bin_size)
+    idx_min = argmin(bins, axis=1) + offsets
+    idx_max = argmax(bins, axis=1) + offsets
+    idx = concatenate((minimum(idx_min, idx_max), maximum(idx_min, idx_max)))
+
+    # Remaining partial bin
+    if(n_full < n_samples):
+        tail = y_data[n_full:]
+        idx = concatenate((idx, (n_full + argmin(tail), n_full + argmax(tail))))
+
+    idx = sort(idx)
+    return asarray(x_data)[idx], y_data[idx]
+
+def _new_figure(filepath: str|None):
+    """create figure, Agg rendered without pyplot if saving to file"""
+    if(filepath):
+        from matplotlib.figure import Figure
+        return Figure(figsize=(FIG_WIDTH, FIG_HEIGHT), dpi=FIG_DPI)
+
+    import matplotlib.pyplot as plt
+    return plt.figure(figsize=(FIG_WIDTH, FIG_HEIGHT), dpi=FIG_DPI)
+
+def _show_figure(figure, filepath: str|None):
+    """save figure to file or show it interactively"""
+    figure.tight_layout()
+    if(filepath):
+        figure.savefig(filepath)
+        return
+
+    import matplotlib.pyplot as plt
+    plt.show()
+
+def plot_series(title: str, x_data: ndarray, series: dict[str, dict[str, ndarray]], ylabels: dict[str, str],
+                xlabel: str|None = r"Time $(s)$", filepath: str|None = None, pixel_width: int|None = None, n_cols: int = 2, legend: bool = True):
+    """plot {key: {label: y_data}} series in subplots with min/max decimation"""
+    figure = _new_figure(filepath)
+
+    # Bins per subplot down to the pixel width
+    if(pixel_width is None):
+        pixel_width = int(FIG_WIDTH * FIG_DPI / n_cols)
+
+    n_rows = 1 + (len(series) >> 1) if(n_cols == 2) else -(-len(series) // n_cols)
+    for sub_plot_idx, key in enumerate(series, start=1):
+        axes = figure.add_subplot(n_rows, n_cols, sub_plot_idx)
+        for label, y_data in series[key].items():
+            axes.plot(*decimate_minmax(x_data, y_data, pixel_width), label=label)
+
+        if(xlabel):
+            axes.set_xlabel(xlabel)
+        axes.set_ylabel(ylabels[key])
+        axes.grid()
+        if(legend):
+            axes.legend()
+
+    figure.suptitle(title)
+    _show_figure(figure, filepath)
@@ -0,0 +1,69 @@
+"""Precision policy for LaserPy_Quantum"""
+
+from __future__ import annotations
+
+from array import array
+from typing import NamedTuple
+
+from numpy import (
+    ndarray, float32, float64, complex64, complex128,
+    asarray, finfo
+)
+
+class PrecisionPolicy(NamedTuple):
+    """
+    PrecisionPolicy class\n
+    A compact class for {'name', 'trace_typecode', 'field_dtype'}.\n
+    Laser integration always runs in float64, the policy sets stored traces and the passive field pipeline.
+    """
+    name: str
+    trace_typecode: str
+    field_dtype: type
+
+DOUBLE_PRECISION = PrecisionPolicy("double", 'd', complex128)
+"""float64 traces and complex128 replay fields"""
+
+MIXED_PRECISION = PrecisionPolicy("mixed", 'f', complex64)
+"""float32 traces and complex64 replay fields, phase traces stay float64"""
+
+_policy: PrecisionPolicy = DOUBLE_PRECISION
+
+def get_precision_policy():
+    """active PrecisionPolicy"""
+    return _policy
+
+def set_precision_policy(policy: PrecisionPolicy):
+    """set the PrecisionPolicy of traces stored after the next reset and of replayed fields"""
+    global _policy
+    _policy = policy
+
+def new_trace(values=(), double: bool = False):
+    """typed trace storage of the active policy, double keeps float64"""
+    return array('d' if(double) else _policy.trace_typecode, values)
+
+def as_field(electric_field: ndarray|complex):
+    """electric_field array in the field dtype of the active policy"""
+    return asarray(electric_field, dtype=_policy.field_dtype)
+
+# Error bounds
+# Unit roundoff u is half the machine epsilon: 2^-53 for float64, 2^-24 for float32.
+# A stored trace value is rounded once, its relative error is at most u.
+# A replayed field passes n linear devices, each a multiply-add of rounded coefficients,
+# the field amplitude error is at most (2n + 1) u |E| and the intensity error twice that.
+# Phase traces accumulate to large radians where float32 would lose the interference phase,
+# |phase| u is 1e-3 rad at 1e4 rad, so they are kept in float64 under every policy.
+
+def unit_roundoff(policy: PrecisionPolicy|None = None):
+    """unit roundoff of the stored traces of policy"""
+    policy = policy if(policy) else _policy
+    return float(finfo(float64 if(policy.trace_typecode == 'd') else float32).eps) / 2
+
+def trace_error_bound(policy: PrecisionPolicy|None = None):
+    """relative error bound of a stored trace value"""
+    return unit_roundoff(policy)
+
+def field_error_bound(n_devices: int, policy: PrecisionPolicy|None = None):
+    """relative intensity error bound of a field replayed through n_devices"""
+    policy = policy if(policy) else _policy
+    u = float(finfo(policy.field_dtype).eps) / 2
+    return 2 * (2 * n_devices + 1) * u
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import os
+
+from numpy import (
+    ndarray, dtype, float64, int32, int64, uint8,
+    ascontiguousarray, empty, concatenate, frombuffer, diff, cumsum, rint, finfo,
+    abs, isfinite, iscomplexobj
+)
+
+from .SimulationResult import SimulationResult
+
+# File layout: magic, compressed chunks, JSON index, index length
+ARCHIVE_MAGIC = b"LPQTRC1\0"
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+# Largest quantized value kept exact by int64 deltas
+_MAX_QUANTIZED = float(1 << 62)
+
+def _default_codec():
+    """best available compression codec, zstd then lz4 then zlib"""
+    for codec, module in (("zstd", "zstandard"), ("lz4", "lz4.frame")):
+        try:
+            __import__(module)
+            return codec
+        except ImportError:
+            pass
+    return "zlib"
+
+def _compress(data: bytes, codec: str, level: int|None):
+    """compress data with codec"""
+    if(codec == "zstd"):
+        import zstandard
+        return zstandard.ZstdCompressor(level=level if(level) else 3).compress(data)
+    elif(codec == "lz4"):
+        import lz4.frame
+        return lz4.frame.compress(data, compression_level=level if(level) else 0)
+    import zlib
+    return zlib.compress(data, level if(level) else 6)
+
+def _decompress(data: bytes, codec: str):
+    """decompress data with codec"""
+    if(codec == "zstd"):
+        import zstandard
+        return zstandard.ZstdDecompressor().decompress(data)
+    elif(codec == "lz4"):
+        import lz4.frame
+        return lz4.frame.decompress(data)
+    import zlib
+    return zlib.decompress(data)
+
+def _shuffle(stream: ndarray):
+    """byte-shuffle stream, all first bytes then all second bytes and so on"""
+    return stream.view(uint8).reshape(-1, stream.itemsize).T.tobytes()
+
+def _unshuffle(data: bytes, stream_dtype: dtype):
+    """inverse of _shuffle"""
+    return frombuffer(data, dtype=uint8).reshape(stream_dtype.itemsize, -1).T.copy().view(stream_dtype).ravel()
+
+def _real_dtype(column_dtype: dtype):
+    """real dtype of a float or complex column, int64 stream of integer and bool columns"""
+    if(column_dtype.kind == 'c'):
+        return dtype(f"f{column_dtype.itemsize // 2}")
+    elif(column_dtype.kind == 'f'):
+        return column_dtype
+    return dtype(int64)
+
+def _quantization_tolerance(tolerance: float, max_abs: float, column_dtype: dtype):
+    """half quantization step keeping the decoded error within tolerance, None when rounding alone exceeds it"""
+    # Decoded values are rounded to the column dtype, scaling rounds in float64
+    rounding = max_abs * (float(finfo(_real_dtype(column_dtype)).eps) / 2 + 2 * float(finfo(float64).eps))
+    return tolerance - rounding if(rounding < tolerance / 2) else None
+
+def encode_chunk(values: ndarray, tolerance: float|None, codec: str, level: int|None = None):
+    """delta, byte-shuffle and compress one chunk, quantized to tolerance when given"""
+    if(iscomplexobj(values)):
+        # Real and imaginary parts as one stream
+        values = concatenate((values.real, values.imag))
+    elif(values.dtype.kind not in "f"):
+        # Integer and bool columns as exact int64 deltas
+        values = values.astype(int64)
+
+    if(tolerance):
+        # Absolute error at most tolerance, float32 columns are scaled in float64
+        stream = diff(rint(values.astype(float64) / (2 * tolerance)).astype(int64), prepend=int64(0))
+    else:
+        # Exact deltas of the float bit patterns, integer wraparound is reversible
+        bits = values.view(int64 if(values.itemsize == 8) else int32)
+        stream = diff(bits, prepend=bits.dtype.type(0))
+    return _compress(_shuffle(stream), codec, level)
+
+def decode_chunk(data: bytes, column_dtype: dtype, tolerance: float|None, codec: str):
+    """inverse of encode_chunk"""
+    real_dtype = _real_dtype(column_dtype)
+    if(tolerance):
+        values = (cumsum(_unshuffle(_decompress(data, codec), dtype(int64))) * (2 * tolerance)).astype(real_dtype)
+    else:
+        bits_dtype = dtype(int64 if(real_dtype.itemsize == 8) else int32)
+        values = cumsum(_unshuffle(_decompress(data, codec), bits_dtype), dtype=bits_dtype).view(real_dtype)
+
+    if(column_dtype.kind not in "fc"):
+        return values.astype(column_dtype)
+    elif(column_dtype.kind == 'c'):
+        n_values = len(values) // 2
+        complex_values = empty(n_values, dtype=column_dtype)
+        complex_values.real = values[:n_values]
+        complex_values.imag = values[n_values:]
+        return complex_values
+    return values
+
+def write_archive(filepath: str, columns: Mapping[str, ndarray]|SimulationResult, units: dict[str, str]|None = None,
+                chunk_size: int = DEFAULT_CHUNK_SIZE, tolerance: float|dict[str, float]|None = None,
+                codec: str|None = None, level: int|None = None):
+    """write columns as a chunked compressed trace archive, tolerance per column enables bounded lossy quantization"""
+    import json
+
+    if(isinstance(columns, SimulationResult)):
+        units = columns.get_units() if(units is None) else units
+        columns = columns.to_dict()
+    units = units if(units) else {}
+    codec = codec if(codec) else _default_codec()
+
+    index = {'codec': codec, 'chunk_size': chunk_size, 'columns': {}}
+    temp_filepath = f"{filepath}.{os.getpid()}.tmp"
+    with open(temp_filepath, "wb") as f:
+        f.write(ARCHIVE_MAGIC)
+        for key, values in columns.items():
+            values = ascontiguousarray(values)
+            column_tolerance = tolerance.get(key) if(isinstance(tolerance, dict)) else tolerance
+
+            # Time and integer columns stay exact, integer columns keep their dtype
+            if(column_tolerance and (key == 'time' or values.dtype.kind not in "fc")):
+                column_tolerance = None
+            if(column_tolerance and len(values)):
+                max_abs = float(abs(values).max())
+                requested_tolerance = column_tolerance
+                column_tolerance = _quantization_tolerance(column_tolerance, max_abs, values.dtype) if(isfinite(max_abs)) else None
+                if(column_tolerance is None or max_abs / (2 * column_tolerance) > _MAX_QUANTIZED):
+                    print(f"WARNING:: {key} has padding or exceeds the quantization range of tolerance {requested_tolerance}, stored lossless")
+                    column_tolerance = None
+
+            chunks = []
+            for start in range(0, len(values), chunk_size):
+                data = encode_chunk(values[start:start + chunk_size], column_tolerance, codec, level)
+                chunks.append((f.tell(), len(data), min(chunk_size, len(values) - start)))
+                f.write(data)
+
+            index['columns'][key] = {'dtype': values.dtype.str, 'tolerance': column_tolerance,
+                                    'units': units.get(key, ""), 'n_samples': len(values), 'chunks': chunks}
+
+        index_data = json.dumps(index).encode()
+        f.write(index_data)
+        f.write(len(index_data).to_bytes(8, "little"))
+    os.replace(temp_filepath, filepath)
+
+class TraceArchive:
+    """
+    TraceArchive class\n
+    Reader of a chunked compressed trace archive with random chunk access.
+    """
+    def __init__(self, filepath: str):
+        import json
+
+        self._filepath = filepath
+        self._file = open(filepath, "rb")
+
+        if(self._file.read(len(ARCHIVE_MAGIC)) != ARCHIVE_MAGIC):
+            self._file.close()
+            raise ValueError(f"{filepath} is not a LaserPy_Quantum trace archive")
+
+        self._file.seek(-8, os.SEEK_END)
+        index_size = int.from_bytes(self._file.read(8), "little")
+        self._file.seek(-8 - index_size, os.SEEK_END)
+        index = json.loads(self._file.read(index_size))
+
+        self._codec: str = index['codec']
+        self._chunk_size: int = index['chunk_size']
+        self._columns: dict[str, dict] = index['columns']
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._columns
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __getitem__(self, key: str) -> ndarray:
+        """TraceArchive full column"""
+        return self.read(key)
+
+    def keys(self):
+        """TraceArchive keys method"""
+        return tuple(self._columns)
+
+    def get_units(self):
+        """TraceArchive get_units method"""
+        return {key: column['units'] for key, column in self._columns.items()}
+
+    def n_chunks(self, key: str):
+        """TraceArchive n_chunks method"""
+        return len(self._columns[key]['chunks'])
+
+    def get_chunk(self, key: str, chunk_idx: int):
+        """TraceArchive get_chunk method decoding one chunk of a column"""
+        column = self._columns[key]
+        offset, n_bytes, _ = column['chunks'][chunk_idx]
+        self._file.seek(offset)
+        return decode_chunk(self._file.read(n_bytes), dtype(column['dtype']), column['tolerance'], self._codec)
+
+    def read(self, key: str, start: int = 0, stop: int|None = None):
+        """TraceArchive read method of samples [start, stop), decoding only overlapping chunks"""
+        column = self._columns[key]
+        n_samples = column['n_samples']
+        start, stop, _ = slice(start, stop).indices(n_samples)
+        if(stop <= start):
+            return empty(0, dtype=dtype(column['dtype']))
+
+        first_chunk, last_chunk = start // self._chunk_size, (stop - 1) // self._chunk_size
+        values = concatenate([self.get_chunk(key, chunk_idx) for chunk_idx in range(first_chunk, last_chunk + 1)])
+        offset = first_chunk * self._chunk_size
+        return values[start - offset:stop - offset]
+
+    def to_result(self):
+        """TraceArchive to_result method returning a SimulationResult"""
+        columns = {key: self.read(key) for key in self._columns if(key != 'time')}
+        time_data = self.read('time') if('time' in self._columns) else empty(0)
+        return SimulationResult(time_data, columns, self.get_units())
+
+    def close(self):
+        """TraceArchive close method"""
+        self._file.close()
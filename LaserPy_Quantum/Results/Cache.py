@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+from enum import Enum
+from types import CodeType, FunctionType, MethodType, ModuleType
+
+import os
+import sys
+
+from numpy import (
+    ndarray, generic, int64,
+    dtype,
+    ascontiguousarray, frombuffer, iscomplexobj, load, savez
+)
+
+from ..Components import Simulator
+from ..Components.Component import _instance_attributes
+from ..Components.Signal import LangevinNoise
+
+from .SimulationResult import SimulationResult
+
+from ..Constants import LaserPyConstants
+from ..Constants import LaserPyConstant
+
+from ..Precision import new_trace
+
+# Library classes are versioned with the package, user classes are hashed by code
+_PACKAGE = __name__.split('.')[0]
+
+def _is_library_module(module_name: str|None):
+    """True for modules of this package, the standard library and installed packages"""
+    root = (module_name or "builtins").split('.')[0]
+    if(root in (_PACKAGE, "builtins") or root in sys.stdlib_module_names):
+        return True
+    filepath = getattr(sys.modules.get(root), "__file__", None) or ""
+    return "site-packages" in filepath or "dist-packages" in filepath
+
+# Bookkeeping attributes not part of a configuration
+_EXCLUDED_KEYS = frozenset(('_simulation_data', '_trace_list_keys', '_data_getter', '_input_port_kwargs', '_state_dtype',
+                            'uid', 'class_id', 'simulation_error', 'raise_on_error', '_SINGLETON', '_time_tags', '_health_monitor',
+                            '_progress_callback', '_progress_steps', '_progress_seconds', '_cancel_requested', 'cancelled',
+                            '_next_check', '_next_progress_step', '_next_cancel_check', '_run_started', '_last_progress',
+                            '_periodic_steady_state'))
+
+class UncacheableConfiguration(Exception):
+    """
+    UncacheableConfiguration class\n
+    Raised for configurations without a reproducible result, like unseeded noise.
+    """
+
+class _ConfigHasher:
+    """
+    _ConfigHasher class\n
+    Canonical content hash of a Simulator configuration graph.
+    """
+    def __init__(self):
+        from hashlib import blake2b
+        self._hash = blake2b(digest_size=20)
+        self._seen: dict[int, int] = {}
+        self._classes: set[type] = set()
+
+    def _feed(self, tag: str, payload: bytes = b""):
+        """_ConfigHasher _feed method"""
+        self._hash.update(tag.encode())
+        self._hash.update(len(payload).to_bytes(8, "little"))
+        self._hash.update(payload)
+
+    def _update_class(self, cls: type):
+        """_ConfigHasher _update_class method for effective class constants"""
+        self._feed("class", f"{cls.__module__}.{cls.__qualname__}".encode())
+        if(cls in self._classes):
+            return
+        self._classes.add(cls)
+        for base in cls.__mro__:
+            # User subclasses like a custom WaveSignal by method code and the globals it reads
+            if(not _is_library_module(base.__module__)):
+                for key, value in sorted(vars(base).items()):
+                    if(isinstance(value, (FunctionType, staticmethod, classmethod))):
+                        self._feed("method", key.encode())
+                        self.update(getattr(value, "__func__", value))
+
+            for key, value in sorted(vars(base).items()):
+                if(isinstance(value, LaserPyConstant)):
+                    # Resolve lazily loaded class constants
+                    value = getattr(base, key)
+                if(not key.startswith("__") and isinstance(value, (int, float)) and not isinstance(value, bool)):
+                    self._feed(key, repr(value).encode())
+
+    def update(self, value):
+        """_ConfigHasher update method"""
+        from numpy.random import Generator
+        if(value is None or isinstance(value, (bool, int, float, complex, str, Enum))):
+            self._feed(type(value).__name__, repr(value).encode())
+        elif(isinstance(value, (ndarray, generic))):
+            array_value = ascontiguousarray(value)
+            self._feed(f"ndarray{array_value.dtype.str}{array_value.shape}", array_value.tobytes())
+        elif(isinstance(value, (tuple, list))):
+            self._feed(f"{type(value).__name__}{len(value)}")
+            for item in value:
+                self.update(item)
+        elif(isinstance(value, dict)):
+            self._feed(f"dict{len(value)}")
+            for key in sorted(value, key=repr):
+                self.update(key)
+                self.update(value[key])
+        elif(isinstance(value, Generator)):
+            self.update(value.bit_generator.state)
+        elif(id(value) in self._seen):
+            # Shared or cyclic references by position
+            self._feed("ref", str(self._seen[id(value)]).encode())
+        elif(isinstance(value, FunctionType)):
+            # Functions by name, code, defaults, closure and the module globals they read
+            self._seen[id(value)] = len(self._seen)
+            self._feed("function", f"{value.__module__}.{value.__qualname__}".encode())
+            if(_is_library_module(value.__module__)):
+                return
+            names = self._update_code(value.__code__)
+            self.update(value.__defaults__)
+            self.update(value.__kwdefaults__)
+            for cell in (value.__closure__ or ()):
+                self.update(cell.cell_contents)
+            for name in sorted(names):
+                if(name in value.__globals__):
+                    self._feed("global", name.encode())
+                    self._update_global(value.__globals__[name])
+        elif(isinstance(value, MethodType)):
+            self.update(value.__func__)
+            self.update(value.__self__)
+        elif(isinstance(value, LangevinNoise) and value._rng is None):
+            raise UncacheableConfiguration(f"{value} has no seed")
+        elif(hasattr(value, "__dict__") or hasattr(type(value), "__slots__")):
+            # Components, waves, noises and other configuration objects
+            self._seen[id(value)] = len(self._seen)
+            self._update_class(type(value))
+            self._update_attributes(value)
+        elif(callable(value)):
+            # Functions and builtin methods by qualified name
+            self._feed("callable", f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}".encode())
+            owner = getattr(value, "__self__", None)
+            if(isinstance(owner, Generator)):
+                self.update(owner)
+        else:
+            raise UncacheableConfiguration(f"cannot hash {type(value).__name__}")
+
+    def _update_code(self, code: CodeType) -> set[str]:
+        """_ConfigHasher _update_code method for bytecode and constants, returns the global names of code"""
+        self._feed("code", code.co_code)
+        names = set(code.co_names)
+        for const in code.co_consts:
+            if(isinstance(const, CodeType)):
+                # Nested functions, lambdas and comprehensions
+                names |= self._update_code(const)
+            else:
+                self._feed("const", repr(const).encode())
+        return names
+
+    def _update_global(self, value):
+        """_ConfigHasher _update_global method for a module global read by hashed code"""
+        if(isinstance(value, ModuleType)):
+            self._feed("module", value.__name__.encode())
+        elif(isinstance(value, type)):
+            self._update_class(value)
+        else:
+            self.update(value)
+
+    def _update_attributes(self, value):
+        """_ConfigHasher _update_attributes method for instance attributes"""
+        attributes = _instance_attributes(value)
+        for key in sorted(attributes):
+            if(key in _EXCLUDED_KEYS):
+                continue
+            self._feed("attr", key.encode())
+            self.update(attributes[key])
+
+    def hexdigest(self):
+        """_ConfigHasher hexdigest method"""
+        return self._hash.hexdigest()
+
+def configuration_hash(simulator: Simulator) -> str:
+    """content hash of the Simulator graph, constants, waves, Clock settings and noise seeds"""
+    hasher = _ConfigHasher()
+    hasher.update(LaserPyConstants.get_all())
+    hasher.update(simulator._save_simulation)
+    hasher.update(simulator.simulation_clock)
+    hasher.update(list(simulator._connections))
+    return hasher.hexdigest()
+
+def _positional_columns(simulator: Simulator) -> dict[str, str]:
+    """map of Simulator column names to class_id independent positional names"""
+    aliases = {'time': 'time'}
+    for idx, component in enumerate(simulator._components):
+        for sub_idx, data_component in enumerate(component._get_data_components()):
+            for key in data_component._simulation_data:
+                aliases[data_component._column_name(key)] = f"{idx}.{sub_idx}.{key}"
+    return aliases
+
+def _positional_state(state: ndarray) -> ndarray:
+    """state record viewed with positional field names, Component names like SPD_π need a non ASCII npy header"""
+    fields = state.dtype.fields
+    return state.view(dtype({'names': [f"f{idx}" for idx in range(len(state.dtype.names))],
+                             'formats': [fields[name][0] for name in state.dtype.names],
+                             'offsets': [fields[name][1] for name in state.dtype.names],
+                             'itemsize': state.dtype.itemsize}))
+
+def _final_entries(simulator: Simulator) -> dict[str, ndarray]:
+    """final state record and time tags of a simulated Simulator, restored on a cache hit"""
+    entries = {'__state__': _positional_state(simulator.snapshot_state())}
+    for idx, component in enumerate(simulator._components):
+        for sub_idx, data_component in enumerate(component._get_data_components()):
+            if(hasattr(data_component, '_time_tags')):
+                entries[f"{idx}.{sub_idx}.__time_tags__"] = frombuffer(data_component._time_tags, dtype=int64)
+    return entries
+
+def _restore_simulator(simulator: Simulator, columns: dict[str, ndarray]):
+    """Simulator state, Clock, traces and time tags as after the cached run"""
+    from array import array
+    simulator.restore_state(columns['__state__'])
+    simulator.simulation_clock.running = False
+
+    if(simulator._save_simulation):
+        simulator._simulation_data = new_trace(columns['time'], double=True)
+    for idx, component in enumerate(simulator._components):
+        for sub_idx, data_component in enumerate(component._get_data_components()):
+            for key in data_component._simulation_data:
+                alias = f"{idx}.{sub_idx}.{key}"
+                if(alias in columns):
+                    if(iscomplexobj(columns[alias]) and key not in data_component._trace_list_keys):
+                        data_component._trace_list_keys += (key,)
+                    data_component._simulation_data[key] = data_component._new_trace(key, columns[alias])
+            data_component._data_getter = None
+            if(f"{idx}.{sub_idx}.__time_tags__" in columns):
+                data_component._time_tags = array('q', columns[f"{idx}.{sub_idx}.__time_tags__"].tobytes())
+
+class ResultCache:
+    """
+    ResultCache class\n
+    On-disk content addressed Simulator result cache with LRU eviction.
+    """
+    def __init__(self, directory: str, max_bytes: int = 1 << 30, name: str = "default_result_cache"):
+        self.name = name
+        self._directory = directory
+        self._max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(directory, exist_ok=True)
+
+    def _filepath(self, key: str):
+        """ResultCache _filepath method"""
+        return os.path.join(self._directory, f"{key}.npz")
+
+    def get(self, key: str) -> dict[str, ndarray]|None:
+        """ResultCache get method, None on a miss"""
+        filepath = self._filepath(key)
+        try:
+            with load(filepath) as data:
+                columns = {column_key: data[column_key] for column_key in data.files}
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+
+        # Recently used by modification time
+        os.utime(filepath)
+        return columns
+
+    def put(self, key: str, columns: dict[str, ndarray]):
+        """ResultCache put method"""
+        filepath = self._filepath(key)
+        temp_filepath = f"{filepath}.{os.getpid()}.tmp.npz"
+        savez(temp_filepath, **columns)
+        os.replace(temp_filepath, filepath)
+        self._evict()
+
+    def _evict(self):
+        """ResultCache _evict method removing least recently used entries above max_bytes"""
+        entries = []
+        for filename in os.listdir(self._directory):
+            if(filename.endswith(".npz") and ".tmp" not in filename):
+                stat = os.stat(os.path.join(self._directory, filename))
+                entries.append((stat.st_mtime, stat.st_size, filename))
+
+        total_bytes = sum(entry[1] for entry in entries)
+        for _, size, filename in sorted(entries):
+            if(total_bytes <= self._max_bytes):
+                break
+            os.remove(os.path.join(self._directory, filename))
+            total_bytes -= size
+
+    def clear(self):
+        """ResultCache clear method"""
+        for filename in os.listdir(self._directory):
+            if(filename.endswith(".npz")):
+                os.remove(os.path.join(self._directory, filename))
+
+    def simulate(self, simulator: Simulator):
+        """ResultCache simulate method returning the SimulationResult, 
+        a hit restores Component states, Clock, traces and time tags as after the run"""
+        try:
+            key = configuration_hash(simulator)
+        except UncacheableConfiguration as e:
+            print(f"{self.name} bypassed: {e}")
+            simulator.simulate()
+            return simulator.get_result()
+
+        aliases = _positional_columns(simulator)
+        columns = self.get(key)
+        # Entries without a final state predate state restoring, state fields are positional
+        if(columns is not None and '__state__' in columns and
+           len(columns['__state__'].dtype.names) == len(simulator.snapshot_state().dtype.names)):
+            self.hits += 1
+            _restore_simulator(simulator, columns)
+            return SimulationResult(columns['time'], {column_name: columns[alias] for column_name, alias in aliases.items() 
+                                                      if(alias in columns and column_name != 'time')})
+
+        self.misses += 1
+        simulator.simulate()
+        result = simulator.get_result()
+        if(simulator.simulation_error is None):
+            entries = {aliases[column_name]: value for column_name, value in result.to_dict().items()}
+            entries.update(_final_entries(simulator))
+            self.put(key, entries)
+        return result
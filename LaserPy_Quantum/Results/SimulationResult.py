@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from numpy import (
+    ndarray, dtype, float64, complex128,
+    empty, array, iscomplexobj,
+    nan
+)
+
+class SimulationResult:
+    """
+    SimulationResult class\n
+    Columns of all Components aligned on one time index, as zero-copy views of one buffer per dtype.
+    """
+    def __init__(self, time_data: ndarray, columns: dict[str, Sequence|ndarray], units: dict[str, str]|None = None):
+        self._time = array(time_data, dtype=float64)
+        """time index of SimulationResult"""
+
+        self._units = dict(units) if(units) else {}
+        """column units of SimulationResult"""
+
+        # One contiguous (n_columns, n_samples) buffer per dtype
+        n_samples = len(self._time)
+        column_dtypes = {key: dtype(complex128) if(self._is_complex(value)) else dtype(float64) for key, value in columns.items()}
+        self._buffers: dict[dtype, ndarray] = {}
+        self._index: dict[str, tuple[dtype, int]] = {}
+        n_rows: dict[dtype, int] = {}
+        for key, column_dtype in column_dtypes.items():
+            # Index keeps the column order
+            self._index[key] = (column_dtype, n_rows.get(column_dtype, 0))
+            n_rows[column_dtype] = self._index[key][1] + 1
+        for column_dtype, n_columns in n_rows.items():
+            self._buffers[column_dtype] = empty((n_columns, n_samples), dtype=column_dtype)
+
+        # Shorter columns started late, right aligned on the time index
+        for key, value in columns.items():
+            column = self._view(key)
+            n_values = min(len(value), n_samples)
+            column[:n_samples - n_values] = nan
+            if(n_values):
+                column[n_samples - n_values:] = value[len(value) - n_values:]
+
+        for buffer in self._buffers.values():
+            buffer.setflags(write=False)
+
+    @staticmethod
+    def _is_complex(value: Sequence|ndarray):
+        """SimulationResult _is_complex method"""
+        if(isinstance(value, ndarray)):
+            return iscomplexobj(value)
+        return len(value) > 0 and isinstance(value[0], complex)
+
+    def _view(self, key: str) -> ndarray:
+        """SimulationResult _view method"""
+        column_dtype, row = self._index[key]
+        return self._buffers[column_dtype][row]
+
+    @classmethod
+    def from_simulator(cls, simulator, starts: dict[str, int]|None = None):
+        """SimulationResult from_simulator method copying stored data once, from starts sample of every column"""
+        starts = starts if(starts) else {}
+        columns: dict[str, Sequence] = {}
+        units: dict[str, str] = {'time': simulator._simulation_data_units}
+        for component in simulator._components:
+            for data_component in component._get_data_components():
+                if(not data_component._save_simulation):
+                    continue
+                data_units = data_component.get_data_units()
+                for key, data_list in data_component._simulation_data.items():
+                    column_name = data_component._column_name(key)
+                    columns[column_name] = data_list[starts.get(column_name, 0):]
+                    units[column_name] = data_units.get(key, "")
+        return cls(simulator._simulation_data[starts.get('time', 0):], columns, units)
+
+    def __repr__(self) -> str:
+        return f"SimulationResult: {len(self._index)} columns x {len(self._time)} samples"
+
+    def __len__(self) -> int:
+        return len(self._time)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __contains__(self, key: str) -> bool:
+        return key == 'time' or key in self._index
+
+    def __getitem__(self, key: str) -> ndarray:
+        """SimulationResult column view"""
+        if(key == 'time'):
+            return self._time
+        return self._view(key)
+
+    @property
+    def time(self) -> ndarray:
+        """SimulationResult time index"""
+        return self._time
+
+    def keys(self):
+        """SimulationResult keys method"""
+        return ('time',) + tuple(self._index)
+
+    def get_units(self):
+        """SimulationResult get_units method"""
+        return dict(self._units)
+
+    def select(self, prefix: str):
+        """SimulationResult select method for columns of one Component, e.g. 'master_laser_0'"""
+        return {key[len(prefix) + 1:]: self._view(key) for key in self._index if(key.startswith(prefix + "."))}
+
+    def to_dict(self):
+        """SimulationResult to_dict method of zero-copy views"""
+        columns = {'time': self._time}
+        for key in self._index:
+            columns[key] = self._view(key)
+        return columns
+
+    def to_numpy(self, complex_columns: bool = False):
+        """SimulationResult to_numpy method returning (keys, (n_columns, n_samples) buffer view)"""
+        column_dtype = dtype(complex128) if(complex_columns) else dtype(float64)
+        if(column_dtype not in self._buffers):
+            return (), empty((0, len(self._time)), dtype=column_dtype)
+        keys = tuple(key for key in self._index if(self._index[key][0] == column_dtype))
+        return keys, self._buffers[column_dtype]
+
+    def to_archive(self, filepath: str, chunk_size: int = 1 << 16, tolerance: float|dict[str, float]|None = None,
+                codec: str|None = None):
+        """SimulationResult to_archive method writing a chunked compressed TraceArchive"""
+        from .Archive import write_archive
+        write_archive(filepath, self, chunk_size=chunk_size, tolerance=tolerance, codec=codec)
+
+    def to_pandas(self):
+        """SimulationResult to_pandas method, float columns share the result buffer"""
+        try:
+            import pandas as pd
+        except ImportError:
+            print("pandas is required for SimulationResult to_pandas")
+            return None
+
+        keys, float_buffer = self.to_numpy()
+        frame = pd.DataFrame(float_buffer.T, index=pd.Index(self._time, name='time'), columns=list(keys), copy=False)
+        for key in self.to_numpy(complex_columns=True)[0]:
+            frame.insert(tuple(self._index).index(key), key, self._view(key))
+        return frame
+
+    def to_arrow(self):
+        """SimulationResult to_arrow method, float columns are zero-copy Arrow arrays"""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            print("pyarrow is required for SimulationResult to_arrow")
+            return None
+
+        arrays = [pa.array(self._time)]
+        names = ['time']
+        for key in self._index:
+            column = self._view(key)
+            if(iscomplexobj(column)):
+                # Arrow has no complex type, stored as real and imaginary columns
+                arrays += [pa.array(column.real), pa.array(column.imag)]
+                names += [f"{key}.real", f"{key}.imag"]
+            else:
+                arrays.append(pa.array(column))
+                names.append(key)
+        return pa.Table.from_arrays(arrays, names=names)
+
+    def to_parquet(self, filepath: str, compression: str = "zstd"):
+        """SimulationResult to_parquet method"""
+        table = self.to_arrow()
+        if(table is None):
+            return
+
+        import pyarrow.parquet as pq
+        pq.write_table(table, filepath, compression=compression)
@@ -0,0 +1,21 @@
+""" Results for LaserPy_Quantum """
+
+from .SimulationResult import SimulationResult
+
+from .Archive import TraceArchive
+from .Archive import write_archive
+
+from .Cache import ResultCache
+from .Cache import UncacheableConfiguration
+from .Cache import configuration_hash
+
+__all__ = [
+    "SimulationResult",
+
+    "TraceArchive",
+    "write_archive",
+
+    "ResultCache",
+    "UncacheableConfiguration",
+    "configuration_hash"
+]
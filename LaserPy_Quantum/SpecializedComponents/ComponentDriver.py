@@ -1,3 +1,11 @@
+from collections.abc import Sequence
+
+from numpy import (
+    ndarray, uint8, int64,
+    asarray, empty, full, where, floor, rint, cumsum,
+    ones
+)
+
 from ..Components import Clock
 from ..Components import TimeComponent
 
@@ -8,6 +16,10 @@ class CurrentDriver(TimeComponent):
     """ 
     CurrentDriver class
     """
+    __slots__ = ('_AWG', '_modulation_OFF', '_modulation_ON', '_modulation_function')
+
+    _state_keys = ('_data',)
+
     def __init__(self, AWG:ArbitaryWaveGenerator, name:str="default_current_driver"):
         super().__init__(name)
 
@@ -76,4 +88,104 @@ class CurrentDriver(TimeComponent):
         """CurrentDriver output port method"""
         #return super().output_port(kwargs)
         kwargs['current'] = self._data
-        return kwargs
\ No newline at end of file
+        return kwargs
+
+# Feedback taps (a, b) of PRBS polynomials x^b + x^a + 1
+PRBS_TAPS = {7: (6, 7), 9: (5, 9), 11: (9, 11), 15: (14, 15), 20: (3, 20), 23: (18, 23), 31: (28, 31)}
+
+# Clock steps of precomputed current per block
+CURRENT_BLOCK = 1 << 16
+
+def prbs(order: int, n_bits: int|None = None, seed: int = 1):
+    """pseudo random bit sequence of a PRBS order, one period by default"""
+    if(order not in PRBS_TAPS):
+        print(f"PRBS{order} not in {tuple(PRBS_TAPS)}, PRBS7 used")
+        order = 7
+    tap_a, tap_b = PRBS_TAPS[order]
+    n_bits = n_bits if(n_bits) else (1 << order) - 1
+
+    bits = empty(n_bits + tap_b, dtype=uint8)
+    bits[:tap_b] = [(seed >> idx) & 1 for idx in range(tap_b)]
+    if(not bits[:tap_b].any()):
+        bits[:tap_b] = 1
+
+    # b[n] = b[n - a] xor b[n - b], tap_a bits per slice
+    for start in range(tap_b, len(bits), tap_a):
+        stop = min(start + tap_a, len(bits))
+        bits[start:stop] = bits[start - tap_a:stop - tap_a] ^ bits[start - tap_b:stop - tap_b]
+    return bits[tap_b:]
+
+class BitSequenceDriver(CurrentDriver):
+    """ 
+    BitSequenceDriver class\n
+    CurrentDriver with Modulation_ON for 1 bits and Modulation_OFF for 0 bits of every t_unit symbol, precomputed on the Clock grid.
+    """
+    __slots__ = ('_bits', '_t_unit', '_t_start', '_dt', '_block_t', '_current_block')
+
+    def __init__(self, AWG:ArbitaryWaveGenerator, name:str="default_bit_sequence_driver"):
+        super().__init__(AWG, name)
+
+        self._bits: ndarray = ones(1, dtype=uint8)
+        """bit sequence for BitSequenceDriver, repeated cyclically"""
+
+        self._t_unit: float = 1.0
+        """symbol duration for BitSequenceDriver"""
+
+        self._t_start: float = 0.0
+        """time of the first symbol for BitSequenceDriver"""
+
+        # Precomputed current block
+        self._dt: float = 0.0
+        self._block_t: float = 0.0
+        self._current_block: ndarray = empty(0)
+
+    def set(self, modulation_OFF:ArbitaryWave|tuple[ArbitaryWave,...], modulation_ON:ArbitaryWave|tuple[ArbitaryWave,...]|None=None, 
+            bits: Sequence[int]|ndarray|str = "PRBS7", t_unit: float = 1e-9, t_start: float = 0.0):
+        """BitSequenceDriver set method, bits is a bit array or a 'PRBS<order>' spec"""
+        #return super().set(modulation_OFF, modulation_ON, modulation_function)
+        super().set(modulation_OFF, modulation_ON)
+
+        if(isinstance(bits, str)):
+            bits = prbs(int(bits.upper().removeprefix("PRBS")))
+        self._bits = (asarray(bits) != 0).astype(uint8)
+        self._t_unit = t_unit
+        self._t_start = t_start
+        self._current_block = empty(0)
+
+    def symbol_index(self, t: ndarray|float):
+        """BitSequenceDriver symbol_index method of times t"""
+        # Accumulated Clock time rounding at symbol edges
+        return floor((asarray(t) - self._t_start) / self._t_unit + 1e-9).astype(int64)
+
+    def current_samples(self, t: ndarray):
+        """BitSequenceDriver current_samples method at every time of t"""
+        t = asarray(t, dtype=float)
+        current_OFF = self._AWG.samples(t, self._modulation_OFF)
+        if(not self._modulation_ON):
+            return current_OFF
+
+        bits = self._bits[self.symbol_index(t) % len(self._bits)]
+        return where(bits == 1, self._AWG.samples(t, self._modulation_ON), current_OFF)
+
+    def _compute_block(self, t: float):
+        """BitSequenceDriver _compute_block method of CURRENT_BLOCK Clock steps from t"""
+        # Sequential sums reproduce the accumulated Clock time exactly
+        steps = full(CURRENT_BLOCK, self._dt)
+        steps[0] = t
+        self._block_t = t
+        self._current_block = self.current_samples(cumsum(steps))
+
+    def simulate(self, clock: Clock):
+        """BitSequenceDriver simulate method"""
+        #return super().simulate(clock)
+        if(clock.dt != self._dt):
+            self._dt = clock.dt
+            self._current_block = empty(0)
+
+        # Clock step within the precomputed block
+        step = int(rint((clock.t - self._block_t) / self._dt))
+        if(step < 0 or step >= len(self._current_block)):
+            self._compute_block(clock.t)
+            step = 0
+        self._data = float(self._current_block[step])
+        return self._data
@@ -3,6 +3,7 @@ from __future__ import annotations
 from numpy import (
     complexfloating,
     ndarray,
+    square, zeros_like,
     pi
 )
 
@@ -15,9 +16,14 @@ from .PhotonDetector import SinglePhotonDetector
 
 from .SimpleDevices import PhaseSample
 from .SimpleDevices import BeamSplitter
+from .SimpleDevices import DelayLine
 
 from ..Constants import EMPTY_FIELD
 
+from ..Analysis.Calibration import calibrate_amzi
+from ..Analysis.TimeTags import TimeTagStream
+from ..Analysis.TimeTags import TIME_TAG_RESOLUTION
+
 from ..utils import display_class_instances_data
 
 # TODO multiport
@@ -27,9 +33,12 @@ class AsymmetricMachZehnderInterferometer(Component):
     """
     AsymmetricMachZehnderInterferometer class
     """
+    _state_keys = ('_electric_field', '_electric_field_port2', '_delay_ticks')
+
     def __init__(self, clock:Clock, time_delay:float, 
                 splitting_ratio_ti:float = 0.5, splitting_ratio_tf:float = 0.5,
-                save_simulation: bool = False, name: str = "default_asymmetric_machzehnder_interferometer"):
+                save_simulation: bool = False, delay_line: DelayLine|None = None, 
+                name: str = "default_asymmetric_machzehnder_interferometer"):
         super().__init__(name)
 
         # Simulation parameters
@@ -54,9 +63,11 @@ class AsymmetricMachZehnderInterferometer(Component):
         self._electric_field_port2: complexfloating = EMPTY_FIELD
         """electric_field_port2 data for AsymmetricMachZehnderInterferometer"""
 
-        # Delay buffer
-        self._buffer_size: int = max(1, int(time_delay / clock.dt))
-        self._field_buffer: list[complexfloating] = []
+        # Long arm tap on a DelayLine of the input field, shared lines store each sample once
+        self._delay_line = delay_line if(delay_line) else DelayLine(clock, name="long_arm_delay_line")
+        self._delay_tap: int = self._delay_line.add_tap(time_delay)
+        self._delay_ticks: int = self._delay_line._ticks
+        self._buffer_size: int = self._delay_line.get_delay_samples(self._delay_tap)
 
     def _handle_SPD_data(self):
         """AsymmetricMachZehnderInterferometer _handle_SPD_data method"""
@@ -68,6 +79,17 @@ class AsymmetricMachZehnderInterferometer(Component):
             return True
         return False
 
+    def _get_data_components(self):
+        """AsymmetricMachZehnderInterferometer _get_data_components method"""
+        #return super()._get_data_components()
+        return (self._SPD0, self._SPD1)
+
+    def _get_state_components(self):
+        """AsymmetricMachZehnderInterferometer _get_state_components method"""
+        #return super()._get_state_components()
+        return (self, self._input_beam_splitter, self._short_arm_phase_sample, self._long_arm_phase_sample,
+                self._output_beam_joiner, self._SPD0, self._SPD1) + self._delay_line._get_state_components()
+
     def store_data(self):
         """AsymmetricMachZehnderInterferometer store_data method"""
         self._SPD0.store_data()
@@ -76,7 +98,7 @@ class AsymmetricMachZehnderInterferometer(Component):
     def reset_data(self):
         """AsymmetricMachZehnderInterferometer reset_data method"""
         #return super().reset_data()
-        self._field_buffer.clear()
+        self._delay_ticks = self._delay_line.reset_tap(self._delay_tap, self._delay_ticks)
 
         self._SPD0.reset_data()
         self._SPD1.reset_data()
@@ -97,9 +119,10 @@ class AsymmetricMachZehnderInterferometer(Component):
         self._input_beam_splitter.set(splitting_ratio_ti)
         self._output_beam_joiner.set(splitting_ratio_tf)
 
-        # Delay buffer
-        self._buffer_size = max(1, int(time_delay / clock.dt))
-        self._field_buffer.clear()
+        # Delay tap
+        self._time_delay = time_delay
+        self._delay_line.set_tap(self._delay_tap, time_delay)
+        self._buffer_size = self._delay_line.get_delay_samples(self._delay_tap)
 
     def set_phases(self, short_arm_phase:  float|None = None, long_arm_phase:  float|None = None, 
                 short_arm_phase_interval: float|None = None, long_arm_phase_interval: float|None = None):
@@ -111,6 +134,39 @@ class AsymmetricMachZehnderInterferometer(Component):
             self._long_arm_phase_sample.set(long_arm_phase, 
                                         phase_interval= long_arm_phase_interval)
 
+    def calibrate(self, electric_field: ndarray, dt: float, phases: ndarray|None = None,
+                splitting_ratios_ti: ndarray|float|None = None, splitting_ratios_tf: ndarray|float|None = None,
+                carrier_frequency: float|None = None, apply: bool = True):
+        """AsymmetricMachZehnderInterferometer calibrate method from one recorded field trace sampled at dt"""
+        # Current splitting ratios by default
+        if(splitting_ratios_ti is None):
+            splitting_ratios_ti = square(self._input_beam_splitter._t)
+        if(splitting_ratios_tf is None):
+            splitting_ratios_tf = square(self._output_beam_joiner._t)
+
+        calibration = calibrate_amzi(electric_field, dt, self._time_delay, phases,
+                                    splitting_ratios_ti, splitting_ratios_tf, carrier_frequency)
+
+        if(apply):
+            # Phase difference on the short arm
+            self._short_arm_phase_sample.set(calibration.phase)
+            self._long_arm_phase_sample.set(0.0)
+            self._input_beam_splitter.set(calibration.splitting_ratio_ti)
+            self._output_beam_joiner.set(calibration.splitting_ratio_tf)
+        return calibration
+
+    def set_time_tagging(self, clock: Clock|None, photons_per_intensity: float = 1.0,
+                        dark_count_probability: float = 0.0, dead_time: float = 0.0,
+                        resolution: float = TIME_TAG_RESOLUTION, seed: int|None = None):
+        """AsymmetricMachZehnderInterferometer set_time_tagging method, SPD0 on channel 0 and SPD1 on channel 1"""
+        self._SPD0.set_time_tagging(clock, 0, photons_per_intensity, dark_count_probability, dead_time, resolution, seed)
+        self._SPD1.set_time_tagging(clock, 1, photons_per_intensity, dark_count_probability, dead_time, resolution, 
+                                    None if(seed is None) else seed + 1)
+
+    def get_time_tags(self):
+        """AsymmetricMachZehnderInterferometer get_time_tags method of both SPDs"""
+        return TimeTagStream.merge(self._SPD0.get_time_tags(), self._SPD1.get_time_tags())
+
     def simulate(self, electric_field: complexfloating):
         """AsymmetricMachZehnderInterferometer simulate method"""
         #return super().simulate(clock)
@@ -118,12 +174,13 @@ class AsymmetricMachZehnderInterferometer(Component):
         # input field
         E_short, E_long = self._input_beam_splitter.simulate(electric_field)
 
-        # long arm
-        E_long = self._long_arm_phase_sample.simulate(E_long)
-
-        # Handle buffer
-        self._field_buffer.append(E_long)
-        E_long = self._field_buffer.pop(0) if len(self._field_buffer) > self._buffer_size else EMPTY_FIELD
+        # long arm, the delayed input field takes the reflection and phase after the tap
+        self._delay_ticks = self._delay_line.push(electric_field, self._delay_ticks)
+        E_delayed = self._delay_line.read(self._delay_tap)
+        if(E_delayed is None):
+            E_long = EMPTY_FIELD
+        else:
+            E_long = self._long_arm_phase_sample.simulate(self._input_beam_splitter._r * E_delayed)
 
         # short arm
         E_short = self._short_arm_phase_sample.simulate(E_short)
@@ -135,6 +192,39 @@ class AsymmetricMachZehnderInterferometer(Component):
         self._SPD0.simulate(self._electric_field_port2)
         self._SPD1.simulate(self._electric_field)
 
+    def replay(self, electric_field: ndarray):
+        """AsymmetricMachZehnderInterferometer replay method of a field trace sampled at the Clock dt"""
+        #return super().replay(electric_field)
+        E_short, E_long = self._input_beam_splitter.replay(electric_field)
+        E_long = self._long_arm_phase_sample.replay(E_long)
+
+        # Delay line, empty until the buffer fills
+        E_delayed = zeros_like(E_long)
+        if(E_long.shape[-1] > self._buffer_size):
+            E_delayed[..., self._buffer_size:] = E_long[..., :-self._buffer_size]
+
+        E_short = self._short_arm_phase_sample.replay(E_short)
+        return self._output_beam_joiner.replay(E_short, E_delayed)
+
+    def to_network(self, clock: Clock):
+        """AsymmetricMachZehnderInterferometer to_network method, the same AMZI as a compiled 2 mode PassiveNetwork"""
+        from .PassiveNetwork import PassiveNetwork
+
+        # Mode 0 short arm and SPD1, mode 1 long arm and SPD0
+        network = PassiveNetwork(clock, 2, name=f"{self.name}_network")
+        network.add(self._input_beam_splitter, (0, 1))
+        network.add(self._long_arm_phase_sample, 1)
+        network.add_delay(1, self._time_delay)
+        network.add(self._short_arm_phase_sample, 0)
+        network.add(self._output_beam_joiner, (0, 1))
+        network.set_detectors((1, 0), self._save_simulation)
+        return network.compile()
+
+    def replay_SPD(self, electric_field: ndarray):
+        """AsymmetricMachZehnderInterferometer replay_SPD method in the get_SPD_data layout"""
+        E_port1, E_port2 = self.replay(electric_field)
+        return {'SPD0': {'intensity': self._SPD0.replay(E_port2)}, 'SPD1': {'intensity': self._SPD1.replay(E_port1)}}
+
     def input_port(self):
         """AsymmetricMachZehnderInterferometer input port method"""
         #return super().input_port()
@@ -148,14 +238,14 @@ class AsymmetricMachZehnderInterferometer(Component):
         kwargs['electric_field_port2'] = self._electric_field_port2
         return kwargs
     
-    def display_SPD_data(self, time_data: ndarray, simulation_keys:tuple[str,...]|None=None):
+    def display_SPD_data(self, time_data: ndarray, simulation_keys:tuple[str,...]|None=None, filepath:str|None=None):
         """AsymmetricMachZehnderInterferometer display_SPD_data method"""        
         
         # Handle cases
         if(self._handle_SPD_data()):
             return
 
-        display_class_instances_data((self._SPD0, self._SPD1), time_data, simulation_keys)
+        display_class_instances_data((self._SPD0, self._SPD1), time_data, simulation_keys, filepath)
 
     def get_SPD_data(self):
         """AsymmetricMachZehnderInterferometer get_SPD_data method"""
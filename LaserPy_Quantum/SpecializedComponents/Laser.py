@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from numpy import (
-    complexfloating, 
-    sqrt, exp, cos, sin,
+    complexfloating, ndarray,
+    array,
+    sqrt, exp, cos, sin, sum,
     pi
 )
 
@@ -12,7 +13,7 @@ from ..Components import PhysicalComponent
 from ..Components.Signal import NoNoise
 
 from ..Constants import UniversalConstants
-from ..Constants import LaserPyConstants
+from ..Constants import LaserPyConstant
 
 from ..Constants import ERR_TOLERANCE
 from ..Constants import EMPTY_FIELD
@@ -23,24 +24,34 @@ class Laser(PhysicalComponent):
     """
     Laser class
     """
+    __slots__ = ('photon', 'carrier', 'phase', 'current', '_field_stale', '_free_running_freq', '_injection_field',
+                 '_Fn_t', '_Fs_t', '_Fphi_t', '_slave_locked', '_clamped_steps')
+
+    # Electric field is derived from photon and phase on demand
+    _state_keys = ('current', 'photon', 'carrier', 'phase')
+    _double_precision_keys = ('phase',)
+    _drift_keys = ('phase',)
+
+    # Euler steps below zero in most steps only happen for an unstable dt
+    _health_counters = {'_clamped_steps': 0.25}
 
     # Class variables for Laser
-    _TAU_N = LaserPyConstants.get('Tau_N')
-    _TAU_P = LaserPyConstants.get('Tau_P')
+    _TAU_N = LaserPyConstant('Tau_N')
+    _TAU_P = LaserPyConstant('Tau_P')
 
-    _g = LaserPyConstants.get('g')
-    _Epsilon = LaserPyConstants.get('Epsilon')
+    _g = LaserPyConstant('g')
+    _Epsilon = LaserPyConstant('Epsilon')
   
-    _N_transparent = LaserPyConstants.get('N_transparent')
+    _N_transparent = LaserPyConstant('N_transparent')
 
-    _Beta = LaserPyConstants.get('Beta')
-    _Alpha = LaserPyConstants.get('Alpha')
-    _Eta = LaserPyConstants.get('Eta')
+    _Beta = LaserPyConstant('Beta')
+    _Alpha = LaserPyConstant('Alpha')
+    _Eta = LaserPyConstant('Eta')
 
-    _Laser_Vol = LaserPyConstants.get('Laser_Vol')
+    _Laser_Vol = LaserPyConstant('Laser_Vol')
 
-    _Gamma_cap = LaserPyConstants.get('Gamma_cap')
-    _Kappa = LaserPyConstants.get('Kappa')
+    _Gamma_cap = LaserPyConstant('Gamma_cap')
+    _Kappa = LaserPyConstant('Kappa')
 
     def __init__(self, laser_wavelength:float = 1550.0e-9, save_simulation: bool = False, name: str = "default_laser"):
         super().__init__(save_simulation, name)
@@ -62,12 +73,19 @@ class Laser(PhysicalComponent):
                                            'carrier':r" $(m^{-3})$", 'phase':r" $(rad)$"}
 
         self._data: complexfloating = EMPTY_FIELD
-        """electric_field data for Laser"""
+        """electric_field data for Laser, use get_field"""
+
+        self._field_stale: bool = False
+        """electric_field outdated by a simulate step for Laser"""
 
         # Laser class private data
         self._free_running_freq = UniversalConstants.C.value / laser_wavelength
         """free running frequency data for Laser"""
 
+        self._injection_field: InjectionField = {'photon': self.photon, 'phase': self.phase,
+                                                 'electric_field': self._data, 'frequency': self._free_running_freq}
+        """injection_field updated in place by output_port for Laser"""
+
         # Noise classes for simulations
         self._Fn_t = NoNoise('carrier_NoNoise')
         self._Fs_t = NoNoise('photon_NoNoise')
@@ -76,6 +94,9 @@ class Laser(PhysicalComponent):
         # Optical Injection locking data
         self._slave_locked: bool = False
 
+        self._clamped_steps: int = 0
+        """steps with carrier or photon clamped to ERR_TOLERANCE for Laser"""
+
     def _dN_dt(self):
         """Delta number of carrier method"""
         dN_dt = self.current / (UniversalConstants.CHARGE.value * self._Laser_Vol) - self.carrier / self._TAU_N - self._g * ((self.carrier - self._N_transparent) / (1 + self._Epsilon * self.photon)) * self.photon + self._Fn_t()
@@ -91,9 +112,21 @@ class Laser(PhysicalComponent):
         dPhi_dt = (self._Alpha / 2) * (self._Gamma_cap * self._g * (self.carrier - self._N_transparent) - 1 / self._TAU_P) + self._Fphi_t()
         return dPhi_dt
 
-    def _power(self):
+    def _power(self, photon: float|ndarray|None = None):
         """Laser _power method""" 
-        return self.photon * self._Laser_Vol * self._Eta * UniversalConstants.H.value * self._free_running_freq / (2 * self._Gamma_cap * self._TAU_P)
+        if(photon is None):
+            photon = self.photon
+        return photon * self._Laser_Vol * self._Eta * UniversalConstants.H.value * self._free_running_freq / (2 * self._Gamma_cap * self._TAU_P)
+
+    def _injection_terms(self, t: float, master_photon: float|ndarray, master_phase: float|ndarray, master_frequency: float|ndarray):
+        """Laser _injection_terms method for single or arrays of Master lasers"""
+        # Phase difference between master and slave output with master frequency detuning
+        delta_phase = self.phase - master_phase - 2 * pi * (self._free_running_freq - master_frequency) * t
+
+        # Injection terms effects
+        dS_inj = 2 * self._Kappa * sqrt(self.photon) * sum(sqrt(master_photon) * cos(delta_phase))
+        dPhi_inj = -self._Kappa * sum(sqrt(master_photon) * sin(delta_phase)) / sqrt(self.photon)
+        return dS_inj, dPhi_inj
 
     def set_noise(self, Fn_t:NoNoise, Fs_t:NoNoise, Fphi_t:NoNoise):
         """Laser set noise method""" 
@@ -121,34 +154,53 @@ class Laser(PhysicalComponent):
         if(self._slave_locked and injection_field):
             if(isinstance(injection_field, tuple)):
                 # Multi Master laser lock
-                for single_field in injection_field:
-                    # Phase difference between master and slave output
-                    delta_phase = self.phase - single_field['phase']
-                    _master_freq_detuning = 2 * pi * (self._free_running_freq - single_field['frequency']) * clock.t
-
-                    # Injection terms effects
-                    dS_dt += 2 * self._Kappa * sqrt(single_field['photon'] * self.photon) * cos(delta_phase - _master_freq_detuning)
-                    dPhi_dt -= self._Kappa * sqrt(single_field['photon'] / self.photon) * sin(delta_phase - _master_freq_detuning)
+                dS_inj, dPhi_inj = self._injection_terms(clock.t,
+                                    array([single_field['photon'] for single_field in injection_field]),
+                                    array([single_field['phase'] for single_field in injection_field]),
+                                    array([single_field['frequency'] for single_field in injection_field]))
             else:
-                # Phase difference between master and slave output
-                delta_phase = self.phase - injection_field['phase']
-                _master_freq_detuning = 2 * pi * (self._free_running_freq - injection_field['frequency']) * clock.t
-
-                # Injection terms effects
-                dS_dt += 2 * self._Kappa * sqrt(injection_field['photon'] * self.photon) * cos(delta_phase - _master_freq_detuning)
-                dPhi_dt -= self._Kappa * sqrt(injection_field['photon'] / self.photon) * sin(delta_phase - _master_freq_detuning)
+                dS_inj, dPhi_inj = self._injection_terms(clock.t, injection_field['photon'],
+                                    injection_field['phase'], injection_field['frequency'])
+            dS_dt += dS_inj
+            dPhi_dt += dPhi_inj
 
         # Time step update (Euler Integration)
         self.carrier += dN_dt * clock.dt
         self.photon += dS_dt * clock.dt
         self.phase += dPhi_dt * clock.dt
 
-        # Value corrections
-        self.carrier = max(self.carrier, ERR_TOLERANCE)
-        self.photon = max(self.photon, ERR_TOLERANCE)
-
-        # Optical field
-        self._data = sqrt(self._power()) * exp(1j * self.phase)
+        # Value corrections, counted for HealthMonitor
+        if(self.carrier < ERR_TOLERANCE):
+            self.carrier = ERR_TOLERANCE
+            self._clamped_steps += 1
+        if(self.photon < ERR_TOLERANCE):
+            self.photon = ERR_TOLERANCE
+            self._clamped_steps += 1
+
+        # Optical field computed when consumed
+        self._field_stale = True
+
+    def set_state(self, state: tuple):
+        """Laser set_state method"""
+        #return super().set_state(state)
+        super().set_state(state)
+        self._field_stale = True
+
+    def get_field(self):
+        """Laser get_field method for electric_field of the last step"""
+        if(self._field_stale):
+            self._data = sqrt(self._power()) * exp(1j * self.phase)
+            self._field_stale = False
+        return self._data
+
+    def get_field_data(self):
+        """Laser get_field_data method for stored electric_field"""
+        laser_data = self.get_data()
+        return sqrt(self._power(laser_data['photon'])) * exp(1j * laser_data['phase'])
+
+    def get_power_data(self):
+        """Laser get_power_data method for stored optical power"""
+        return self._power(self.get_data()['photon'])
 
     def input_port(self):
         """Laser input port method""" 
@@ -160,8 +212,11 @@ class Laser(PhysicalComponent):
         """Laser output port method""" 
         #return super().output_port(kwargs)
         if('injection_field' in kwargs):
-            kwargs['injection_field'] = {'photon': self.photon, 'phase': self.phase, 
-                                         'electric_field': self._data, 'frequency': self._free_running_freq}
+            injection_field = self._injection_field
+            injection_field['photon'] = self.photon
+            injection_field['phase'] = self.phase
+            injection_field['electric_field'] = self.get_field()
+            kwargs['injection_field'] = injection_field
         elif('electric_field' in kwargs):
-            kwargs['electric_field'] = self._data
+            kwargs['electric_field'] = self.get_field()
         return kwargs
\ No newline at end of file
@@ -1,10 +1,10 @@
 from numpy import (
-    complexfloating
+    complexfloating, ndarray,
+    array, zeros
 )
 
-from LaserPy_Quantum.Components.Component import Clock
-
 from ..Components.Component import Component
+from ..Components import Clock
 from ..Components import Connection
 
 from .ComponentDriver import CurrentDriver
@@ -12,6 +12,8 @@ from .Laser import Laser
 
 from ..Constants import EMPTY_FIELD
 
+from ..Precision import as_field
+
 from ..utils import (
     InjectionField,
     LaserRunnerComponents
@@ -21,6 +23,10 @@ class VariableOpticalAttenuator(Component):
     """
     VariableOpticalAttenuator class
     """
+    __slots__ = ('_attenuation_dB', '_output_field')
+
+    _state_keys = ('_output_field',)
+
     def __init__(self, attenuation_dB: float= 0.0, name: str = "default_variable_optical_attenuator"):
         super().__init__(name)
         self._attenuation_dB = attenuation_dB
@@ -38,6 +44,15 @@ class VariableOpticalAttenuator(Component):
         attenuation_factor = 10 ** (-self._attenuation_dB / 20)
         self._output_field = electric_field * attenuation_factor
         return self._output_field
+
+    def replay(self, electric_field: ndarray):
+        """VariableOpticalAttenuator replay method"""
+        #return super().replay(electric_field)
+        return as_field(electric_field) * float(10 ** (-self._attenuation_dB / 20))
+
+    def transfer_matrix(self):
+        """VariableOpticalAttenuator transfer_matrix method for PassiveNetwork"""
+        return array([[10 ** (-self._attenuation_dB / 20)]])
     
     def input_port(self):
         """VariableOpticalAttenuator input port method"""
@@ -51,43 +66,75 @@ class VariableOpticalAttenuator(Component):
         kwargs['electric_field'] = self._output_field
         return kwargs
     
-# class OpticalCirculator(Connection):
-#     """
-#     OpticalCirculator class
-#     """
-
-#     # Specific type override
-#     _input_components: tuple[Laser,...]
-
-#     def __init__(self, input_components: Laser | tuple[Laser, ...], injection_components: LaserRunnerComponents | tuple[CurrentDriver, Laser], output_components: Component|tuple[Component, ...], name: str = "default_optical_circulator"):
-#         if(isinstance(input_components, Laser)):
-#             input_components = (input_components,)
-#         self._input_components = input_components
-#         """Master Lasers for OpticalCirculator"""
-
-#         if(isinstance(injection_components, tuple)):
-#             injection_components = LaserRunnerComponents._make(injection_components)
-
-#         self._injection_laser_driver = injection_components.current_driver
-#         """Slave Laser's Driver for OpticalCirculator"""
-
-#         self._injection_laser = injection_components.laser
-#         self._injection_laser.set_slave_Laser(True)
-#         """Slave locked Laser for OpticalCirculator"""
-        
-#         super().__init__(self._injection_laser, output_components, name)
-
-#     def simulate(self, clock: Clock):
-#         """OpticalCirculator simulate method"""
-#         # Injection devices
-#         injection_kwargs: list[InjectionField] = []
-#         for laser in (self._input_components):
-#             injection_kwargs.append(laser.output_port({'injection_field': None})['injection_field'])
-
-#         # Multi Master locked Slave Laser simulation
-#         self._injection_laser.simulate(clock, self._injection_laser_driver._data, tuple(injection_kwargs))
-#         if(self._injection_laser._save_simulation):
-#             self._injection_laser.store_data()
-
-#         # Simulate devices dependent on Slave laser data
-#         super().simulate(clock)
\ No newline at end of file
+class OpticalCirculator(Connection):
+    """
+    OpticalCirculator class
+    """
+    def __init__(self, input_components: Laser | tuple[Laser, ...], injection_components: LaserRunnerComponents | tuple[CurrentDriver, Laser], 
+                output_components: Component|tuple[Component, ...] = (), name: str = "default_optical_circulator"):
+        if(isinstance(injection_components, tuple)):
+            injection_components = LaserRunnerComponents._make(injection_components)
+
+        self._injection_laser_driver = injection_components.current_driver
+        """Slave Laser's Driver for OpticalCirculator"""
+
+        self._injection_laser = injection_components.laser
+        self._injection_laser.set_slave_Laser(True)
+        """Slave locked Laser for OpticalCirculator"""
+
+        # Devices dependent on Slave laser data
+        super().__init__(self._injection_laser, output_components, name)
+
+        if(isinstance(input_components, Laser)):
+            input_components = (input_components,)
+        self._master_lasers = input_components
+        """Master Lasers for OpticalCirculator"""
+
+        # Gathered Master fields
+        self._master_photon: ndarray = zeros(len(self._master_lasers))
+        self._master_phase: ndarray = zeros(len(self._master_lasers))
+        self._master_frequency: ndarray = array([laser._free_running_freq for laser in self._master_lasers])
+
+        self._injection_field: InjectionField = {'photon': self._master_photon, 'phase': self._master_phase, 
+                                                'electric_field': EMPTY_FIELD, 'frequency': self._master_frequency}
+        """Array valued InjectionField of all Master lasers for OpticalCirculator"""
+
+    def _get_input_components(self):
+        """OpticalCirculator _get_input_components method"""
+        #return super()._get_input_components()
+        return self._master_lasers + (self._injection_laser_driver,)
+
+    def _get_output_components(self):
+        """OpticalCirculator _get_output_components method"""
+        #return super()._get_output_components()
+        return (self._injection_laser,) + self._output_components
+
+    def set(self, input_components: Laser | tuple[Laser, ...]):
+        """OpticalCirculator set method"""
+        #return super().set()
+        if(isinstance(input_components, Laser)):
+            input_components = (input_components,)
+        self._master_lasers = input_components
+
+        self._master_photon = zeros(len(self._master_lasers))
+        self._master_phase = zeros(len(self._master_lasers))
+        self._master_frequency = array([laser._free_running_freq for laser in self._master_lasers])
+
+        self._injection_field = {'photon': self._master_photon, 'phase': self._master_phase, 
+                                'electric_field': EMPTY_FIELD, 'frequency': self._master_frequency}
+
+    def simulate(self, clock: Clock):
+        """OpticalCirculator simulate method"""
+        #return super().simulate(clock)
+
+        # Gather Master fields in place
+        self._master_photon[:] = [laser.photon for laser in self._master_lasers]
+        self._master_phase[:] = [laser.phase for laser in self._master_lasers]
+
+        # Multi Master locked Slave Laser simulation
+        self._injection_laser.simulate(clock, self._injection_laser_driver._data, self._injection_field)
+        if(self._injection_laser._save_simulation and clock._should_sample()):
+            self._injection_laser.store_data()
+
+        # Simulate devices dependent on Slave laser data
+        super().simulate(clock)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+from numpy import (
+    complexfloating, ndarray, complex128,
+    asarray, empty, zeros, eye, stack, abs, square
+)
+
+from ..Components.Component import Component
+from ..Components import Clock
+
+from .PhotonDetector import SinglePhotonDetector
+
+from ..Constants import EMPTY_FIELD
+
+from ..Precision import as_field
+
+class PassiveNetwork(Component):
+    """
+    PassiveNetwork class\n
+    N-port network of passive devices and delay lines compiled to scattering matrices S_d per path delay d,
+    output(t) = sum_d S_d @ input(t - d).
+    """
+    _state_keys = ('_electric_field', '_electric_field_port2', '_history', '_history_idx')
+
+    def __init__(self, clock: Clock, n_modes: int = 2, name: str = "default_passive_network"):
+        super().__init__(name)
+
+        self._dt = clock.dt
+        """Clock dt of delay lines for PassiveNetwork"""
+
+        self._n_modes = n_modes
+        """number of optical modes for PassiveNetwork"""
+
+        self._elements: list[tuple[Component|int, tuple[int,...]]] = []
+        """ordered devices with their modes, int devices are delays in samples"""
+
+        # Compiled transfer description
+        self._delays: tuple[int,...] = ()
+        self._scattering_matrices: ndarray = empty((0, n_modes, n_modes), dtype=complex128)
+        self._flat_matrix: ndarray = empty((n_modes, 0), dtype=complex128)
+        self._compiled = False
+
+        # Input history ring buffer of max delay + 1 ticks
+        self._history: ndarray = zeros((1, n_modes), dtype=complex128)
+        self._history_idx: int = 0
+
+        self._input_fields: ndarray = zeros(n_modes, dtype=complex128)
+        self._output_fields: ndarray = zeros(n_modes, dtype=complex128)
+        """output fields of every mode for PassiveNetwork"""
+
+        self._electric_field: complexfloating = EMPTY_FIELD
+        """electric_field data of mode 0 for PassiveNetwork"""
+
+        self._electric_field_port2: complexfloating = EMPTY_FIELD
+        """electric_field_port2 data of mode 1 for PassiveNetwork"""
+
+        # Detector array on output modes
+        self._detectors: dict[int, SinglePhotonDetector] = {}
+
+    def __repr__(self) -> str:
+        return f"PassiveNetwork: {self.name} id:{self.class_id} {self._n_modes} modes, {len(self._delays)} path delays"
+
+    def add(self, component: Component, modes: int|tuple[int,...]):
+        """PassiveNetwork add method of a passive device on modes, in propagation order"""
+        if(isinstance(modes, int)):
+            modes = (modes,)
+        if(not hasattr(component, 'transfer_matrix')):
+            print(f"{component.name} has no transfer_matrix, Component skipped.")
+            return self
+        if(any(mode < 0 or mode >= self._n_modes for mode in modes)):
+            print(f"{component.name} modes {modes} outside {self._n_modes} modes, Component skipped.")
+            return self
+        self._elements.append((component, modes))
+        self._compiled = False
+        return self
+
+    def add_delay(self, mode: int, time_delay: float):
+        """PassiveNetwork add_delay method of a delay line on mode"""
+        delay_samples = max(1, int(time_delay / self._dt))
+        self._elements.append((delay_samples, (mode,)))
+        self._compiled = False
+        return self
+
+    def set_detectors(self, modes: tuple[int,...], save_simulation: bool = False):
+        """PassiveNetwork set_detectors method of one SinglePhotonDetector per output mode"""
+        self._detectors = {mode: SinglePhotonDetector(save_simulation=save_simulation, name=f"SPD_{mode}") for mode in modes}
+        self._save_simulation = save_simulation
+
+    def compile(self):
+        """PassiveNetwork compile method of the scattering matrices, device parameters are read once here"""
+        # Path delay to accumulated N x N transfer
+        transfers: dict[int, ndarray] = {0: eye(self._n_modes, dtype=complex128)}
+        for component, modes in self._elements:
+            if(isinstance(component, int)):
+                # Delay line moves the mode row to a later path delay
+                mode = modes[0]
+                delayed: dict[int, ndarray] = {}
+                for delay, transfer in transfers.items():
+                    passed = transfer.copy()
+                    passed[mode] = 0.0
+                    delayed.setdefault(delay, zeros((self._n_modes, self._n_modes), dtype=complex128))
+                    delayed[delay] += passed
+                    delayed.setdefault(delay + component, zeros((self._n_modes, self._n_modes), dtype=complex128))
+                    delayed[delay + component][mode] += transfer[mode]
+                transfers = delayed
+                continue
+
+            # Device matrix embedded on its modes
+            local = asarray(component.transfer_matrix(), dtype=complex128)
+            for transfer in transfers.values():
+                transfer[list(modes)] = local @ transfer[list(modes)]
+
+        self._delays = tuple(sorted(delay for delay, transfer in transfers.items() if(abs(transfer).max() > 0)))
+        if(not self._delays):
+            self._delays = (0,)
+        self._scattering_matrices = stack([transfers.get(delay, zeros((self._n_modes, self._n_modes), dtype=complex128)) for delay in self._delays])
+
+        # (N, n_delays * N) for one matrix vector product per tick
+        self._flat_matrix = self._scattering_matrices.transpose(1, 0, 2).reshape(self._n_modes, -1).copy()
+        self._delay_array = asarray(self._delays)
+        self._history = zeros((self._delays[-1] + 1, self._n_modes), dtype=complex128)
+        self._history_idx = 0
+        self._compiled = True
+        return self
+
+    def get_scattering_matrices(self):
+        """PassiveNetwork get_scattering_matrices method returning (path delays in samples, (n_delays, N, N) matrices)"""
+        if(not self._compiled):
+            self.compile()
+        return self._delays, self._scattering_matrices
+
+    def reset_data(self):
+        """PassiveNetwork reset_data method"""
+        #return super().reset_data()
+        self._history[:] = 0.0
+        self._history_idx = 0
+        for detector in self._detectors.values():
+            detector.reset_data()
+
+    def reset(self, save_simulation: bool = False):
+        """PassiveNetwork reset method"""
+        #return super().reset(args)
+        self._save_simulation = save_simulation
+        for detector in self._detectors.values():
+            detector.reset(save_simulation)
+
+    def _get_data_components(self):
+        """PassiveNetwork _get_data_components method"""
+        #return super()._get_data_components()
+        return tuple(self._detectors.values())
+
+    def _get_state_components(self):
+        """PassiveNetwork _get_state_components method"""
+        #return super()._get_state_components()
+        return (self,) + tuple(self._detectors.values())
+
+    def store_data(self):
+        """PassiveNetwork store_data method"""
+        for detector in self._detectors.values():
+            detector.store_data()
+
+    def simulate_modes(self, electric_fields: ndarray):
+        """PassiveNetwork simulate_modes method of one input field per mode"""
+        if(not self._compiled):
+            self.compile()
+
+        # Newest input at history_idx, path delay d at history_idx - d
+        history_length = len(self._history)
+        self._history_idx = (self._history_idx + 1) % history_length
+        self._history[self._history_idx] = electric_fields
+        rows = (self._history_idx - self._delay_array) % history_length
+        self._output_fields = self._flat_matrix @ self._history[rows].ravel()
+
+        self._electric_field = self._output_fields[0]
+        self._electric_field_port2 = self._output_fields[1] if(self._n_modes > 1) else EMPTY_FIELD
+
+        # Photon Detection
+        for mode, detector in self._detectors.items():
+            detector.simulate(self._output_fields[mode])
+        return self._output_fields
+
+    def simulate(self, electric_field: complexfloating, electric_field_port2: complexfloating = EMPTY_FIELD):
+        """PassiveNetwork simulate method, mode 0 and mode 1 inputs"""
+        #return super().simulate(args)
+        # Reused input vector, other modes stay dark
+        self._input_fields[0] = electric_field
+        if(self._n_modes > 1):
+            self._input_fields[1] = electric_field_port2
+        return self.simulate_modes(self._input_fields)
+
+    def replay_modes(self, electric_fields: ndarray):
+        """PassiveNetwork replay_modes method of (N, n_samples) field traces, one matrix product per path delay"""
+        if(not self._compiled):
+            self.compile()
+        electric_fields = as_field(electric_fields)
+        n_samples = electric_fields.shape[-1]
+
+        output_fields = zeros(electric_fields.shape, dtype=electric_fields.dtype)
+        for delay, scattering_matrix in zip(self._delays, self._scattering_matrices.astype(electric_fields.dtype)):
+            if(delay < n_samples):
+                output_fields[:, delay:] += scattering_matrix @ electric_fields[:, :n_samples - delay]
+        return output_fields
+
+    def replay(self, electric_field: ndarray, electric_field_port2: ndarray|complexfloating = EMPTY_FIELD):
+        """PassiveNetwork replay method of mode 0 and mode 1 field traces, returns one trace per mode"""
+        #return super().replay(electric_field)
+        electric_field = as_field(electric_field)
+        electric_fields = zeros((self._n_modes, len(electric_field)), dtype=electric_field.dtype)
+        electric_fields[0] = electric_field
+        if(self._n_modes > 1):
+            electric_fields[1] = electric_field_port2
+        return tuple(self.replay_modes(electric_fields))
+
+    def replay_SPD(self, electric_fields: ndarray):
+        """PassiveNetwork replay_SPD method of detector intensities for (N, n_samples) field traces"""
+        output_fields = self.replay_modes(electric_fields)
+        modes = list(self._detectors) if(self._detectors) else list(range(self._n_modes))
+        intensities = square(abs(output_fields[modes]))
+        return {f"SPD_{mode}": {'intensity': intensity} for mode, intensity in zip(modes, intensities)}
+
+    def input_port(self):
+        """PassiveNetwork input port method"""
+        #return super().input_port()
+        kwargs = {'electric_field':None, 'electric_field_port2':EMPTY_FIELD}
+        return kwargs
+
+    def output_port(self, kwargs: dict = {}):
+        """PassiveNetwork output port method"""
+        #return super().output_port(kwargs)
+        kwargs['electric_field'] = self._electric_field
+        kwargs['electric_field_port2'] = self._electric_field_port2
+        return kwargs
@@ -1,27 +1,40 @@
+from array import array
+from math import exp as exp_scalar
+
 from numpy import (
-    random,
-    complexfloating, ndarray,
-    square, abs, mod, exp, cos, angle,
+    complexfloating, ndarray, int64,
+    asarray, frombuffer, square, abs, mod, exp, cos, angle,
     pi
 )
 
+from ..Components import Clock
 from ..Components import DataComponent
 
-from ..Constants import LaserPyConstants
+from ..Analysis.TimeTags import TimeTagStream
+from ..Analysis.TimeTags import TIME_TAG_RESOLUTION
+
+from ..Constants import LaserPyConstant
 from ..Constants import ERR_TOLERANCE
 
+# Uniform draws per Generator call of time tagging detectors
+UNIFORM_BLOCK = 4096
+
 class SinglePhotonDetector(DataComponent):
     """
     SinglePhotonDetector class
     """
+    __slots__ = ('intensity', 'photon_count', '_time_tag_clock', '_time_tags', '_time_tag_channel', '_time_tag_resolution',
+                 '_photon_exponent', '_dark_count_survival', '_dead_time', '_last_click', '_rng', '_uniforms', '_uniform_idx')
+
+    _state_keys = ('intensity', 'photon_count')
 
     # Class variables for SinglePhotonDetector
-    _Eta = LaserPyConstants.get("Eta")
+    _Eta = LaserPyConstant("Eta")
 
     def __init__(self, save_simulation: bool = False, name: str = "default_single_photon_detector"):
         super().__init__(save_simulation, name)
 
-        self.intensity = 0
+        self.intensity = 0.0
         """intensity data for SinglePhotonDetector"""
 
         self.photon_count = 0
@@ -31,11 +44,53 @@ class SinglePhotonDetector(DataComponent):
         self._simulation_data = {'intensity': []}#, 'photon_count': []}
         self._simulation_data_units = {'intensity': r" $(W/m^2)$"}#, 'photon_count': r" $(counts)$"}
 
-    def display_data(self, time_data: ndarray, simulation_keys: tuple[str, ...] | None = None):
-        """SinglePhotonDetector simulate method"""
+        self._time_tag_clock: Clock|None = None
+        """Clock of time tagged clicks for SinglePhotonDetector, None when disabled"""
+
+        self._time_tags = array('q')
+        """click timestamps for SinglePhotonDetector"""
+
+    def display_data(self, time_data: ndarray, simulation_keys: tuple[str, ...] | None = None, filepath: str | None = None):
+        """SinglePhotonDetector display_data method"""
         # Time adjustment
         time_data = time_data[-len(self._simulation_data['intensity']):]
-        super().display_data(time_data, simulation_keys)
+        super().display_data(time_data, simulation_keys, filepath)
+
+    def set_time_tagging(self, clock: Clock|None, channel: int = 0, photons_per_intensity: float = 1.0,
+                        dark_count_probability: float = 0.0, dead_time: float = 0.0,
+                        resolution: float = TIME_TAG_RESOLUTION, seed: int|None = None):
+        """SinglePhotonDetector set_time_tagging method recording clicks on clock, None clock disables it"""
+        self._time_tag_clock = clock
+        if(clock is None):
+            return
+        from numpy.random import default_rng
+
+        self._time_tag_channel = channel
+        self._time_tag_resolution = resolution
+        self._photon_exponent = self._Eta * photons_per_intensity
+        self._dark_count_survival = 1 - dark_count_probability
+        self._dead_time = int(round(dead_time / resolution))
+        self._last_click = None
+
+        # Uniform draws in blocks, not one Generator call per tick
+        self._rng = default_rng(seed)
+        self._uniforms = self._rng.random(UNIFORM_BLOCK)
+        self._uniform_idx = 0
+
+    def _detect_click(self):
+        """SinglePhotonDetector _detect_click method"""
+        if(self._uniform_idx == UNIFORM_BLOCK):
+            self._uniforms = self._rng.random(UNIFORM_BLOCK)
+            self._uniform_idx = 0
+        uniform = self._uniforms[self._uniform_idx]
+        self._uniform_idx += 1
+
+        # Threshold detector click on Poisson light
+        if(uniform < 1 - self._dark_count_survival * exp_scalar(-self._photon_exponent * self.intensity)):
+            timestamp = round(self._time_tag_clock.t / self._time_tag_resolution)
+            if(self._last_click is None or timestamp - self._last_click >= self._dead_time):
+                self._time_tags.append(timestamp)
+                self._last_click = timestamp
 
     def simulate(self, electric_field: complexfloating):
         """SinglePhotonDetector simulate method"""
@@ -46,6 +101,25 @@ class SinglePhotonDetector(DataComponent):
         # Total photon count
         # incident_photons = random.poisson(self.intensity)
         # self.photon_count = random.binomial(incident_photons, self._Eta)
+        if(self._time_tag_clock is not None):
+            self._detect_click()
+
+    def replay(self, electric_field: ndarray):
+        """SinglePhotonDetector replay method returning intensity"""
+        #return super().replay(electric_field)
+        return square(abs(asarray(electric_field)))
+
+    def get_time_tags(self):
+        """SinglePhotonDetector get_time_tags method"""
+        resolution = self._time_tag_resolution if(self._time_tag_clock is not None) else TIME_TAG_RESOLUTION
+        channel = self._time_tag_channel if(self._time_tag_clock is not None) else 0
+        return TimeTagStream(frombuffer(self._time_tags, dtype=int64).copy(), channel, resolution, sort=False)
+
+    def reset_data(self):
+        """SinglePhotonDetector reset_data method"""
+        super().reset_data()
+        self._time_tags = array('q')
+        self._last_click = None
 
     def input_port(self):
         """SinglePhotonDetector input port method"""
@@ -57,6 +131,8 @@ class PhaseSensitiveSPD(SinglePhotonDetector):
     """
     PhaseSensitiveSPD class
     """
+    __slots__ = ('_target_phase',)
+
     def __init__(self, target_phase: float = 0.0, save_simulation: bool = False, name: str = "default_phase_sensitive_spd"):
         super().__init__(save_simulation, name)
 
@@ -1,17 +1,25 @@
 from numpy import (
-    complexfloating,
-    mod, exp, sqrt,
+    complexfloating, ndarray, complex128,
+    array, asarray, zeros, arange, maximum, mod, exp, sqrt,
+    int64,
     pi
 )
 
 from ..Components.Component import Component
+from ..Components.Component import Clock
 
 from ..Constants import EMPTY_FIELD
 
+from ..Precision import as_field
+
 class PhaseSample(Component):
     """
     PhaseSample class
     """
+    __slots__ = ('_phase_interval', '_phase_change', '_electric_field')
+
+    _state_keys = ('_electric_field',)
+
     def __init__(self, phase_delay: float = 0.0, name: str = "default_phase_sample"):
         super().__init__(name)
 
@@ -41,6 +49,15 @@ class PhaseSample(Component):
         self._electric_field = self._phase_change * electric_field
         return self._electric_field
 
+    def replay(self, electric_field: ndarray):
+        """PhaseSample replay method"""
+        #return super().replay(electric_field)
+        return complex(self._phase_change) * as_field(electric_field)
+
+    def transfer_matrix(self):
+        """PhaseSample transfer_matrix method for PassiveNetwork"""
+        return array([[self._phase_change]])
+
     def input_port(self):
         """PhaseSample input port method"""
         #return super().input_port()
@@ -57,6 +74,8 @@ class Mirror(PhaseSample):
     """
     Mirror class
     """
+    __slots__ = ()
+
     def __init__(self, name: str = "default_mirror"):
         super().__init__(pi, name)
 
@@ -69,6 +88,10 @@ class BeamSplitter(Component):
     """
     BeamSplitter class
     """
+    __slots__ = ('_t', '_r', '_E_transmitted', '_E_reflected')
+
+    _state_keys = ('_E_transmitted', '_E_reflected')
+
     def __init__(self, splitting_ratio_t: float = 0.5, name: str = "default_beam_splitter"):
         super().__init__(name)
 
@@ -93,6 +116,21 @@ class BeamSplitter(Component):
         self._E_reflected = self._r * electric_field + self._t * electric_field_port2
         return self._E_transmitted, self._E_reflected
 
+    def replay(self, electric_field: ndarray, electric_field_port2: ndarray|complexfloating = EMPTY_FIELD):
+        """BeamSplitter replay method"""
+        #return super().replay(electric_field)
+        electric_field, electric_field_port2 = as_field(electric_field), as_field(electric_field_port2)
+
+        # Python scalars keep the policy field dtype
+        t, r = float(self._t), complex(self._r)
+        return (t * electric_field + r * electric_field_port2, 
+                r * electric_field + t * electric_field_port2)
+
+    def transfer_matrix(self):
+        """BeamSplitter transfer_matrix method for PassiveNetwork, (electric_field, electric_field_port2) to (transmitted, reflected)"""
+        return array([[self._t, self._r], 
+                      [self._r, self._t]])
+
     def input_port(self):
         """BeamSplitter input port method"""
         #return super().input_port()
@@ -106,4 +144,135 @@ class BeamSplitter(Component):
         #return super().output_port(kwargs)
         kwargs['electric_field'] = self._E_transmitted
         kwargs['electric_field_port2'] = self._E_reflected
-        return kwargs
\ No newline at end of file
+        return kwargs
+
+class DelayLine(Component):
+    """
+    DelayLine class\n
+    Ring buffer of one field with read taps at several delays, shared by any number of interferometers.
+    """
+    _state_keys = ('_buffer', '_buffer_idx', '_ticks', '_tap_start', '_tap_fields')
+
+    def __init__(self, clock: Clock, time_delays: float|tuple[float,...] = (), name: str = "default_delay_line"):
+        super().__init__(name)
+
+        self._dt = clock.dt
+        """Clock dt of delays for DelayLine"""
+
+        self._taps: list[int] = []
+        """tap delays in samples for DelayLine"""
+
+        # Ring buffer of max delay + 1 samples, ticks keep every reader aligned across retunes
+        self._buffer: ndarray = zeros(1, dtype=complex128)
+        self._buffer_idx: int = 0
+        self._ticks: int = 0
+        self._tap_array: ndarray = zeros(0, dtype=int)
+        self._tap_fields: ndarray = zeros(0, dtype=complex128)
+
+        self._tap_start: ndarray = zeros(0, dtype=int64)
+        """first tick of valid history per tap for DelayLine"""
+
+        self._tap_ready: list[int] = []
+        """last tick each tap reads None for DelayLine"""
+
+        if(isinstance(time_delays, (int, float))):
+            time_delays = (time_delays,)
+        for time_delay in time_delays:
+            self.add_tap(time_delay)
+
+    def __repr__(self) -> str:
+        return f"DelayLine: {self.name} id:{self.class_id} taps {self._taps}"
+
+    def _update_taps(self):
+        """DelayLine _update_taps method for the tap gather and ready ticks"""
+        self._tap_array = asarray(self._taps, dtype=int)
+        self._tap_ready = (self._tap_start + self._tap_array).tolist()
+        self._tap_fields = self._buffer[(self._buffer_idx - self._tap_array) % len(self._buffer)]
+
+    def _resize(self):
+        """DelayLine _resize method keeping the newest stored samples, taps beyond the kept history read None"""
+        size = max(self._taps, default=0) + 1
+        kept = min(size, len(self._buffer))
+
+        # Newest kept samples in order, the newest at the ring index
+        buffer = zeros(size, dtype=complex128)
+        buffer[:kept] = self._buffer[(self._buffer_idx - arange(kept - 1, -1, -1)) % len(self._buffer)]
+        self._buffer = buffer
+        self._buffer_idx = kept - 1
+
+        # New taps share the kept history
+        tap_start = zeros(len(self._taps), dtype=int64)
+        tap_start[:len(self._tap_start)] = self._tap_start[:len(self._taps)]
+        self._tap_start = maximum(tap_start, self._ticks - kept)
+        self._update_taps()
+
+    def add_tap(self, time_delay: float):
+        """DelayLine add_tap method returning the tap index"""
+        self._taps.append(max(1, int(time_delay / self._dt)))
+        self._resize()
+        return len(self._taps) - 1
+
+    def set_tap(self, tap: int, time_delay: float):
+        """DelayLine set_tap method, other taps keep their history and readers stay aligned"""
+        self._taps[tap] = max(1, int(time_delay / self._dt))
+        self._resize()
+
+    def get_delay_samples(self, tap: int):
+        """DelayLine get_delay_samples method"""
+        return self._taps[tap]
+
+    def set_state(self, state: tuple):
+        """DelayLine set_state method"""
+        #return super().set_state(state)
+        super().set_state(state)
+        self._tap_ready = (self._tap_start + self._tap_array).tolist()
+
+    def reset_data(self):
+        """DelayLine reset_data method, every reader restarts from zero ticks"""
+        #return super().reset_data()
+        self._buffer[:] = 0.0
+        self._buffer_idx = 0
+        self._ticks = 0
+        self._tap_start[:] = 0
+        self._update_taps()
+
+    def reset_tap(self, tap: int, ticks: int):
+        """DelayLine reset_tap method clearing the history of one tap, returns the reader ticks"""
+        if(len(self._taps) == 1):
+            self.reset_data()
+            return 0
+
+        # Shared lines keep the history of the other taps
+        self._tap_start[tap] = self._ticks
+        self._tap_ready[tap] = self._ticks + self._taps[tap]
+        return ticks
+
+    def push(self, electric_field: complexfloating, ticks: int):
+        """DelayLine push method, only the first reader of a tick writes, returns the reader ticks"""
+        if(ticks == self._ticks):
+            self._buffer_idx = (self._buffer_idx + 1) % len(self._buffer)
+            self._buffer[self._buffer_idx] = electric_field
+            self._ticks += 1
+
+            # All taps in one gather
+            self._tap_fields = self._buffer[(self._buffer_idx - self._tap_array) % len(self._buffer)]
+        return ticks + 1
+
+    def read(self, tap: int):
+        """DelayLine read method of the delayed field, None until the tap is filled"""
+        if(self._ticks <= self._tap_ready[tap]):
+            return None
+        return self._tap_fields[tap]
+
+    def replay(self, electric_field: ndarray, taps: tuple[int,...]|None = None):
+        """DelayLine replay method returning (n_taps, n_samples) delayed traces, zero until filled"""
+        #return super().replay(electric_field)
+        electric_field = as_field(electric_field)
+        taps = tuple(range(len(self._taps))) if(taps is None) else taps
+        n_samples = electric_field.shape[-1]
+
+        # One gather of every tap from the zero padded trace
+        padded = zeros(n_samples + self._buffer.size - 1, dtype=electric_field.dtype)
+        padded[self._buffer.size - 1:] = electric_field
+        rows = (self._buffer.size - 1) - asarray([self._taps[tap] for tap in taps], dtype=int)
+        return padded[rows[:, None] + arange(n_samples)]
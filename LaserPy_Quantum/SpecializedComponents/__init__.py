@@ -1,34 +1,44 @@
 """ SpecializedComponents for LaserPy_Quantum """
 
 from .ComponentDriver import CurrentDriver
+from .ComponentDriver import BitSequenceDriver
+from .ComponentDriver import prbs
 
 from .Interferometer import AsymmetricMachZehnderInterferometer
 
 from .Laser import Laser
 
 from .OpticalRegulator import VariableOpticalAttenuator
-# from .OpticalRegulator import OpticalCirculator
+from .OpticalRegulator import OpticalCirculator
+
+from .PassiveNetwork import PassiveNetwork
 
 from .PhotonDetector import SinglePhotonDetector
 from .PhotonDetector import PhaseSensitiveSPD
 
 from .SimpleDevices import PhaseSample, Mirror
 from .SimpleDevices import BeamSplitter
+from .SimpleDevices import DelayLine
 
 __all__ = [
     "CurrentDriver",
+    "BitSequenceDriver",
+    "prbs",
     
     "AsymmetricMachZehnderInterferometer",
 
     "Laser",
 
     "VariableOpticalAttenuator",
-    #"OpticalCirculator",
+    "OpticalCirculator",
+
+    "PassiveNetwork",
 
     "SinglePhotonDetector",
     "PhaseSensitiveSPD",
 
     "PhaseSample",
     "Mirror",
-    "BeamSplitter"
+    "BeamSplitter",
+    "DelayLine"
 ]
\ No newline at end of file
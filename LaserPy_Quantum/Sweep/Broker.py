@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from typing import Any, NamedTuple, TYPE_CHECKING
+
+import os
+import time
+
+from numpy import ndarray
+
+from ..Components import SimulationContext
+from ..Components import HealthMonitor
+from ..Components import SimulationDivergenceError
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+class SweepTask(NamedTuple):
+    """
+    SweepTask class\n
+    A compact class for {'task_id', 'factory', 'params', 'attempt', 'health_monitor'}.
+    """
+    task_id: int
+    factory: Callable[..., Any]
+    params: dict[str, Any]
+    attempt: int
+    health_monitor: HealthMonitor|None = None
+
+class SweepTaskResult(NamedTuple):
+    """
+    SweepTaskResult class\n
+    A compact class for {'task', 'columns', 'error', 'host', 'diverged'}.
+    """
+    task: SweepTask
+    columns: dict[str, ndarray]|None
+    error: str|None
+    host: str
+    diverged: bool = False
+
+def run_sweep_task(task: SweepTask) -> SweepTaskResult:
+    """build the Simulator of a sweep point, simulate it and collect its columns"""
+    from socket import gethostname
+    host = f"{gethostname()}:{os.getpid()}"
+    try:
+        # Point scoped Components, released after collecting columns
+        with SimulationContext(f"sweep_task_{task.task_id}"):
+            simulator = task.factory(**task.params)
+            if(task.health_monitor):
+                simulator.set_health_monitor(task.health_monitor)
+            simulator.simulate()
+            if(simulator.simulation_error):
+                return SweepTaskResult(task, None, repr(simulator.simulation_error), host,
+                                       isinstance(simulator.simulation_error, SimulationDivergenceError))
+            return SweepTaskResult(task, simulator.get_columns(), None, host)
+    except Exception as e:
+        return SweepTaskResult(task, None, repr(e), host)
+
+class Broker:
+    """
+    Broker class\n
+    Dispatches SweepTasks to workers and streams back SweepTaskResults.
+    """
+    def __init__(self, name: str = "default_broker"):
+        self.name = name
+
+        self._results: list[SweepTaskResult] = []
+        """in process results for Broker"""
+
+    def submit(self, task: SweepTask):
+        """Broker submit method to override"""
+        # In process execution
+        self._results.append(run_sweep_task(task))
+
+    def results(self) -> Iterator[SweepTaskResult]:
+        """Broker results method to override, yields results as they complete"""
+        while(self._results):
+            yield self._results.pop(0)
+
+    def pending(self) -> int:
+        """Broker pending method to override"""
+        return len(self._results)
+
+    def close(self):
+        """Broker close method to override"""
+        # Empty method
+        pass
+
+class LocalBroker(Broker):
+    """
+    LocalBroker class\n
+    Broker running sweep points in local worker processes.
+    """
+    def __init__(self, max_workers: int|None = None, name: str = "default_local_broker"):
+        super().__init__(name)
+        from concurrent.futures import ProcessPoolExecutor
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._futures: set[Future] = set()
+
+    def submit(self, task: SweepTask):
+        """LocalBroker submit method"""
+        self._futures.add(self._executor.submit(run_sweep_task, task))
+
+    def results(self):
+        """LocalBroker results method"""
+        from concurrent.futures import FIRST_COMPLETED, wait
+        while(self._futures):
+            done, self._futures = wait(self._futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+    def pending(self):
+        """LocalBroker pending method"""
+        return len(self._futures)
+
+    def close(self):
+        """LocalBroker close method"""
+        self._executor.shutdown(cancel_futures=True)
+
+def _atomic_dump(obj, filepath: str):
+    """pickle obj to filepath through an atomic rename"""
+    import pickle
+    temp_filepath = f"{filepath}.{os.getpid()}.tmp"
+    with open(temp_filepath, "wb") as f:
+        pickle.dump(obj, f)
+    os.replace(temp_filepath, filepath)
+
+class FileBroker(Broker):
+    """
+    FileBroker class\n
+    Broker exchanging pickled tasks and results through a shared directory.\n
+    Workers on any host with the directory mounted run\n
+    python -m LaserPy_Quantum.Sweep <directory>\n
+    Claims not refreshed by a worker heartbeat within lease_timeout go back to the task queue.
+    """
+    def __init__(self, directory: str, poll_interval: float = 0.2, lease_timeout: float = 60.0, 
+                timeout: float|None = None, name: str = "default_file_broker"):
+        super().__init__(name)
+        self._directory = directory
+        self._poll_interval = poll_interval
+        self._pending: set[int] = set()
+
+        self._lease_timeout = lease_timeout
+        """seconds without a heartbeat after which a claimed task is requeued"""
+
+        self._timeout = timeout
+        """seconds for results to collect every pending task, None waits forever"""
+
+        for sub_directory in ("tasks", "claimed", "results"):
+            os.makedirs(os.path.join(directory, sub_directory), exist_ok=True)
+
+    def submit(self, task: SweepTask):
+        """FileBroker submit method"""
+        _atomic_dump(task, os.path.join(self._directory, "tasks", f"{task.task_id}_{task.attempt}.pkl"))
+        self._pending.add(task.task_id)
+
+    def _requeue_stale_claims(self):
+        """FileBroker _requeue_stale_claims method moving claims of dead workers back to tasks"""
+        claimed_directory = os.path.join(self._directory, "claimed")
+        now = time.time()
+        for filename in os.listdir(claimed_directory):
+            if(not filename.endswith(".pkl")):
+                continue
+            filepath = os.path.join(claimed_directory, filename)
+            try:
+                if(now - os.path.getmtime(filepath) < self._lease_timeout):
+                    continue
+                # {task_id}_{attempt}.{worker_id}.pkl back to {task_id}_{attempt}.pkl
+                os.rename(filepath, os.path.join(self._directory, "tasks", f"{filename.split('.', 1)[0]}.pkl"))
+                print(f"{self.name} requeued {filename}, lease expired")
+            except OSError:
+                # Finished or requeued meanwhile
+                continue
+
+    def results(self):
+        """FileBroker results method, raises TimeoutError when timeout passes with pending tasks"""
+        import pickle
+        results_directory = os.path.join(self._directory, "results")
+        deadline = None if(self._timeout is None) else time.monotonic() + self._timeout
+        while(self._pending):
+            found = False
+            for filename in sorted(os.listdir(results_directory)):
+                if(not filename.endswith(".pkl")):
+                    continue
+                filepath = os.path.join(results_directory, filename)
+                with open(filepath, "rb") as f:
+                    result: SweepTaskResult = pickle.load(f)
+                os.remove(filepath)
+
+                # Late result of a requeued task that already finished
+                if(result.task.task_id not in self._pending):
+                    continue
+                found = True
+                self._pending.discard(result.task.task_id)
+                yield result
+            if(not found):
+                if(deadline is not None and time.monotonic() > deadline):
+                    raise TimeoutError(f"{self.name} timed out after {self._timeout} s with pending tasks {sorted(self._pending)}")
+                self._requeue_stale_claims()
+                time.sleep(self._poll_interval)
+
+    def pending(self):
+        """FileBroker pending method"""
+        return len(self._pending)
+
+def _heartbeat(filepath: str, interval: float, stop):
+    """touch filepath every interval seconds until stop is set, renews the FileBroker lease"""
+    while(not stop.wait(interval)):
+        try:
+            os.utime(filepath)
+        except OSError:
+            # Requeued by the broker
+            return
+
+def run_file_worker(directory: str, poll_interval: float = 0.2, idle_timeout: float|None = None,
+                    heartbeat_interval: float = 10.0):
+    """FileBroker worker loop claiming tasks from directory until idle_timeout, 
+    heartbeat_interval must stay well below the broker lease_timeout"""
+    import pickle
+    from socket import gethostname
+    from threading import Event, Thread
+
+    tasks_directory = os.path.join(directory, "tasks")
+    claimed_directory = os.path.join(directory, "claimed")
+    results_directory = os.path.join(directory, "results")
+
+    # Workers may start before the FileBroker
+    for sub_directory in (tasks_directory, claimed_directory, results_directory):
+        os.makedirs(sub_directory, exist_ok=True)
+    worker_id = f"{gethostname()}_{os.getpid()}"
+
+    idle_since = time.monotonic()
+    while(idle_timeout is None or time.monotonic() - idle_since < idle_timeout):
+        claimed = None
+        for filename in sorted(os.listdir(tasks_directory)):
+            if(not filename.endswith(".pkl")):
+                continue
+
+            # Rename is atomic, only one worker claims a task
+            claimed = os.path.join(claimed_directory, f"{filename[:-4]}.{worker_id}.pkl")
+            try:
+                os.rename(os.path.join(tasks_directory, filename), claimed)
+                break
+            except OSError:
+                claimed = None
+
+        if(claimed is None):
+            time.sleep(poll_interval)
+            continue
+
+        # Lease starts at the claim, rename keeps the submit time
+        try:
+            os.utime(claimed)
+            with open(claimed, "rb") as f:
+                task: SweepTask = pickle.load(f)
+        except OSError:
+            continue
+
+        # Lease renewed while the task runs
+        stop = Event()
+        heartbeat = Thread(target=_heartbeat, args=(claimed, heartbeat_interval, stop), daemon=True)
+        heartbeat.start()
+        try:
+            result = run_sweep_task(task)
+        finally:
+            stop.set()
+            heartbeat.join()
+        _atomic_dump(result, os.path.join(results_directory, f"{task.task_id}_{task.attempt}.pkl"))
+        try:
+            os.remove(claimed)
+        except OSError:
+            # Lease expired and the task was requeued
+            pass
+        idle_since = time.monotonic()
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+import os
+
+from numpy import (
+    ndarray,
+    asarray, load, savez
+)
+
+from .Broker import SweepTask
+from .Broker import SweepTaskResult
+from .Broker import Broker
+
+from ..Components import HealthMonitor
+
+from ..Results.Archive import TraceArchive
+from ..Results.Archive import write_archive
+
+class SweepResultStore:
+    """
+    SweepResultStore class\n
+    Columnar store of sweep point results, in memory or in a directory.
+    """
+    def __init__(self, directory: str|None = None, compression: bool = False, tolerance: float|dict[str, float]|None = None, 
+                name: str = "default_sweep_result_store"):
+        self.name = name
+        self._directory = directory
+
+        self._compression = compression or bool(tolerance)
+        """points stored as compressed TraceArchives for SweepResultStore"""
+
+        self._tolerance = tolerance
+        """lossy quantization tolerance of compressed points for SweepResultStore"""
+
+        self._index: dict[int, dict[str, Any]] = {}
+        """task_id index of params, status and host for SweepResultStore"""
+
+        self._columns: dict[int, dict[str, ndarray]] = {}
+        """in memory columns for SweepResultStore"""
+
+        if(directory):
+            os.makedirs(directory, exist_ok=True)
+            index_filepath = os.path.join(directory, "index.jsonl")
+            if(os.path.exists(index_filepath)):
+                import json
+                with open(index_filepath) as f:
+                    for line in f:
+                        entry = json.loads(line)
+                        self._index[entry['task_id']] = entry
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def append(self, task_id: int, params: dict[str, Any], columns: dict[str, ndarray]|None,
+               status: str = "done", error: str|None = None, host: str = ""):
+        """SweepResultStore append method"""
+        entry = {'task_id': task_id, 'params': params, 'status': status, 'error': error, 'host': host}
+        self._index[task_id] = entry
+
+        if(self._directory):
+            import json
+            if(columns is not None and self._compression):
+                write_archive(os.path.join(self._directory, f"point_{task_id}.lpqa"), columns, tolerance=self._tolerance)
+            elif(columns is not None):
+                savez(os.path.join(self._directory, f"point_{task_id}.npz"), **columns)
+            with open(os.path.join(self._directory, "index.jsonl"), "a") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+        elif(columns is not None):
+            self._columns[task_id] = columns
+
+    def get_index(self):
+        """SweepResultStore get_index method"""
+        return dict(self._index)
+
+    def get_params(self, status: str = "done"):
+        """SweepResultStore get_params method as columns of parameter values"""
+        entries = [entry for entry in self._index.values() if(entry['status'] == status)]
+        keys = {key for entry in entries for key in entry['params']}
+        params = {key: asarray([entry['params'].get(key) for entry in entries]) for key in sorted(keys)}
+        params['task_id'] = asarray([entry['task_id'] for entry in entries])
+        return params
+
+    def load(self, task_id: int) -> dict[str, ndarray]:
+        """SweepResultStore load method for columns of one sweep point"""
+        if(self._directory):
+            archive_filepath = os.path.join(self._directory, f"point_{task_id}.lpqa")
+            if(os.path.exists(archive_filepath)):
+                with TraceArchive(archive_filepath) as archive:
+                    return {key: archive.read(key) for key in archive.keys()}
+            with load(os.path.join(self._directory, f"point_{task_id}.npz")) as data:
+                return {key: data[key] for key in data.files}
+        return self._columns[task_id]
+
+    def get_column(self, key: str, status: str = "done"):
+        """SweepResultStore get_column method across all sweep points"""
+        return {task_id: self.load(task_id)[key] for task_id, entry in self._index.items() if(entry['status'] == status)}
+
+class SweepRunner:
+    """
+    SweepRunner class\n
+    Runs a Simulator setup factory over parameter points through a Broker.
+    """
+    def __init__(self, factory: Callable[..., Any], broker: Broker|None = None, store: SweepResultStore|None = None,
+                max_retries: int = 2, health_monitor: HealthMonitor|None = None, name: str = "default_sweep_runner"):
+        self.name = name
+
+        self._factory = factory
+        """picklable factory(**params) returning a set Simulator"""
+
+        self._broker = broker if(broker) else Broker()
+        self.store = store if(store) else SweepResultStore()
+        self._max_retries = max_retries
+
+        self._health_monitor = health_monitor
+        """HealthMonitor of every point, diverged points abort early and are not retried"""
+
+    def run(self, param_points: Iterable[dict[str, Any]]):
+        """SweepRunner run method returning the SweepResultStore"""
+        for task_id, params in enumerate(param_points):
+            self._broker.submit(SweepTask(task_id, self._factory, dict(params), 0, self._health_monitor))
+
+        n_done = n_failed = n_diverged = 0
+        for result in self._broker.results():
+            task = result.task
+            if(result.error is None):
+                self.store.append(task.task_id, task.params, result.columns, host=result.host)
+                n_done += 1
+            elif(result.diverged):
+                # Deterministic divergence, a retry diverges again
+                self.store.append(task.task_id, task.params, None, status="diverged", error=result.error, host=result.host)
+                n_diverged += 1
+            elif(self._should_retry(result)):
+                print(f"{self.name} retrying point {task.task_id} after: {result.error}")
+                self._broker.submit(task._replace(attempt=task.attempt + 1))
+            else:
+                self.store.append(task.task_id, task.params, None, status="failed", error=result.error, host=result.host)
+                n_failed += 1
+
+        print(f"{self.name} complete: {n_done} points done, {n_failed} failed, {n_diverged} diverged")
+        return self.store
+
+    def _should_retry(self, result: SweepTaskResult):
+        """SweepRunner _should_retry method"""
+        return result.task.attempt < self._max_retries
+
+    def close(self):
+        """SweepRunner close method"""
+        self._broker.close()
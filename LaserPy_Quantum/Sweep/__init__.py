@@ -0,0 +1,25 @@
+""" Sweep execution for LaserPy_Quantum """
+
+from .Broker import SweepTask
+from .Broker import SweepTaskResult
+from .Broker import (
+    Broker,
+    LocalBroker,
+    FileBroker
+)
+from .Broker import run_file_worker
+
+from .Runner import SweepResultStore
+from .Runner import SweepRunner
+
+__all__ = [
+    "SweepTask",
+    "SweepTaskResult",
+    "Broker",
+    "LocalBroker",
+    "FileBroker",
+    "run_file_worker",
+
+    "SweepResultStore",
+    "SweepRunner"
+]
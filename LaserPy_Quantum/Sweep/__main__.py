@@ -0,0 +1,12 @@
+""" FileBroker worker: python -m LaserPy_Quantum.Sweep <directory> [idle_timeout] """
+
+import sys
+
+from .Broker import run_file_worker
+
+if __name__ == "__main__":
+    if(len(sys.argv) < 2):
+        print("usage: python -m LaserPy_Quantum.Sweep <directory> [idle_timeout]")
+        sys.exit(1)
+
+    run_file_worker(sys.argv[1], idle_timeout=float(sys.argv[2]) if(len(sys.argv) > 2) else None)
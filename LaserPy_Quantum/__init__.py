@@ -12,17 +12,70 @@ from .Components import (
 )
 from .Components import ArbitaryWaveGenerator
 
+from .Components import SimulationContext
+
 from .Components import Connection
+from .Components import DelayConnection
 from .Components import Simulator
+from .Components import HealthMonitor
+from .Components import SimulationDivergenceError
+from .Components import SimulationProgress
+from .Components import print_progress
+from .Components import PeriodicSteadyState
 
 from .SpecializedComponents import CurrentDriver
+from .SpecializedComponents import BitSequenceDriver
+from .SpecializedComponents import prbs
 from .SpecializedComponents import Laser
 from .SpecializedComponents import VariableOpticalAttenuator
+from .SpecializedComponents import OpticalCirculator
 from .SpecializedComponents import AsymmetricMachZehnderInterferometer
+from .SpecializedComponents import PassiveNetwork
+from .SpecializedComponents import DelayLine
+
+from .Analysis import SpectrumEstimator
+from .Analysis import (
+    optical_spectrum,
+    relative_intensity_noise,
+    frequency_noise,
+    linewidth
+)
+from .Analysis import AMZICalibration
+from .Analysis import calibrate_amzi
+from .Analysis import estimate_time_step
+from .Analysis import check_convergence
+from .Analysis import TimeTagStream
+from .Analysis import (
+    clicks_from_intensity,
+    coincidences,
+    correlation_histogram,
+    g2,
+    bin_slots
+)
+
+from .Results import SimulationResult
+from .Results import TraceArchive
+from .Results import ResultCache
+
+from .Sweep import (
+    SweepRunner,
+    SweepResultStore,
+    LocalBroker,
+    FileBroker
+)
+
+from .Precision import PrecisionPolicy
+from .Precision import (
+    DOUBLE_PRECISION,
+    MIXED_PRECISION,
+    get_precision_policy,
+    set_precision_policy
+)
 
 from .utils import (
     display_class_instances_data,
     display_laser_field,
+    replay_chain,
     get_time_delay_phase_correction
 )
 
@@ -37,16 +90,61 @@ __all__ = [
     "AlternatingPulseWave",
     "ArbitaryWaveGenerator",
     
+    "SimulationContext",
+
     "Connection",
+    "DelayConnection",
     "Simulator",
+    "HealthMonitor",
+    "SimulationDivergenceError",
+    "SimulationProgress",
+    "print_progress",
+    "PeriodicSteadyState",
 
     "CurrentDriver",
+    "BitSequenceDriver",
+    "prbs",
     "Laser",
     "VariableOpticalAttenuator",
+    "OpticalCirculator",
     "AsymmetricMachZehnderInterferometer",
+    "PassiveNetwork",
+    "DelayLine",
+
+    "SpectrumEstimator",
+    "optical_spectrum",
+    "relative_intensity_noise",
+    "frequency_noise",
+    "linewidth",
+    "AMZICalibration",
+    "calibrate_amzi",
+    "estimate_time_step",
+    "check_convergence",
+    "TimeTagStream",
+    "clicks_from_intensity",
+    "coincidences",
+    "correlation_histogram",
+    "g2",
+    "bin_slots",
+
+    "SimulationResult",
+    "TraceArchive",
+    "ResultCache",
+
+    "SweepRunner",
+    "SweepResultStore",
+    "LocalBroker",
+    "FileBroker",
+
+    "PrecisionPolicy",
+    "DOUBLE_PRECISION",
+    "MIXED_PRECISION",
+    "get_precision_policy",
+    "set_precision_policy",
 
     "display_class_instances_data",
     "display_laser_field",
+    "replay_chain",
     "get_time_delay_phase_correction"
 ]
 
@@ -1,16 +1,14 @@
 from typing import TypedDict, NamedTuple
 
-import matplotlib.pyplot as plt
 from numpy import (
     complexfloating,
     ndarray,
-    array, mod, sqrt,
+    arange, mod, sqrt,
     pi
 )
+from .Components.Component import Component
 from .Components import DataComponent
 
-from .Constants import FIG_WIDTH, FIG_HEIGHT
-
 class InjectionField(TypedDict):
     """
     InjectionField class\n
@@ -21,7 +19,7 @@ class InjectionField(TypedDict):
     electric_field: complexfloating
     frequency: float
 
-def display_class_instances_data(class_instances: tuple[DataComponent,...], time_data: ndarray, simulation_keys:tuple[str,...]|None=None):
+def display_class_instances_data(class_instances: tuple[DataComponent,...], time_data: ndarray, simulation_keys:tuple[str,...]|None=None, filepath:str|None=None):
     """display merged graph for comparision of same class members data"""
     class_type = type(class_instances[0])
     
@@ -37,8 +35,6 @@ def display_class_instances_data(class_instances: tuple[DataComponent,...], time
             return
         _class_data[str(instance)] = instance.get_data()
 
-    plt.figure(figsize=(FIG_WIDTH, FIG_HEIGHT))
-
     key_tuple = tuple(_class_data_units)
     
     # Display fixed tuple of data
@@ -49,29 +45,15 @@ def display_class_instances_data(class_instances: tuple[DataComponent,...], time
                 key_list.append(key)
         key_tuple = tuple(key_list)
 
-    max_hf_plots = 1 + (len(key_tuple) >> 1)
-    sub_plot_idx = 1
-
     # Time adjustment
     time_data = time_data[-len(_class_data[str(class_instances[0])][key_tuple[0]]):]
 
-    # Key plot
-    for key in key_tuple:
-        plt.subplot(max_hf_plots, 2, sub_plot_idx)
-
-        # Component plot
-        for instance in _class_data:
-            plt.plot(time_data, array(_class_data[instance][key]), label=str(instance))
-        plt.xlabel(r"Time $(s)$")
-        plt.ylabel(key.capitalize() + _class_data_units[key])
-        
-        plt.grid()
-        plt.legend()
-        sub_plot_idx += 1
-
-    plt.suptitle(f"data of {class_type.__name__}s")
-    plt.tight_layout()
-    plt.show()
+    # Key plot of every Component
+    from .Plotting import plot_series
+    plot_series(f"data of {class_type.__name__}s", time_data,
+                {key: {instance: _class_data[instance][key] for instance in _class_data} for key in key_tuple},
+                {key: key.capitalize() + _class_data_units[key] for key in key_tuple},
+                filepath=filepath)
         
 ########## Circulator Dependency Resolved ##########
 from .SpecializedComponents import CurrentDriver
@@ -85,28 +67,30 @@ class LaserRunnerComponents(NamedTuple):
     current_driver: CurrentDriver
     laser: Laser
 
-def display_laser_field(laser: Laser):
+def display_laser_field(laser: Laser, filepath:str|None=None):
     """display complex laser field with relative phase"""
-    plt.figure(figsize=(FIG_WIDTH, FIG_HEIGHT)) # Create a figure for the plot
-    plt.suptitle(f"Field of {laser}")
-    
     # Magnitude and Phase plot
     laser_data = laser.get_data()
-    for p, key in enumerate(("photon", "phase")):
-        plt.subplot(1, 2, p + 1)
-        if(key == 'photon'):
-            plt.plot(sqrt(laser_data[key]))
-            plt.ylabel("Magnitude of electric_field")
-        elif(key == 'phase'):
-            phase_angle = mod(laser_data[key], 2 * pi) - pi
-            plt.plot(phase_angle)
-            plt.ylabel("Phase of electric_field")
-        plt.grid()
-
-    plt.tight_layout()
-    plt.show()
-
-def get_time_delay_phase_correction(laser: Laser, time_delay: float):
-    """calculate and return the phase correction for given time_delay"""
-    phase_correction:float = mod(2 * pi * laser._free_running_freq * time_delay, 2 * pi) - pi
+    magnitude = sqrt(laser_data['photon'])
+    phase_angle = mod(laser_data['phase'], 2 * pi) - pi
+
+    from .Plotting import plot_series
+    plot_series(f"Field of {laser}", arange(len(magnitude)),
+                {'photon': {'photon': magnitude}, 'phase': {'phase': phase_angle}},
+                {'photon': "Magnitude of electric_field", 'phase': "Phase of electric_field"},
+                xlabel=None, filepath=filepath, legend=False)
+
+def replay_chain(electric_field: ndarray, components: tuple[Component,...]):
+    """replay a recorded field through passive components in order, multi port outputs continue on 'electric_field'"""
+    for component in components:
+        electric_field = component.replay(electric_field)
+        if(electric_field is None):
+            return None
+        if(isinstance(electric_field, tuple)):
+            electric_field = electric_field[0]
+    return electric_field
+
+def get_time_delay_phase_correction(laser: Laser, time_delay: float|ndarray):
+    """calculate and return the phase correction for given time_delay or array of time_delays"""
+    phase_correction:float|ndarray = mod(2 * pi * laser._free_running_freq * time_delay, 2 * pi) - pi
     return phase_correction
\ No newline at end of file
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+import timeit
+
+############################################################################
+# Import time budget of LaserPy_Quantum over its numpy dependency (ms)
+IMPORT_TIME_BUDGET_MS = 25.0
+REPEAT = 10
+
+# Modules that must not be loaded by a bare import
+LAZY_MODULES = ("matplotlib", "importlib.resources", "json", "uuid", "numpy.random")
+
+############################################################################
+
+def timed_import(statement: str):
+    """Fastest wall time (ms) of a fresh interpreter running statement"""
+    times = []
+    for _ in range(REPEAT):
+        start = timeit.default_timer()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        times.append((timeit.default_timer() - start) * 1000)
+    return min(times)
+
+# ------------------------------------------------------------------
+
+print("Starting the import time benchmark...")
+
+interpreter_ms = timed_import("pass")
+numpy_ms = timed_import("import numpy")
+package_ms = timed_import("import LaserPy_Quantum")
+
+loaded = subprocess.run([sys.executable, "-c",
+                        "import sys, LaserPy_Quantum; print(' '.join(m for m in sys.argv[1:] if m in sys.modules))",
+                        *LAZY_MODULES], check=True, capture_output=True, text=True).stdout.split()
+
+package_overhead_ms = package_ms - numpy_ms
+
+print(f"\n--- Import times (fastest of {REPEAT}, fresh interpreter) ---")
+print(f"Interpreter startup: {interpreter_ms:.3f} ms")
+print(f"import numpy: {numpy_ms:.3f} ms")
+print(f"import LaserPy_Quantum: {package_ms:.3f} ms")
+print(f"LaserPy_Quantum over numpy: {package_overhead_ms:.3f} ms (budget {IMPORT_TIME_BUDGET_MS:.3f} ms)")
+print(f"Eagerly loaded lazy modules: {loaded if loaded else 'none'}")
+print(f"---------------------------------------------------\n")
+
+if(package_overhead_ms > IMPORT_TIME_BUDGET_MS or loaded):
+    print("Import time budget exceeded.")
+    sys.exit(1)
+print("Import time benchmark complete.")
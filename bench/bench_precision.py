@@ -0,0 +1,97 @@
+import sys
+
+import numpy as np
+
+############################################################################
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import Connection, Simulator
+from LaserPy_Quantum import StaticWave, ArbitaryWaveGenerator
+from LaserPy_Quantum import CurrentDriver
+from LaserPy_Quantum import Laser
+from LaserPy_Quantum import VariableOpticalAttenuator
+from LaserPy_Quantum import AsymmetricMachZehnderInterferometer
+from LaserPy_Quantum import replay_chain
+from LaserPy_Quantum import DOUBLE_PRECISION, MIXED_PRECISION, set_precision_policy
+
+from LaserPy_Quantum.Precision import trace_error_bound, field_error_bound
+
+############################################################################
+dt = 1e-12
+t_final = 5 * 1e-9
+
+# Current Constants
+I_th = 0.0178
+MASTER_BASE_DC = 1.4 * I_th
+
+mBase = StaticWave("mBase", MASTER_BASE_DC)
+
+AWG = ArbitaryWaveGenerator()
+AWG.set(mBase)
+
+############################################################################
+
+current_driver1 = CurrentDriver(AWG)
+current_driver1.set(mBase)
+
+master_laser = Laser(name= "master_laser")
+
+simulator_clock = Clock(dt)
+
+simulator = Simulator(simulator_clock)
+
+simulator.set((
+    Connection(simulator_clock, current_driver1),
+    Connection(current_driver1, master_laser),
+))
+
+attenuator = VariableOpticalAttenuator(3.0)
+interferometer = AsymmetricMachZehnderInterferometer(simulator_clock, 50 * dt)
+interferometer.set_phases(0.3, 1.2)
+
+# ------------------------------------------------------------------
+
+def simulate_with(policy):
+    """stored Laser traces, trace bytes and replayed SPD intensities under policy"""
+    set_precision_policy(policy)
+    master_laser.reset_data()
+    master_laser.set_state(initial_state)
+    simulator.reset_data()
+    simulator.reset(True)
+    simulator_clock.set(t_final)
+    simulator.simulate()
+
+    trace_bytes = sum(trace.itemsize * len(trace) for trace in master_laser._simulation_data.values())
+    laser_data = master_laser.get_data()
+    intensity = interferometer.replay_SPD(replay_chain(master_laser.get_field_data(), (attenuator,)))['SPD0']['intensity']
+    return laser_data, trace_bytes, intensity
+
+print("Starting the precision benchmark...")
+
+initial_state = master_laser.get_state()
+double_data, double_bytes, double_intensity = simulate_with(DOUBLE_PRECISION)
+mixed_data, mixed_bytes, mixed_intensity = simulate_with(MIXED_PRECISION)
+set_precision_policy(DOUBLE_PRECISION)
+
+print(f"\n--- Mixed precision against double precision ---")
+failed = False
+for key in double_data:
+    bound = 0.0 if(key in master_laser._double_precision_keys) else trace_error_bound(MIXED_PRECISION)
+    reference = np.abs(double_data[key].astype(np.float64))
+    error = np.abs(mixed_data[key].astype(np.float64) - double_data[key])
+    relative_error = np.max(error / np.where(reference > 0, reference, 1.0))
+    print(f"{key}: {mixed_data[key].dtype} relative error {relative_error:.3e} (bound {bound:.3e})")
+    failed |= relative_error > bound
+
+# Replayed field sees the rounded trace and 4 devices: VOA, input splitter, phase sample, output joiner
+intensity_bound = 2 * trace_error_bound(MIXED_PRECISION) + field_error_bound(4, MIXED_PRECISION)
+intensity_error = np.max(np.abs(mixed_intensity - double_intensity)) / np.max(double_intensity)
+print(f"SPD0 replay: {mixed_intensity.dtype} relative error {intensity_error:.3e} (bound {intensity_bound:.3e})")
+failed |= intensity_error > intensity_bound
+
+print(f"Laser trace memory: {double_bytes} bytes double, {mixed_bytes} bytes mixed")
+print(f"---------------------------------------------------\n")
+
+if(failed):
+    print("Precision error bounds exceeded.")
+    sys.exit(1)
+print("Precision benchmark complete.")
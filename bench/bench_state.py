@@ -0,0 +1,68 @@
+import sys
+import timeit
+import tracemalloc
+
+############################################################################
+from LaserPy_Quantum import Laser
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import Connection, Simulator
+from LaserPy_Quantum import StaticWave, ArbitaryWaveGenerator
+from LaserPy_Quantum import CurrentDriver
+
+from LaserPy_Quantum.Components.Component import _instance_attributes
+
+############################################################################
+N_INSTANCES = 10000
+N_READS = 1000000
+
+# ------------------------------------------------------------------
+
+class DictState:
+    """plain instance holding attributes in its __dict__, the layout before __slots__"""
+    def __init__(self, attributes: dict):
+        self.__dict__.update(attributes)
+
+def instance_bytes(factory):
+    """bytes allocated per instance by factory, shared objects excluded"""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(N_INSTANCES)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del instances
+    return used / N_INSTANCES
+
+laser = Laser()
+laser_dict = DictState(_instance_attributes(laser))
+
+print("Starting the state layout benchmark...")
+
+# Only the instance layout is measured, attribute values are shared
+slotted_bytes = instance_bytes(lambda: Laser.__new__(Laser))
+dict_bytes = instance_bytes(lambda: DictState(laser_dict.__dict__))
+
+slotted_read = min(timeit.repeat("laser.photon; laser.carrier; laser.phase; laser.current", 
+                                 globals={'laser': laser}, number=N_READS, repeat=5))
+dict_read = min(timeit.repeat("laser.photon; laser.carrier; laser.phase; laser.current", 
+                              globals={'laser': laser_dict}, number=N_READS, repeat=5))
+
+AWG = ArbitaryWaveGenerator()
+mBase = StaticWave("mBase", 0.03)
+AWG.set(mBase)
+driver = CurrentDriver(AWG)
+driver.set(mBase)
+clock = Clock(1e-12)
+simulator = Simulator(clock)
+simulator.set((Connection(clock, driver), Connection(driver, laser)))
+snapshot_seconds = min(timeit.repeat(simulator.snapshot_state, number=10000, repeat=5)) / 10000
+
+print(f"\n--- Laser state layout ({N_INSTANCES} instances, {N_READS} reads) ---")
+print(f"Instance bytes: slotted {slotted_bytes:.0f}, __dict__ {dict_bytes:.0f} ({dict_bytes / slotted_bytes:.2f}x)")
+print(f"Hot state read: slotted {slotted_read * 1e9 / N_READS:.1f} ns, __dict__ {dict_read * 1e9 / N_READS:.1f} ns")
+print(f"snapshot_state: {snapshot_seconds * 1e6:.2f} us for {len(simulator.snapshot_state().dtype.names)} fields")
+print(f"---------------------------------------------------\n")
+
+if(slotted_bytes >= dict_bytes):
+    print("Slotted state uses no less memory.")
+    sys.exit(1)
+print("State layout benchmark complete.")
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum.Results import SimulationResult
+from LaserPy_Quantum.Results import TraceArchive
+from LaserPy_Quantum.Results import write_archive
+
+@pytest.fixture
+def columns():
+    rng = np.random.default_rng(0)
+    n_samples = 5000
+    return {'time': np.arange(n_samples) * 1e-12,
+            'laser.photon': rng.random(n_samples) * 1e20,
+            'laser.phase': np.cumsum(rng.normal(size=n_samples)),
+            'detector.counts': rng.integers(-5, 5, n_samples).astype(np.int32),
+            'detector.clicked': rng.random(n_samples) > 0.5,
+            'amzi.field': (rng.normal(size=n_samples) + 1j * rng.normal(size=n_samples)).astype(np.complex64),
+            'amzi.intensity': rng.random(n_samples).astype(np.float32)}
+
+@pytest.mark.parametrize("codec", ["zlib", None])
+def test_archive_round_trip_lossless(tmp_path, columns, codec):
+    filepath = str(tmp_path / "trace.lpqa")
+    write_archive(filepath, columns, chunk_size=1000, codec=codec)
+    with TraceArchive(filepath) as archive:
+        assert archive.keys() == tuple(columns)
+        for key, values in columns.items():
+            assert archive[key].dtype == values.dtype
+            assert np.array_equal(archive[key], values)
+
+        # Random access across chunk boundaries
+        assert np.array_equal(archive.read('laser.phase', 990, 2010), columns['laser.phase'][990:2010])
+        assert archive.read('laser.phase', 10, 10).size == 0
+
+def test_archive_round_trip_lossy(tmp_path, columns):
+    filepath = str(tmp_path / "trace.lpqa")
+    tolerance = 1e-4
+    write_archive(filepath, columns, chunk_size=1000, tolerance={'laser.phase': tolerance, 'amzi.field': tolerance,
+                                                                 'amzi.intensity': tolerance, 'detector.counts': tolerance})
+    with TraceArchive(filepath) as archive:
+        for key in ('laser.phase', 'amzi.intensity'):
+            assert np.abs(archive[key].astype(np.float64) - columns[key]).max() <= tolerance
+        field = archive['amzi.field']
+        assert np.abs(field.real.astype(np.float64) - columns['amzi.field'].real).max() <= tolerance
+        assert np.abs(field.imag.astype(np.float64) - columns['amzi.field'].imag).max() <= tolerance
+
+        # Integer and untoleranced columns stay exact
+        assert np.array_equal(archive['detector.counts'], columns['detector.counts'])
+        assert np.array_equal(archive['laser.photon'], columns['laser.photon'])
+
+def test_archive_simulation_result(tmp_path, columns):
+    time_data = columns.pop('time')
+    result = SimulationResult(time_data, columns, {'laser.photon': "m^-3"})
+    filepath = str(tmp_path / "result.lpqa")
+    result.to_archive(filepath, chunk_size=512)
+    with TraceArchive(filepath) as archive:
+        restored = archive.to_result()
+        assert archive.get_units()['laser.photon'] == "m^-3"
+    assert np.array_equal(restored.time, result.time)
+    for key in result.keys():
+        assert np.array_equal(restored[key], result[key])
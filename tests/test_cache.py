@@ -0,0 +1,65 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import PhysicalComponent
+from LaserPy_Quantum import ArbitaryWaveGenerator, StaticWave
+from LaserPy_Quantum import CurrentDriver, Laser
+from LaserPy_Quantum import AsymmetricMachZehnderInterferometer
+from LaserPy_Quantum import Connection, Simulator
+from LaserPy_Quantum import ResultCache
+from LaserPy_Quantum import SimulationContext
+
+OFFSET = 1.0
+
+class OffsetComponent(PhysicalComponent):
+    def simulate(self, clock, _data=None):
+        self._data = clock.t + OFFSET
+
+def _build_simulator():
+    AWG = ArbitaryWaveGenerator()
+    modulation = StaticWave("modulation", 0.03)
+    AWG.set(modulation)
+
+    clock = Clock(1e-12, 2e-12)
+    clock.set(5e-10)
+    driver = CurrentDriver(AWG)
+    driver.set(modulation)
+    laser = Laser(name="laser")
+    amzi = AsymmetricMachZehnderInterferometer(clock, 5e-11, save_simulation=True)
+
+    simulator = Simulator(clock)
+    simulator.set((Connection(clock, driver), Connection(driver, laser), Connection(laser, amzi),
+                   Connection(clock, OffsetComponent())))
+    simulator.reset(True)
+    return simulator
+
+def _run(cache):
+    with SimulationContext():
+        simulator = _build_simulator()
+        with warnings.catch_warnings():
+            # Component names like SPD_π stay out of the npy headers
+            warnings.simplefilter("error", UserWarning)
+            result = cache.simulate(simulator)
+        return result, simulator.snapshot_state().item(), simulator.simulation_clock.t
+
+def test_cache_hit_restores_results_and_state(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    result, state, t = _run(cache)
+    cached_result, cached_state, cached_t = _run(cache)
+    assert (cache.misses, cache.hits) == (1, 1)
+
+    assert cached_t == t
+    assert all(np.array_equal(cached_value, value) for cached_value, value in zip(cached_state, state))
+    assert np.array_equal(cached_result.time, result.time)
+    for column_name, values in result.to_dict().items():
+        assert np.array_equal(cached_result.to_dict()[column_name], values)
+
+def test_cache_misses_on_user_global_change(tmp_path, monkeypatch):
+    cache = ResultCache(str(tmp_path))
+    _run(cache)
+    monkeypatch.setattr(__import__(__name__), "OFFSET", 2.0)
+    _run(cache)
+    assert (cache.misses, cache.hits) == (2, 0)
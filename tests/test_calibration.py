@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import AsymmetricMachZehnderInterferometer
+from LaserPy_Quantum import SimulationContext
+
+DT = 1e-12
+DELAY_SAMPLES = 5
+
+def _field(n_samples=2000, seed=0):
+    # Slowly wandering phase, the delayed arm stays partly coherent
+    rng = np.random.default_rng(seed)
+    phase = np.cumsum(rng.normal(scale=0.05, size=n_samples)) + 0.8 * np.arange(n_samples)
+    return (1 + 0.1 * rng.normal(size=n_samples)) * np.exp(1j * phase)
+
+def _replay_visibility(amzi, electric_field):
+    detectors = amzi.replay_SPD(electric_field)
+    # Samples where both arms carry field
+    energy_SPD0 = detectors['SPD0']['intensity'][DELAY_SAMPLES:].sum()
+    energy_SPD1 = detectors['SPD1']['intensity'][DELAY_SAMPLES:].sum()
+    return (energy_SPD0 - energy_SPD1) / (energy_SPD0 + energy_SPD1)
+
+@pytest.fixture
+def amzi():
+    with SimulationContext():
+        yield AsymmetricMachZehnderInterferometer(Clock(DT), (DELAY_SAMPLES + 0.5) * DT)
+
+def test_calibration_matches_replayed_phases(amzi):
+    electric_field = _field()
+    calibration = amzi.calibrate(electric_field, DT, phases=np.linspace(0, 2 * np.pi, 37), apply=False)
+    assert calibration.visibilities.shape == (37, 1, 1)
+
+    amzi._long_arm_phase_sample.set(0.0)
+    for phase, visibility in zip(calibration.phases, calibration.visibilities[:, 0, 0]):
+        amzi._short_arm_phase_sample.set(phase)
+        assert _replay_visibility(amzi, electric_field) == pytest.approx(visibility, abs=1e-12)
+
+def test_calibration_applies_optimum(amzi):
+    electric_field = _field(seed=1)
+    calibration = amzi.calibrate(electric_field, DT, splitting_ratios_ti=np.array([0.3, 0.5, 0.7]))
+    assert calibration.splitting_ratio_ti == 0.5
+    assert calibration.visibility == calibration.visibilities.max()
+    assert _replay_visibility(amzi, electric_field) == pytest.approx(calibration.visibility, abs=1e-12)
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import pytest
+
+from LaserPy_Quantum import Laser
+from LaserPy_Quantum.SpecializedComponents.PhotonDetector import SinglePhotonDetector
+from LaserPy_Quantum.Constants import LaserPyConstants
+
+@pytest.fixture
+def restore_constants():
+    constants = LaserPyConstants.get_all()
+    yield
+    for key, value in constants.items():
+        LaserPyConstants.set(key, value)
+
+def test_set_updates_class_constants(restore_constants):
+    kappa = Laser._Kappa
+    LaserPyConstants.set('Kappa', 2 * kappa)
+    assert Laser._Kappa == 2 * kappa
+    assert Laser()._Kappa == 2 * kappa
+
+    # Shared keys of different classes
+    LaserPyConstants.set('Eta', 0.25)
+    assert Laser._Eta == 0.25
+    assert SinglePhotonDetector._Eta == 0.25
+
+def test_import_is_lazy():
+    code = ("import sys, LaserPy_Quantum; "
+            "print(any(name in sys.modules for name in ('matplotlib', 'json', 'LaserPy_Quantum.Plotting')))")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
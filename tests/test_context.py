@@ -0,0 +1,44 @@
+import gc
+import weakref
+
+from LaserPy_Quantum import ArbitaryWaveGenerator, StaticWave
+from LaserPy_Quantum import Laser
+from LaserPy_Quantum import SimulationContext
+
+def test_contexts_scope_registry_and_AWG():
+    with SimulationContext() as first:
+        first_lasers = (Laser(name="laser"), Laser(name="laser"))
+        ArbitaryWaveGenerator().set(StaticWave("modulation", 0.03))
+        with SimulationContext() as second:
+            second_laser = Laser(name="laser")
+            assert "modulation" not in ArbitaryWaveGenerator().signals
+        first_AWG = ArbitaryWaveGenerator()
+
+        assert [laser.class_id for laser in first_lasers] == [0, 1]
+        assert second_laser.class_id == 0
+        assert first.get_registry()['Laser'] == first_lasers
+        assert first_AWG is first.get_AWG()
+        assert "modulation" in first_AWG.signals
+    assert first_AWG is not ArbitaryWaveGenerator()
+    assert first.get_registry() == {} and second.get_registry() == {}
+
+def test_context_exit_releases_components():
+    with SimulationContext():
+        laser = Laser(save_simulation=True, name="laser")
+        laser.store_data()
+        laser_ref = weakref.ref(laser)
+    assert len(laser._simulation_data['photon']) == 0
+    del laser
+    gc.collect()
+    assert laser_ref() is None
+
+def test_global_registry_is_weak():
+    laser = Laser(name="unscoped_laser")
+    class_id = laser.class_id
+    assert Laser._instances[class_id] is laser
+
+    laser_ref = weakref.ref(laser)
+    del laser
+    gc.collect()
+    assert laser_ref() is None
+    assert class_id not in Laser._instances
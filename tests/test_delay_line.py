@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import AsymmetricMachZehnderInterferometer
+from LaserPy_Quantum import DelayLine
+from LaserPy_Quantum import SimulationContext
+
+DT = 1e-12
+
+def _fields(n_samples, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=n_samples) + 1j * rng.normal(size=n_samples)
+
+def _outputs(amzi):
+    return amzi._electric_field, amzi._electric_field_port2
+
+@pytest.fixture
+def shared_and_private():
+    with SimulationContext():
+        clock = Clock(DT)
+        delay_line = DelayLine(clock, name="shared_delay_line")
+        shared = (AsymmetricMachZehnderInterferometer(clock, 3.5 * DT, delay_line=delay_line, name="amzi_a"),
+                  AsymmetricMachZehnderInterferometer(clock, 2.5 * DT, delay_line=delay_line, name="amzi_b"))
+        private = (AsymmetricMachZehnderInterferometer(clock, 3.5 * DT, name="amzi_a"),
+                   AsymmetricMachZehnderInterferometer(clock, 2.5 * DT, name="amzi_b"))
+        yield clock, shared, private
+
+def _run(clock, shared, private, electric_fields):
+    for electric_field in electric_fields:
+        for shared_amzi, private_amzi in zip(shared, private):
+            shared_amzi.simulate(electric_field)
+            private_amzi.simulate(electric_field)
+            assert _outputs(shared_amzi) == pytest.approx(_outputs(private_amzi), abs=1e-15)
+
+def test_shared_retune_keeps_readers_aligned(shared_and_private):
+    clock, shared, private = shared_and_private
+    electric_fields = _fields(30)
+    _run(clock, shared, private, electric_fields[:10])
+
+    # Retune the first reader mid-run
+    for amzi in (shared[0], private[0]):
+        amzi.set(clock, 5.5 * DT)
+    _run(clock, shared, private, electric_fields[10:20])
+
+    # Shorter delays read the kept history immediately
+    for amzi in (shared[1], private[1]):
+        amzi.set(clock, 1.5 * DT)
+    _run(clock, shared, private, electric_fields[20:])
+
+def test_shared_reset_data_keeps_other_readers(shared_and_private):
+    clock, shared, private = shared_and_private
+    electric_fields = _fields(30, seed=1)
+    _run(clock, shared, private, electric_fields[:10])
+
+    for amzi in (shared[0], private[0]):
+        amzi.reset_data()
+    _run(clock, shared, private, electric_fields[10:])
+
+def test_delay_line_resize_keeps_samples():
+    with SimulationContext():
+        delay_line = DelayLine(Clock(DT), (2.5 * DT, 1.5 * DT))
+        ticks = 0
+        for electric_field in range(1, 6):
+            ticks = delay_line.push(electric_field, ticks)
+        assert (delay_line.read(0), delay_line.read(1)) == (3, 4)
+
+        # Growing keeps the last three samples, a longer tap waits for history
+        delay_line.set_tap(0, 4.5 * DT)
+        assert delay_line.read(0) is None
+        assert delay_line.read(1) == 4
+        for electric_field in range(6, 8):
+            ticks = delay_line.push(electric_field, ticks)
+        assert (delay_line.read(0), delay_line.read(1)) == (3, 6)
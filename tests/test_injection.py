@@ -0,0 +1,60 @@
+import numpy as np
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import ArbitaryWaveGenerator, StaticWave
+from LaserPy_Quantum import CurrentDriver, Laser
+from LaserPy_Quantum import OpticalCirculator
+from LaserPy_Quantum import SimulationContext
+
+MASTER_CURRENTS = (0.030, 0.034, 0.038)
+
+def _driver(name, value):
+    modulation = StaticWave(name, value)
+    ArbitaryWaveGenerator().set(modulation)
+    driver = CurrentDriver(ArbitaryWaveGenerator(), name=f"{name}_driver")
+    driver.set(modulation)
+    return driver
+
+def _slave():
+    slave = Laser(name="slave_laser")
+    slave.set_slave_Laser(True)
+    return slave
+
+def test_circulator_matches_per_master_injection():
+    with SimulationContext():
+        clock = Clock(1e-12)
+        clock.set(3e-10)
+        masters = tuple(Laser(name=f"master_laser_{idx}") for idx in range(len(MASTER_CURRENTS)))
+        slave_driver = _driver("slave_current", 0.02)
+        slave = _slave()
+        circulator = OpticalCirculator(masters, (slave_driver, slave))
+
+        # Same slave fed a tuple of per Master InjectionFields
+        reference = _slave()
+        free_running = Laser(name="free_running_laser")
+        while(clock.running):
+            for master, current in zip(masters, MASTER_CURRENTS):
+                master.simulate(clock, current)
+            slave_driver.simulate(clock)
+            circulator.simulate(clock)
+
+            injection_fields = tuple({'photon': master.photon, 'phase': master.phase, 'frequency': master._free_running_freq}
+                                     for master in masters)
+            reference.simulate(clock, slave_driver._data, injection_fields)
+            free_running.simulate(clock, slave_driver._data)
+            clock.update()
+
+        assert slave.get_state() == reference.get_state()
+        assert slave.phase != free_running.phase
+
+def test_injection_terms_sum_over_masters():
+    with SimulationContext():
+        slave = _slave()
+        master_photon = np.array([1e20, 2e20, 4e20])
+        master_phase = np.array([0.1, -0.7, 2.0])
+        master_frequency = slave._free_running_freq + np.array([0.0, 1e9, -2e9])
+
+        dS_inj, dPhi_inj = slave._injection_terms(1e-10, master_photon, master_phase, master_frequency)
+        single_terms = [slave._injection_terms(1e-10, *master) for master in zip(master_photon, master_phase, master_frequency)]
+        assert np.isclose(dS_inj, sum(terms[0] for terms in single_terms), rtol=1e-12)
+        assert np.isclose(dPhi_inj, sum(terms[1] for terms in single_terms), rtol=1e-12)
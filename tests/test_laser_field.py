@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import ArbitaryWaveGenerator, StaticWave
+from LaserPy_Quantum import CurrentDriver, Laser
+from LaserPy_Quantum import Connection, Simulator
+from LaserPy_Quantum import SimulationContext
+from LaserPy_Quantum.Constants import EMPTY_FIELD
+
+def test_field_computed_on_demand():
+    with SimulationContext():
+        clock = Clock(1e-12)
+        laser = Laser(name="laser")
+        laser.simulate(clock, 0.03)
+        assert laser._field_stale and laser._data == EMPTY_FIELD
+
+        electric_field = laser.get_field()
+        assert not laser._field_stale
+        assert electric_field == pytest.approx(np.sqrt(laser._power()) * np.exp(1j * laser.phase))
+        assert laser.get_field() is electric_field
+
+def test_field_data_matches_per_tick_field():
+    with SimulationContext():
+        clock = Clock(1e-12)
+        clock.set(2e-10)
+        laser = Laser(save_simulation=True, name="laser")
+        laser.reset(True)
+
+        fields = []
+        while(clock.running):
+            laser.simulate(clock, 0.03)
+            laser.store_data()
+            fields.append(laser.get_field())
+            clock.update()
+        assert np.array_equal(laser.get_field_data(), fields)
+        assert np.allclose(laser.get_power_data(), np.abs(fields) ** 2, rtol=1e-12, atol=0)
+
+def test_set_state_marks_field_stale():
+    with SimulationContext():
+        clock = Clock(1e-12)
+        laser = Laser(name="laser")
+        laser.simulate(clock, 0.03)
+        state, electric_field = laser.get_state(), laser.get_field()
+        laser.simulate(clock, 0.03)
+        assert laser.get_field() != electric_field
+
+        laser.set_state(state)
+        assert laser._field_stale
+        assert laser.get_field() == electric_field
+
+def test_unconsumed_field_never_computed():
+    with SimulationContext():
+        AWG = ArbitaryWaveGenerator()
+        modulation = StaticWave("modulation", 0.03)
+        AWG.set(modulation)
+        clock = Clock(1e-12)
+        clock.set(1e-10)
+        driver = CurrentDriver(AWG)
+        driver.set(modulation)
+        laser = Laser(save_simulation=True, name="laser")
+
+        simulator = Simulator(clock)
+        simulator.set((Connection(clock, driver), Connection(driver, laser)))
+        simulator.reset(True)
+        simulator.simulate()
+        assert laser._field_stale and laser._data == EMPTY_FIELD
+        assert laser.get_field() == laser.get_field_data()[-1]
@@ -0,0 +1,51 @@
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import PhysicalComponent
+from LaserPy_Quantum import Connection, DelayConnection, Simulator
+from LaserPy_Quantum import SimulationContext
+
+class Stage(PhysicalComponent):
+    def simulate(self, clock, _data=None):
+        self._data = 0.0 if(_data is None) else _data + 1.0
+
+def _simulator(t_final=1e-11):
+    clock = Clock(1e-12)
+    clock.set(t_final)
+    return Simulator(clock)
+
+def test_connections_ordered_by_dependency():
+    with SimulationContext():
+        simulator = _simulator()
+        source, middle, sink = Stage(name="source"), Stage(name="middle"), Stage(name="sink")
+        connections = (Connection(middle, sink, name="middle_sink"), Connection(source, middle, name="source_middle"),
+                       Connection(simulator.simulation_clock, source, name="clock_source"))
+        simulator.set(connections)
+        assert [connection.name for connection in simulator._connections] == ["clock_source", "source_middle", "middle_sink"]
+
+        # Every stage reads the same tick output of the one before
+        simulator.simulate()
+        assert (source._data, middle._data, sink._data) == (0.0, 1.0, 2.0)
+
+def test_delay_connection_breaks_feedback_loop(capsys):
+    with SimulationContext():
+        simulator = _simulator()
+        forward, feedback = Stage(name="forward"), Stage(name="feedback")
+        simulator.set((Connection(forward, feedback, name="forward_feedback"),
+                       DelayConnection(feedback, forward, name="feedback_forward")))
+        assert [connection.name for connection in simulator._connections] == ["feedback_forward", "forward_feedback"]
+        assert "cycle" not in capsys.readouterr().out
+
+        # Forward reads the feedback of the previous tick, the loop gains 2 per tick
+        n_steps = simulator._run_steps(5)
+        assert feedback._data == 2.0 * n_steps
+
+def test_cycle_and_duplicate_warnings(capsys):
+    with SimulationContext():
+        simulator = _simulator()
+        first, second = Stage(name="first"), Stage(name="second")
+        connections = (Connection(second, first, name="second_first"), Connection(first, second, name="first_second"))
+        simulator.set(connections)
+        assert "Connection cycle detected" in capsys.readouterr().out
+        assert simulator._connections == connections
+
+        simulator.set((Connection(simulator.simulation_clock, first), Connection(second, first)))
+        assert "simulated 2 times per tick" in capsys.readouterr().out
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import ArbitaryWaveGenerator, StaticWave
+from LaserPy_Quantum import CurrentDriver, Laser
+from LaserPy_Quantum import AsymmetricMachZehnderInterferometer
+from LaserPy_Quantum import Connection, Simulator
+from LaserPy_Quantum import LangevinNoise
+from LaserPy_Quantum.Components.Signal import NoNoise
+from LaserPy_Quantum import SimulationContext
+
+def _build_chains(save_simulation, noisy=False, n_chains=3):
+    clock = Clock(1e-12, 2e-12)
+    clock.set(5e-10)
+    connections = []
+    components = []
+    for idx in range(n_chains):
+        AWG = ArbitaryWaveGenerator()
+        modulation = StaticWave("modulation", 0.03 + 0.01 * idx)
+        AWG.set(modulation)
+        driver = CurrentDriver(AWG, name=f"driver_{idx}")
+        driver.set(modulation)
+        laser = Laser(save_simulation=save_simulation, name=f"laser_{idx}")
+        if(noisy):
+            laser.set_noise(NoNoise("carrier_NoNoise"), NoNoise("photon_NoNoise"), LangevinNoise(0, 1e-3, "phase_noise"))
+        amzi = AsymmetricMachZehnderInterferometer(clock, 5e-11, save_simulation=save_simulation, name=f"amzi_{idx}")
+        connections += [Connection(clock, driver), Connection(driver, laser), Connection(laser, amzi)]
+        components += [laser, amzi]
+
+    simulator = Simulator(clock, save_simulation=save_simulation)
+    simulator.set(tuple(connections))
+    simulator.reset(True)
+    return simulator, components
+
+def _results(simulator, components):
+    states = [component.get_state() for component in components]
+    data = [data_component.get_data() for component in components for data_component in component._get_data_components()]
+    return states, data, simulator.get_data() if(simulator._save_simulation) else None
+
+def _assert_equal_results(expected, actual):
+    for expected_state, state in zip(expected[0], actual[0]):
+        assert np.allclose(np.array(expected_state, dtype=complex), np.array(state, dtype=complex), rtol=1e-12, atol=0)
+    for expected_data, data in zip(expected[1], actual[1]):
+        assert expected_data.keys() == data.keys()
+        for key in expected_data:
+            assert np.allclose(expected_data[key], data[key], rtol=1e-12, atol=0)
+    if(expected[2] is not None):
+        assert np.array_equal(expected[2], actual[2])
+
+@pytest.mark.parametrize("save_simulation", [False, True])
+def test_parallel_matches_serial(save_simulation):
+    with SimulationContext():
+        simulator, components = _build_chains(save_simulation)
+        simulator.simulate()
+        expected = _results(simulator, components)
+
+    with SimulationContext():
+        simulator, components = _build_chains(save_simulation)
+        simulator.simulate_parallel(max_workers=3)
+        _assert_equal_results(expected, _results(simulator, components))
+
+def test_parallel_seeded_noise_is_reproducible():
+    results = []
+    for _ in range(2):
+        with SimulationContext():
+            simulator, components = _build_chains(True, noisy=True)
+            simulator.simulate_parallel(max_workers=3, seed=7)
+            results.append(_results(simulator, components))
+    _assert_equal_results(*results)
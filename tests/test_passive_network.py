@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import AsymmetricMachZehnderInterferometer
+from LaserPy_Quantum import PassiveNetwork
+from LaserPy_Quantum import SimulationContext
+
+@pytest.fixture
+def amzi_and_network():
+    with SimulationContext():
+        clock = Clock(1e-12)
+        amzi = AsymmetricMachZehnderInterferometer(clock, 50e-12)
+        amzi.set_phases(0.3, 1.2)
+        yield amzi, amzi.to_network(clock)
+
+def _fields(n_samples, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=n_samples) + 1j * rng.normal(size=n_samples)
+
+def test_amzi_network_replay(amzi_and_network):
+    amzi, network = amzi_and_network
+    assert isinstance(network, PassiveNetwork)
+    electric_field = _fields(500)
+    for amzi_port, network_port in zip(amzi.replay(electric_field), network.replay(electric_field)):
+        assert np.allclose(amzi_port, network_port, rtol=0, atol=1e-12)
+
+def test_amzi_network_per_tick(amzi_and_network):
+    amzi, network = amzi_and_network
+    for electric_field in _fields(200, seed=1):
+        amzi.simulate(electric_field)
+        network.simulate(electric_field)
+        assert amzi._electric_field == pytest.approx(network._electric_field, abs=1e-12)
+        assert amzi._electric_field_port2 == pytest.approx(network._electric_field_port2, abs=1e-12)
+
+def test_amzi_network_detector_intensity(amzi_and_network):
+    amzi, network = amzi_and_network
+    electric_field = _fields(300, seed=2)
+    amzi_detectors = amzi.replay_SPD(electric_field)
+    network_detectors = network.replay_SPD(np.stack([electric_field, 0 * electric_field]))
+    # Network detectors are named by output mode
+    for amzi_key, network_key in (('SPD0', 'SPD_1'), ('SPD1', 'SPD_0')):
+        assert np.allclose(amzi_detectors[amzi_key]['intensity'], network_detectors[network_key]['intensity'], rtol=0, atol=1e-10)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import ArbitaryWaveGenerator, PulseWave
+from LaserPy_Quantum import CurrentDriver, Laser
+from LaserPy_Quantum import Connection, Simulator
+from LaserPy_Quantum import PeriodicSteadyState
+from LaserPy_Quantum import SimulationContext
+
+PERIOD = 1e-9
+
+def _run(t_final, periodic_steady_state=None):
+    # Gain switched free running Laser, pulse edges off the Clock grid
+    AWG = ArbitaryWaveGenerator()
+    pulse = PulseWave("pulse", 0.8 * 0.0178, 2.2 * 0.0178, PERIOD, 0.5005)
+    AWG.set((pulse,))
+    driver = CurrentDriver(AWG)
+    driver.set(pulse)
+    laser = Laser(save_simulation=True, name="laser")
+
+    clock = Clock(1e-12, 5)
+    clock.set(t_final)
+    simulator = Simulator(clock)
+    simulator.set((Connection(clock, driver), Connection(driver, laser)))
+    simulator.set_periodic_steady_state(periodic_steady_state)
+    simulator.reset(True)
+    simulator.simulate()
+    return clock.t, laser.get_state(), laser.get_data()
+
+@pytest.fixture(scope="module")
+def full_run():
+    with SimulationContext():
+        return _run(40e-9)
+
+def _assert_close(expected, actual, phase_atol):
+    t, state, data = actual
+    assert t == expected[0]
+    assert state[0] == expected[1][0]
+    assert np.allclose(state[1:3], expected[1][1:3], rtol=1e-6, atol=0)
+    assert state[3] == pytest.approx(expected[1][3], abs=phase_atol)
+    for key in ('photon', 'carrier'):
+        assert np.allclose(data[key], expected[2][key], rtol=0, atol=1e-6 * np.max(expected[2][key]))
+    assert np.allclose(data['phase'], expected[2]['phase'], rtol=0, atol=phase_atol)
+
+def test_tiled_matches_full_simulation(full_run):
+    with SimulationContext():
+        periodic_steady_state = PeriodicSteadyState(PERIOD)
+        tiled_run = _run(40e-9, periodic_steady_state)
+    assert periodic_steady_state.converged
+    assert periodic_steady_state.tiled_cycles > 20
+    _assert_close(full_run, tiled_run, phase_atol=1e-6)
+
+def test_drift_bound_scales_with_tiled_cycles():
+    periodic_steady_state = PeriodicSteadyState(PERIOD, rtol=1e-6, min_cycles=3)
+    periodic_steady_state._drift_mask = np.array([False, True])
+    values = np.array([1.0, -100.0])
+    # Per period phase drift spread of 1e-7 rad over the last three periods
+    deltas = [np.array([0.0, -10.0]), np.array([0.0, -10.0 + 1e-7]), np.array([0.0, -10.0])]
+    assert periodic_steady_state._is_periodic(values, deltas, 10)
+    assert not periodic_steady_state._is_periodic(values, deltas, 10000)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import ArbitaryWaveGenerator, StaticWave
+from LaserPy_Quantum import CurrentDriver, Laser
+from LaserPy_Quantum import PhysicalComponent
+from LaserPy_Quantum import Connection, Simulator
+from LaserPy_Quantum import SimulationContext
+from LaserPy_Quantum import DOUBLE_PRECISION, MIXED_PRECISION, get_precision_policy, set_precision_policy
+from LaserPy_Quantum.Precision import trace_error_bound, field_error_bound
+from LaserPy_Quantum.SpecializedComponents import PhaseSample, BeamSplitter
+
+@pytest.fixture
+def mixed_precision():
+    set_precision_policy(MIXED_PRECISION)
+    yield MIXED_PRECISION
+    set_precision_policy(DOUBLE_PRECISION)
+
+def _laser_data():
+    with SimulationContext():
+        AWG = ArbitaryWaveGenerator()
+        modulation = StaticWave("modulation", 0.03)
+        AWG.set(modulation)
+        clock = Clock(1e-12)
+        clock.set(1e-10)
+        driver = CurrentDriver(AWG)
+        driver.set(modulation)
+        laser = Laser(save_simulation=True, name="laser")
+
+        simulator = Simulator(clock)
+        simulator.set((Connection(clock, driver), Connection(driver, laser)))
+        simulator.reset(True)
+        simulator.simulate()
+        return laser._simulation_data, laser.get_data()
+
+def test_mixed_precision_traces(mixed_precision):
+    traces, data = _laser_data()
+    assert traces['photon'].typecode == 'f'
+    assert traces['phase'].typecode == 'd'
+
+    # Integration stays in float64, only storage is rounded
+    set_precision_policy(DOUBLE_PRECISION)
+    double_traces, double_data = _laser_data()
+    assert double_traces['photon'].typecode == 'd'
+    assert np.array_equal(data['phase'], double_data['phase'])
+    assert np.allclose(data['photon'], double_data['photon'], rtol=trace_error_bound(mixed_precision), atol=0)
+
+def test_mixed_precision_replay(mixed_precision):
+    with SimulationContext():
+        rng = np.random.default_rng(0)
+        electric_field = rng.normal(size=100) + 1j * rng.normal(size=100)
+        components = (PhaseSample(0.7), BeamSplitter(0.3))
+        E_transmitted = components[1].replay(components[0].replay(electric_field))[0]
+        assert E_transmitted.dtype == np.complex64
+
+        set_precision_policy(DOUBLE_PRECISION)
+        E_double = components[1].replay(components[0].replay(electric_field))[0]
+        assert E_double.dtype == np.complex128
+        assert np.allclose(np.abs(E_transmitted) ** 2, np.abs(E_double) ** 2,
+                           rtol=field_error_bound(len(components), mixed_precision), atol=0)
+
+class FieldStage(PhysicalComponent):
+    def simulate(self, clock, _data=None):
+        # Turns complex after the first ticks
+        self._data = clock.t if(clock.t < 5e-12) else clock.t * 1j
+
+def test_complex_values_fall_back_to_lists(capsys):
+    assert get_precision_policy() is DOUBLE_PRECISION
+    with SimulationContext():
+        clock = Clock(1e-12)
+        clock.set(1e-11)
+        stage = FieldStage(save_simulation=True, name="stage")
+        simulator = Simulator(clock)
+        simulator.set((Connection(clock, stage),))
+        simulator.reset(True)
+        simulator.simulate()
+
+        assert "stores non-real ('_data',) in lists" in capsys.readouterr().out
+        assert isinstance(stage._simulation_data['_data'], list)
+        assert stage._trace_list_keys == ('_data',)
+        values = stage.get_data()['_data']
+        assert len(values) == len(simulator.get_data())
+        assert np.iscomplexobj(values) and values[0] == 0.0 and values[-1].imag > 0
+
+        # Later runs start with a list trace without warning
+        simulator.reset(True)
+        simulator.simulate()
+        assert "stores non-real" not in capsys.readouterr().out
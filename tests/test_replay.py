@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import VariableOpticalAttenuator
+from LaserPy_Quantum import AsymmetricMachZehnderInterferometer
+from LaserPy_Quantum import Laser
+from LaserPy_Quantum import SimulationContext
+from LaserPy_Quantum import replay_chain
+from LaserPy_Quantum.SpecializedComponents import PhaseSample, BeamSplitter
+from LaserPy_Quantum.SpecializedComponents import SinglePhotonDetector
+
+def _fields(n_samples, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=n_samples) + 1j * rng.normal(size=n_samples)
+
+def test_chain_replay_matches_simulate():
+    with SimulationContext():
+        components = (VariableOpticalAttenuator(3.0), PhaseSample(0.7), BeamSplitter(0.3))
+        electric_field = _fields(200)
+        replayed = replay_chain(electric_field, components)
+
+        # Per tick, the transmitted port continues down the chain
+        simulated = []
+        for sample in electric_field:
+            field = components[0].simulate(sample)
+            field = components[1].simulate(field)
+            simulated.append(components[2].simulate(field)[0])
+        assert np.allclose(replayed, simulated, rtol=0, atol=1e-12)
+
+        # Replay does not change the component state
+        assert components[2]._E_transmitted == simulated[-1]
+
+def test_beam_splitter_replay_both_ports():
+    with SimulationContext():
+        beam_splitter = BeamSplitter(0.2)
+        electric_field, electric_field_port2 = _fields(100, seed=1), _fields(100, seed=2)
+        E_transmitted, E_reflected = beam_splitter.replay(electric_field, electric_field_port2)
+        for idx in range(len(electric_field)):
+            ports = beam_splitter.simulate(electric_field[idx], electric_field_port2[idx])
+            assert ports == pytest.approx((E_transmitted[idx], E_reflected[idx]), abs=1e-12)
+
+def test_amzi_replay_matches_simulate():
+    with SimulationContext():
+        amzi = AsymmetricMachZehnderInterferometer(Clock(1e-12), 5.5e-12)
+        amzi._short_arm_phase_sample.set(0.4)
+        amzi._long_arm_phase_sample.set(1.3)
+        electric_field = _fields(300, seed=3)
+        E_port1, E_port2 = amzi.replay(electric_field)
+        detectors = amzi.replay_SPD(electric_field)
+
+        for idx, sample in enumerate(electric_field):
+            amzi.simulate(sample)
+            assert amzi._electric_field == pytest.approx(E_port1[idx], abs=1e-12)
+            assert amzi._electric_field_port2 == pytest.approx(E_port2[idx], abs=1e-12)
+            assert amzi._SPD0.intensity == pytest.approx(detectors['SPD0']['intensity'][idx], rel=1e-9)
+            assert amzi._SPD1.intensity == pytest.approx(detectors['SPD1']['intensity'][idx], rel=1e-9)
+
+def test_detector_replay_and_unsupported_component(capsys):
+    with SimulationContext():
+        detector = SinglePhotonDetector()
+        electric_field = _fields(50, seed=4)
+        intensity = detector.replay(electric_field)
+        for idx, sample in enumerate(electric_field):
+            detector.simulate(sample)
+            assert detector.intensity == pytest.approx(intensity[idx], abs=1e-12)
+
+        # Active components stop the chain
+        assert replay_chain(electric_field, (PhaseSample(0.1), Laser())) is None
+        assert "cannot replay recorded fields" in capsys.readouterr().out
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import ArbitaryWaveGenerator, StaticWave
+from LaserPy_Quantum import CurrentDriver, Laser
+from LaserPy_Quantum import AsymmetricMachZehnderInterferometer
+from LaserPy_Quantum import Connection, Simulator
+from LaserPy_Quantum import SimulationResult
+from LaserPy_Quantum import SimulationContext
+
+@pytest.fixture
+def result():
+    time_data = np.arange(5) * 1e-12
+    columns = {'laser_0.photon': [1.0, 2.0, 3.0, 4.0, 5.0], 'amzi_0.field': [1j, 2 + 0j, 3j, 4 + 0j, 5j],
+               'laser_0.phase': np.linspace(0, 1, 5), 'spd_0.intensity': [0.5, 0.25]}
+    return SimulationResult(time_data, columns, {'laser_0.photon': " $(m^{-3})$"})
+
+def test_columns_are_read_only_views(result):
+    float_keys, float_buffer = result.to_numpy()
+    complex_keys, complex_buffer = result.to_numpy(complex_columns=True)
+    assert float_keys == ('laser_0.photon', 'laser_0.phase', 'spd_0.intensity')
+    assert complex_keys == ('amzi_0.field',)
+    assert result.keys() == ('time', 'laser_0.photon', 'amzi_0.field', 'laser_0.phase', 'spd_0.intensity')
+
+    for key, column in result.to_dict().items():
+        if(key != 'time'):
+            assert np.shares_memory(column, complex_buffer if(key in complex_keys) else float_buffer)
+    with pytest.raises(ValueError):
+        result['laser_0.photon'][0] = 0.0
+
+def test_short_columns_right_aligned(result):
+    intensity = result['spd_0.intensity']
+    assert np.isnan(intensity[:3]).all()
+    assert np.array_equal(intensity[3:], [0.5, 0.25])
+    assert result.select('laser_0').keys() == {'photon', 'phase'}
+    assert result.get_units()['laser_0.photon'] == " $(m^{-3})$"
+
+def test_pandas_export_shares_float_buffer(result):
+    pytest.importorskip("pandas")
+    frame = result.to_pandas()
+    assert list(frame.columns) == list(result.keys()[1:])
+    assert np.shares_memory(frame['laser_0.photon'].to_numpy(), result.to_numpy()[1])
+    assert np.array_equal(frame['amzi_0.field'].to_numpy(), result['amzi_0.field'])
+
+def test_arrow_export_shares_float_buffer(result):
+    pytest.importorskip("pyarrow")
+    table = result.to_arrow()
+    assert 'amzi_0.field.real' in table.column_names and 'amzi_0.field.imag' in table.column_names
+    assert np.array_equal(table['amzi_0.field.imag'].to_numpy(), result['amzi_0.field'].imag)
+    assert np.shares_memory(table['laser_0.phase'].to_numpy(), result.to_numpy()[1])
+
+def test_result_from_simulator():
+    with SimulationContext():
+        AWG = ArbitaryWaveGenerator()
+        modulation = StaticWave("modulation", 0.03)
+        AWG.set(modulation)
+        clock = Clock(1e-12, 2e-12)
+        clock.set(2e-10)
+        driver = CurrentDriver(AWG)
+        driver.set(modulation)
+        laser = Laser(name="laser")
+        amzi = AsymmetricMachZehnderInterferometer(clock, 5e-11)
+
+        simulator = Simulator(clock)
+        simulator.set((Connection(clock, driver), Connection(driver, laser), Connection(laser, amzi)))
+        simulator.reset(True)
+        simulator.simulate()
+        result = simulator.get_result()
+
+        assert np.array_equal(result.time, simulator.get_data())
+        for key, values in laser.get_data().items():
+            assert np.array_equal(result[laser._column_name(key)], values)
+        assert np.array_equal(result[amzi._SPD1._column_name('intensity')], amzi._SPD1.get_data()['intensity'])
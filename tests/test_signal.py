@@ -0,0 +1,23 @@
+import numpy as np
+
+from LaserPy_Quantum import AlternatingPulseWave
+
+T_UNIT = 10e-12
+
+def _grid(n_steps, dt=1e-12):
+    # Clock times accumulate like Clock update
+    return np.add.accumulate(np.r_[0.0, np.full(n_steps - 1, dt)])
+
+def test_alternating_pulse_wave_first_period_low():
+    wave = AlternatingPulseWave("alternating", 1.0, 0.5, T_UNIT, 0.5)
+    pulse_centres = (np.arange(4) + 0.5) * T_UNIT
+    assert [wave(t) for t in pulse_centres] == [0.5, 1.5, 0.5, 1.5]
+
+def test_alternating_pulse_wave_call_matches_samples():
+    wave = AlternatingPulseWave("alternating", 1.0, 0.5, T_UNIT, 0.5)
+    t = _grid(200)
+    samples = wave.samples(t)
+    assert np.array_equal(samples, [wave(t_k) for t_k in t])
+
+    # Pure function of t, independent of call order
+    assert np.array_equal(samples[::-1], [wave(t_k) for t_k in t[::-1]])
@@ -0,0 +1,119 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import PhysicalComponent
+from LaserPy_Quantum import ArbitaryWaveGenerator, StaticWave
+from LaserPy_Quantum import CurrentDriver, Laser
+from LaserPy_Quantum import AsymmetricMachZehnderInterferometer
+from LaserPy_Quantum import Connection, Simulator
+from LaserPy_Quantum import SimulationContext
+
+def _build_simulator(t_final=2e-9):
+    AWG = ArbitaryWaveGenerator()
+    modulation = StaticWave("modulation", 0.03)
+    AWG.set(modulation)
+
+    clock = Clock(1e-12, 2e-12)
+    clock.set(t_final)
+    driver = CurrentDriver(AWG)
+    driver.set(modulation)
+    laser = Laser(name="laser")
+    amzi = AsymmetricMachZehnderInterferometer(clock, 5e-11, save_simulation=True)
+
+    simulator = Simulator(clock)
+    simulator.set((Connection(clock, driver), Connection(driver, laser), Connection(laser, amzi)))
+    simulator.reset(True)
+    return simulator
+
+class FailingComponent(PhysicalComponent):
+    def simulate(self, clock, _data=None):
+        if(clock.t > 1e-11):
+            raise KeyError("failing_component")
+
+def _failing_simulator(raise_on_error):
+    clock = Clock(1e-12)
+    clock.set(1e-10)
+    simulator = Simulator(clock, raise_on_error=raise_on_error)
+    simulator.set((Connection(clock, FailingComponent()),))
+    return simulator
+
+def test_simulate_records_error():
+    with SimulationContext():
+        simulator = _failing_simulator(raise_on_error=False)
+        simulator.simulate()
+    assert isinstance(simulator.simulation_error, KeyError)
+
+def test_simulate_raise_on_error():
+    with SimulationContext():
+        simulator = _failing_simulator(raise_on_error=True)
+        with pytest.raises(KeyError):
+            simulator.simulate()
+    assert isinstance(simulator.simulation_error, KeyError)
+
+@pytest.mark.parametrize("n_steps", [100, 700])
+def test_cancel_between_chunks(n_steps):
+    with SimulationContext():
+        simulator = _build_simulator()
+        chunks = []
+        for chunk in simulator.iter_chunks(n_steps):
+            chunks.append(chunk)
+            if(len(chunks) == 2):
+                simulator.cancel()
+        assert simulator.cancelled
+        assert len(chunks) == 2
+        assert simulator.simulation_clock.running
+
+def test_cancel_before_run_is_cleared():
+    with SimulationContext():
+        simulator = _build_simulator()
+        simulator.cancel()
+        simulator.simulate()
+        assert not simulator.cancelled
+        assert not simulator.simulation_clock.running
+
+def test_progress_reports():
+    reports = []
+    with SimulationContext():
+        simulator = _build_simulator()
+        simulator.set_progress(reports.append, every_steps=500)
+        simulator.simulate()
+    assert [report.step for report in reports[:-1]] == [500, 1000, 1500, 2000]
+    assert reports[-1].fraction == pytest.approx(1.0)
+
+@pytest.fixture
+def full_result():
+    with SimulationContext():
+        simulator = _build_simulator()
+        simulator.simulate()
+        return simulator.get_result()
+
+@pytest.mark.parametrize("n_steps", [1, 300, 1024, 5000])
+def test_chunked_matches_full_simulate(full_result, n_steps):
+    with SimulationContext():
+        simulator = _build_simulator()
+        chunks = list(simulator.iter_chunks(n_steps))
+    assert simulator.simulation_error is None
+    assert sum(len(chunk) for chunk in chunks) == len(full_result)
+    for key in full_result.keys():
+        assert np.array_equal(np.concatenate([chunk[key] for chunk in chunks]), full_result[key])
+
+def test_chunked_keep_data_matches_full_simulate(full_result):
+    with SimulationContext():
+        simulator = _build_simulator()
+        for _ in simulator.iter_chunks(700, keep_data=True):
+            pass
+        result = simulator.get_result()
+    for key in full_result.keys():
+        assert np.array_equal(result[key], full_result[key])
+
+def test_async_chunks_match_full_simulate(full_result):
+    async def collect(simulator):
+        return [chunk async for chunk in simulator.aiter_chunks(500)]
+
+    with SimulationContext():
+        simulator = _build_simulator()
+        chunks = asyncio.run(collect(simulator))
+    assert np.array_equal(np.concatenate([chunk.time for chunk in chunks]), full_result.time)
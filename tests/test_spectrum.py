@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum.Analysis import SpectrumEstimator
+from LaserPy_Quantum.Analysis import linewidth
+
+def _welch_reference(data, dt, nperseg, step):
+    """one segment at a time Welch PSD with a periodic Hann window"""
+    window = np.hanning(nperseg + 1)[:-1]
+    segments = [data[start:start + nperseg] for start in range(0, len(data) - nperseg + 1, step)]
+    psd = np.mean([np.abs(np.fft.rfft((segment - segment.mean()) * window))**2 for segment in segments], axis=0)
+    psd *= dt / np.square(window).sum()
+    psd[1:(nperseg + 1) // 2] *= 2
+    return np.fft.rfftfreq(nperseg, dt), psd
+
+def test_welch_psd_matches_reference():
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=20000) + np.sin(2 * np.pi * 0.05 * np.arange(20000))
+    freqs, psd, _ = SpectrumEstimator(1e-12, nperseg=512, overlap=0.5).psd(data)
+    ref_freqs, ref_psd = _welch_reference(data, 1e-12, 512, 256)
+    assert np.allclose(freqs, ref_freqs)
+    assert np.allclose(psd, ref_psd, rtol=1e-10)
+
+def test_welch_psd_chunked_input():
+    data = np.random.default_rng(1).normal(size=30000)
+    estimator = SpectrumEstimator(1e-12, nperseg=1024)
+    _, psd, _ = estimator.psd(data)
+    _, chunked_psd, _ = estimator.psd(np.array_split(data, 17))
+    assert np.allclose(psd, chunked_psd, rtol=1e-12)
+
+def test_welch_psd_white_noise_level():
+    # One-sided white noise level is 2 sigma^2 dt
+    dt = 1e-12
+    data = np.random.default_rng(2).normal(scale=3.0, size=1 << 18)
+    _, psd, _ = SpectrumEstimator(dt, nperseg=1024).psd(data)
+    assert np.mean(psd[1:-1]) == pytest.approx(2 * 9.0 * dt, rel=0.02)
+
+def test_welch_psd_matches_scipy():
+    signal = pytest.importorskip("scipy.signal")
+    data = np.random.default_rng(3).normal(size=10000)
+    freqs, psd, _ = SpectrumEstimator(1e-12, nperseg=256).psd(data)
+    ref_freqs, ref_psd = signal.welch(data, fs=1e12, nperseg=256, noverlap=128)
+    assert np.allclose(freqs, ref_freqs)
+    assert np.allclose(psd, ref_psd)
+
+def test_linewidth_of_phase_random_walk():
+    # White frequency noise, Lorentzian linewidth sigma^2 / (2 pi dt)
+    dt, sigma = 1e-12, 1e-3
+    phase = np.cumsum(np.random.default_rng(4).normal(scale=sigma, size=1 << 18))
+    assert linewidth(phase, dt) == pytest.approx(sigma**2 / (2 * np.pi * dt), rel=0.05)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import ArbitaryWaveGenerator, StaticWave, PulseWave
+from LaserPy_Quantum import CurrentDriver, Laser
+from LaserPy_Quantum import Connection, Simulator
+from LaserPy_Quantum import SimulationContext
+from LaserPy_Quantum import estimate_time_step, check_convergence
+from LaserPy_Quantum.Analysis.Stability import laser_steady_state, stability_limit, waveform_bandwidth
+
+CURRENT = 0.03
+
+def factory(dt, current=CURRENT):
+    AWG = ArbitaryWaveGenerator()
+    modulation = StaticWave("modulation", current)
+    AWG.set(modulation)
+    clock = Clock(dt)
+    driver = CurrentDriver(AWG)
+    driver.set(modulation)
+    laser = Laser(save_simulation=True, name="laser")
+
+    simulator = Simulator(clock, save_simulation=True)
+    simulator.set((Connection(clock, driver), Connection(driver, laser)))
+    simulator.reset(True)
+    return simulator
+
+def test_stability_limit_of_real_eigenvalue():
+    # Euler and Heun are stable up to dt = 2 / a, RK4 up to 2.785 / a
+    assert stability_limit([-1e9], "euler") == pytest.approx(2e-9, rel=1e-9)
+    assert stability_limit([-1e9], "heun") == pytest.approx(2e-9, rel=1e-9)
+    assert stability_limit([-1e9], "rk4") == pytest.approx(2.785e-9, rel=1e-3)
+    assert stability_limit([0.0, 1e9]) == float('inf')
+
+def test_steady_state_matches_long_run():
+    estimate = estimate_time_step(CURRENT)
+    carrier, photon = laser_steady_state(CURRENT)
+    with SimulationContext():
+        simulator = factory(estimate.dt)
+        simulator.simulation_clock.set(10e-9)
+        simulator.simulate()
+        result = simulator.get_result()
+    assert result['laser_0.photon'][-1] == pytest.approx(photon, rel=1e-6)
+    assert result['laser_0.carrier'][-1] == pytest.approx(carrier, rel=1e-6)
+
+def test_estimate_limits():
+    estimate = estimate_time_step(CURRENT)
+    assert estimate.limited_by == "relaxation oscillation"
+    assert estimate.dt == estimate.dt_accurate <= 0.5 * estimate.dt_stable
+    assert estimate.dt_accurate == pytest.approx(1 / (100 * estimate.relaxation_frequency))
+    assert (estimate.eigenvalues.real <= 0).all()
+
+    # 20 ps pulses are faster than the relaxation oscillation
+    bandwidth = waveform_bandwidth(PulseWave("pulse", 0.02, 0.03, 1e-10, 0.2))
+    assert bandwidth == pytest.approx(1 / 20e-12)
+    assert estimate_time_step(CURRENT, bandwidth).limited_by == "drive bandwidth"
+    assert estimate_time_step(CURRENT, bandwidth, points_per_period=1.0).limited_by == "stability"
+
+def test_convergence_of_estimated_step():
+    estimate = estimate_time_step(CURRENT)
+    report = check_convergence(factory, estimate.dt, 2e-9, keys=('laser_0.photon',))
+    assert report.converged and report.worst_key == 'laser_0.photon'
+
+    # Euler error halves with the step
+    finer_report = check_convergence(factory, estimate.dt / 4, 2e-9, keys=('laser_0.photon',))
+    assert finer_report.worst_error < report.worst_error / 2
+
+    coarse_report = check_convergence(factory, 50 * estimate.dt_stable, 2e-9)
+    assert not coarse_report.converged
@@ -0,0 +1,70 @@
+import sys
+
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import ArbitaryWaveGenerator, StaticWave
+from LaserPy_Quantum import CurrentDriver, Laser
+from LaserPy_Quantum import VariableOpticalAttenuator
+from LaserPy_Quantum import Connection, Simulator
+from LaserPy_Quantum import SimulationContext
+from LaserPy_Quantum.SpecializedComponents import BeamSplitter, PhaseSample
+from LaserPy_Quantum.SpecializedComponents.PhotonDetector import SinglePhotonDetector
+from LaserPy_Quantum.Components.Component import _instance_attributes
+
+class DictState:
+    def __init__(self, attributes):
+        self.__dict__.update(attributes)
+
+@pytest.fixture
+def hot_components():
+    with SimulationContext():
+        yield (Laser(), CurrentDriver(ArbitaryWaveGenerator()), PhaseSample(), BeamSplitter(), 
+               VariableOpticalAttenuator(), SinglePhotonDetector(), Clock(1e-12))
+
+def test_hot_components_have_no_instance_dict(hot_components):
+    for component in hot_components:
+        assert not hasattr(component, '__dict__'), type(component).__name__
+        with pytest.raises(AttributeError):
+            component.undeclared_attribute = 0.0
+
+def test_slotted_instances_are_smaller(hot_components):
+    for component in hot_components:
+        dict_state = DictState(_instance_attributes(component))
+        assert sys.getsizeof(component) < sys.getsizeof(dict_state) + sys.getsizeof(dict_state.__dict__)
+
+def test_user_subclass_keeps_instance_dict():
+    class TaggedLaser(Laser):
+        pass
+
+    with SimulationContext():
+        laser = TaggedLaser()
+        laser.tag = "master"
+        assert laser.tag == "master" and laser.photon == Laser().photon
+
+def test_snapshot_restore_round_trip():
+    with SimulationContext():
+        AWG = ArbitaryWaveGenerator()
+        modulation = StaticWave("modulation", 0.03)
+        AWG.set(modulation)
+        clock = Clock(1e-12)
+        clock.set(1e-9)
+        driver = CurrentDriver(AWG)
+        driver.set(modulation)
+        laser = Laser(name="laser")
+        simulator = Simulator(clock)
+        simulator.set((Connection(clock, driver), Connection(driver, laser)))
+        simulator.reset(True)
+
+        simulator._run_steps(300)
+        state = simulator.snapshot_state()
+        assert f"laser_{laser.class_id}.photon" in state.dtype.names
+        simulator._run_steps(200)
+        photon = laser.photon
+
+        simulator.restore_state(state)
+        assert clock.t == state[f"{clock.name}_{clock.class_id}.t"]
+        simulator._run_steps(200)
+        assert laser.photon == photon
+        assert np.array_equal(simulator.snapshot_state(), simulator.snapshot_state())
@@ -0,0 +1,75 @@
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from LaserPy_Quantum import Clock
+from LaserPy_Quantum import ArbitaryWaveGenerator, StaticWave
+from LaserPy_Quantum import CurrentDriver, Laser
+from LaserPy_Quantum import Connection, Simulator
+from LaserPy_Quantum.Sweep import SweepTask, FileBroker, SweepRunner, run_file_worker
+
+POINTS = [{'current': 0.02}, {'current': 0.025}, {'current': 0.02, 'fail': True}]
+
+def factory(current, fail=False):
+    if(fail):
+        raise RuntimeError("failing point")
+    AWG = ArbitaryWaveGenerator()
+    modulation = StaticWave("modulation", current)
+    AWG.set(modulation)
+    driver = CurrentDriver(AWG)
+    driver.set(modulation)
+    laser = Laser(save_simulation=True, name="laser")
+
+    clock = Clock(1e-12)
+    clock.set(1e-10)
+    simulator = Simulator(clock, save_simulation=True)
+    simulator.set((Connection(clock, driver), Connection(driver, laser)))
+    simulator.reset(True)
+    return simulator
+
+def _check_store(store):
+    index = store.get_index()
+    assert [index[task_id]['status'] for task_id in range(len(POINTS))] == ["done", "done", "failed"]
+    assert "failing point" in index[2]['error']
+    photon = store.get_column('laser_0.photon')
+    assert photon[1][-1] > photon[0][-1]
+
+def test_runner_retries_failed_points(capsys):
+    store = SweepRunner(factory, max_retries=1).run(POINTS)
+    _check_store(store)
+    assert capsys.readouterr().out.count("retrying point 2") == 1
+
+def test_file_broker_with_worker(tmp_path):
+    directory = str(tmp_path)
+    worker = threading.Thread(target=run_file_worker, args=(directory, 0.01, 1.0, 0.05), daemon=True)
+    worker.start()
+    runner = SweepRunner(factory, FileBroker(directory, poll_interval=0.01, timeout=30.0), max_retries=1)
+    _check_store(runner.run(POINTS))
+    worker.join()
+
+    # Same columns as in process points
+    in_process = SweepRunner(factory, max_retries=0).run(POINTS[:1])
+    assert np.array_equal(runner.store.load(0)['laser_0.photon'], in_process.load(0)['laser_0.photon'])
+
+def test_file_broker_requeues_expired_claims(tmp_path):
+    broker = FileBroker(str(tmp_path), lease_timeout=1.0)
+    broker.submit(SweepTask(0, factory, POINTS[0], 0))
+
+    # Claim of a dead worker without heartbeat
+    claimed = os.path.join(str(tmp_path), "claimed", "0_0.dead_worker.pkl")
+    os.rename(os.path.join(str(tmp_path), "tasks", "0_0.pkl"), claimed)
+    os.utime(claimed)
+    broker._requeue_stale_claims()
+    assert os.path.exists(claimed)
+
+    os.utime(claimed, (0, 0))
+    broker._requeue_stale_claims()
+    assert os.listdir(os.path.join(str(tmp_path), "tasks")) == ["0_0.pkl"]
+
+def test_file_broker_timeout(tmp_path):
+    broker = FileBroker(str(tmp_path), poll_interval=0.01, timeout=0.05)
+    broker.submit(SweepTask(0, factory, POINTS[0], 0))
+    with pytest.raises(TimeoutError):
+        list(broker.results())
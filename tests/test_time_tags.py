@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from LaserPy_Quantum.Analysis import coincidences, correlation_histogram
+
+def _random_tags(seed, n_tags=2000, span=10**6):
+    return np.sort(np.random.default_rng(seed).integers(0, span, n_tags))
+
+@pytest.mark.parametrize("window, delay", [(0, 0), (2, 3), (50, -20), (1000, 0)])
+def test_coincidences_brute_force(window, delay):
+    a, b = _random_tags(4), _random_tags(5)
+    brute_force = int((np.abs(b[None, :] - a[:, None] - delay) <= window).sum())
+    assert coincidences(a, b, window, delay) == brute_force
+
+@pytest.mark.parametrize("bin_width, max_delay", [(100, 1000), (101, 1000), (7, 50), (1, 5)])
+def test_correlation_histogram_brute_force(bin_width, max_delay):
+    a, b = _random_tags(6), _random_tags(7)
+    delays, counts = correlation_histogram(a, b, bin_width, max_delay)
+    assert delays[0] == -delays[-1] and abs(delays[-1]) <= max_delay
+
+    # Every bin complete, edge bins included
+    pair_delays = (b[None, :] - a[:, None]).ravel()
+    low = delays[0] - bin_width // 2
+    brute_force = [((pair_delays >= low + k * bin_width) & (pair_delays < low + (k + 1) * bin_width)).sum()
+                   for k in range(len(delays))]
+    assert np.array_equal(counts, brute_force)